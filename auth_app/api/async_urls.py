@@ -0,0 +1,7 @@
+from django.urls import path
+
+from auth_app.api.async_views import login
+
+urlpatterns = [
+    path("login/", login, name="async-login"),
+]
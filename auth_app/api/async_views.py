@@ -0,0 +1,37 @@
+from rest_framework import serializers
+from rest_framework.authtoken.models import Token
+from rest_framework.settings import api_settings
+
+from auth_app.api.authenticate_user import aauthenticate_user
+from auth_app.api.serializers import CredentialsSerializer
+from auth_app.models import UserProfile
+from core.async_api import async_api_view
+
+
+@async_api_view(methods=("POST",), authenticated=False)
+async def login(request):
+    """
+    Async variant of LoginView.
+
+    The password is checked on the password hashing pool while the
+    event loop keeps serving other requests, instead of blocking a
+    worker thread for the whole hash.
+    """
+    credentials = CredentialsSerializer(data=request.data)
+    credentials.is_valid(raise_exception=True)
+    try:
+        user = await aauthenticate_user(credentials.validated_data)
+    except serializers.ValidationError as exc:
+        # LoginSerializer raises it from validate(), which reports it
+        # as a non-field error.
+        raise serializers.ValidationError(
+            {api_settings.NON_FIELD_ERRORS_KEY: exc.detail}
+        )
+    profile = await UserProfile.objects.filter(user=user).afirst()
+    token, _ = await Token.objects.aget_or_create(user=user)
+    return {
+        "token": token.key,
+        "fullname": profile.fullname if profile else "",
+        "email": user.email,
+        "user_id": user.pk,
+    }
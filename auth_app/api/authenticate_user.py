@@ -1,10 +1,15 @@
 from typing import Iterable
 
-from django.contrib.auth import authenticate
 from django.contrib.auth.models import User
 from rest_framework import serializers
 
 from auth_app.api.dicts import LoginUserDict, RegistrationUserDict
+from auth_app.hashing import (
+    ahash_password,
+    averify_password,
+    hash_password,
+    verify_password,
+)
 from core.helpers import split_fullname
 
 
@@ -21,15 +26,25 @@ def clean_up_data(data, keys: Iterable[str]) -> None:
         data.pop(key, None)
 
 
-def save_user(data: RegistrationUserDict):
+def new_user(email: str, fullname: str, encoded_password: str) -> User:
     """
-    Create and save a new User instance from registration data.
+    Return an unsaved User with the email as username, the first and
+    last name split from the full name and an already hashed password.
+    """
+    user = User(email=email, username=email, password=encoded_password)
+    user.first_name, user.last_name = split_fullname(fullname)
+    return user
+
+
+def build_user(data: RegistrationUserDict) -> User:
+    """
+    Build a new, unsaved User instance from registration data.
 
     Extracts the password, email, and full name from the
-    registration dictionary. Removes redundant items from the
-    dictionary, constructs the User object, and sets its password.
-    Also splits the full name into first and last name fields
-    before saving and returns the created User.
+    registration dictionary and removes redundant items from the
+    dictionary. The password is hashed on the password hashing pool
+    before the caller opens its transaction, so no write lock is
+    held while hashing.
     """
     pw = data["password"]
     email = data["email"]
@@ -40,27 +55,41 @@ def save_user(data: RegistrationUserDict):
         ["password", "repeated_password", "email"],
     )
 
-    user = User(email=email, username=email)
-    user.set_password(pw)
-    user.first_name, user.last_name = split_fullname(fullname)
-    user.save()
-
-    return user
+    return new_user(email, fullname, hash_password(pw))
 
 
 def authenticate_user(attrs: LoginUserDict):
     """
     Authenticate a user based on provided login credentials.
 
-    Given a dictionary with email and password, attempts to
-    authenticate the user using Django's authentication system.
-    Raises a validation error when credentials are invalid,
-    otherwise returns the authenticated User instance.
+    Given a dictionary with email and password, looks up the user
+    like Django's ModelBackend and checks the password on the
+    password hashing pool. Unknown emails are hashed as well, so they
+    take as long as wrong passwords. Raises a validation error when
+    credentials are invalid, otherwise returns the authenticated User
+    instance.
     """
     email = attrs.get("email")
     password = attrs.get("password")
 
-    user = authenticate(username=email, password=password)
-    if not user:
-        raise serializers.ValidationError("Invalid email or password")
-    return user
+    user = User.objects.filter(username=email).first()
+    if user is None:
+        hash_password(password)
+    elif verify_password(user, password) and user.is_active:
+        return user
+    raise serializers.ValidationError("Invalid email or password")
+
+
+async def aauthenticate_user(attrs: LoginUserDict):
+    """
+    Async variant of authenticate_user.
+    """
+    email = attrs.get("email")
+    password = attrs.get("password")
+
+    user = await User.objects.filter(username=email).afirst()
+    if user is None:
+        await ahash_password(password)
+    elif await averify_password(user, password) and user.is_active:
+        return user
+    raise serializers.ValidationError("Invalid email or password")
@@ -1,3 +1,4 @@
+from asgiref.sync import sync_to_async
 from django.contrib.auth.models import User
 
 from auth_app.api.serializers import EmailQuerySerializer
@@ -8,16 +9,45 @@ def getProfileForUser(user: User):
     """
     Retrieve the UserProfile associated with the given User.
 
-    Attempts to fetch the UserProfile object linked to the
-    provided User. If no profile exists, the function returns
-    None instead of raising a DoesNotExist exception.
+    Uses the reverse one-to-one accessor, so a profile that was
+    already loaded with the user (e.g. by CachedTokenAuthentication)
+    is returned without a query. If no profile exists, the function
+    returns None instead of raising a DoesNotExist exception.
     """
+    if not user.is_authenticated:
+        return None
     try:
-        return UserProfile.objects.get(user=user)
+        return user.userprofile  # type: ignore
     except UserProfile.DoesNotExist:
         return None
 
 
+async def agetProfileForUser(user: User):
+    """
+    Async variant of getProfileForUser for async views.
+
+    Reading the reverse relation may query the database, so it runs
+    in a thread. Authentication classes that load the profile with
+    the user only cost the thread switch.
+    """
+    return await sync_to_async(getProfileForUser)(user)
+
+
+def getProfileForRequest(request):
+    """
+    Retrieve the UserProfile of the authenticated user of a request.
+
+    The profile is resolved at most once per request and stored on
+    the underlying HttpRequest, so views, serializers and defaults
+    handling the same request share a single lookup. Returns None
+    for anonymous users or users without a profile.
+    """
+    http_request = getattr(request, "_request", request)
+    if not hasattr(http_request, "_cached_profile"):
+        http_request._cached_profile = getProfileForUser(request.user)
+    return http_request._cached_profile
+
+
 def getValidEmail(params) -> str:
     """
     Extract and validate an email address from the given params.
@@ -44,5 +74,4 @@ class CurrentUserProfileDefault:
     requires_context = True
 
     def __call__(self, serializer_field):
-        user = serializer_field.context["request"].user
-        return UserProfile.objects.get(user=user)
+        return getProfileForRequest(serializer_field.context["request"])
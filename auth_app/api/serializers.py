@@ -1,9 +1,9 @@
 from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
 from rest_framework.authtoken.models import Token
-from rest_framework.validators import UniqueValidator
 
-from auth_app.api.authenticate_user import authenticate_user, save_user
+from auth_app.api.authenticate_user import authenticate_user, build_user
 from auth_app.models import UserProfile
 
 
@@ -25,7 +25,17 @@ class UserProfileSerializer(serializers.ModelSerializer):
         return obj.user.email
 
 
-class LoginSerializer(serializers.Serializer):
+class CredentialsSerializer(serializers.Serializer):
+    """
+    Serializer validating the email and password fields of a login,
+    without authenticating the user.
+    """
+
+    email = serializers.EmailField()
+    password = serializers.CharField(write_only=True)
+
+
+class LoginSerializer(CredentialsSerializer):
     """
     Serializer for handling user login input and validation.
 
@@ -34,8 +44,6 @@ class LoginSerializer(serializers.Serializer):
     and their full name to the validated data.
     """
 
-    email = serializers.EmailField()
-    password = serializers.CharField(write_only=True)
     fullname = serializers.CharField(read_only=True)
 
     def validate(self, attrs):
@@ -51,23 +59,16 @@ class RegistrationSerializer(serializers.ModelSerializer):
     """
     Serializer for registering a new user.
 
-    Handles incoming registration data, enforces email
-    uniqueness, matches password fields, and creates the User
-    along with a related UserProfile. Returns a token and
-    profile information on output.
+    Handles incoming registration data, matches password fields, and
+    creates the User along with a related UserProfile and token in
+    one transaction. Email uniqueness is enforced by the unique
+    username the email is stored in, without a separate query.
+    Returns a token and profile information on output.
     """
 
     fullname = serializers.CharField(max_length=150, write_only=True)
     repeated_password = serializers.CharField(max_length=100, write_only=True)
-    email = serializers.EmailField(
-        required=True,
-        validators=[
-            UniqueValidator(
-                queryset=User.objects.all(),
-                message="Email already exists",
-            )
-        ],
-    )
+    email = serializers.EmailField(required=True)
 
     class Meta:
         model = User
@@ -87,10 +88,23 @@ class RegistrationSerializer(serializers.ModelSerializer):
         return attrs
 
     def create(self, validated_data):
-        user = save_user(validated_data)
-
+        user = build_user(validated_data)
         fullname = validated_data.pop("fullname")
-        UserProfile.objects.create(user=user, fullname=fullname)
+
+        try:
+            with transaction.atomic():
+                user.save()
+                # Inserted without signals: the user's post_save already
+                # refreshes the caches once the transaction commits, and
+                # a new user has no cached tokens to drop.
+                UserProfile.objects.bulk_create(
+                    [UserProfile(user=user, fullname=fullname)]
+                )
+                Token.objects.create(user=user)
+        except IntegrityError:
+            raise serializers.ValidationError(
+                {"email": ["Email already exists"]}
+            )
 
         return user
 
@@ -98,14 +112,14 @@ class RegistrationSerializer(serializers.ModelSerializer):
         """
         Customize serialization output after user creation.
 
-        Includes an authentication token, the user's full name,
-        email, and user ID in the returned data.
+        Includes the authentication token, the user's full name,
+        email, and user ID in the returned data. The profile and token
+        created with the user are cached on it, so no query is made.
         """
         profile = getattr(instance, "userprofile", None)
         fullname = profile.fullname if profile else ""
-        token = Token.objects.create(user=instance)
         return {
-            "token": token.key,
+            "token": instance.auth_token.key,
             "fullname": fullname,
             "email": instance.email,
             "user_id": instance.id,
@@ -121,3 +135,15 @@ class EmailQuerySerializer(serializers.Serializer):
     """
 
     email = serializers.EmailField(required=True)
+
+
+class AutocompleteQuerySerializer(serializers.Serializer):
+    """
+    Serializer for validating user autocomplete query parameters.
+
+    `q` is the prefix of an email or of a word of a full name, `limit`
+    the maximum number of users returned.
+    """
+
+    q = serializers.CharField(max_length=254)
+    limit = serializers.IntegerField(min_value=1, max_value=50, default=10)
@@ -1,6 +1,11 @@
 from django.urls import URLPattern, path
 
-from .views import EmailCheckView, LoginView, RegistrationView
+from .views import (
+    EmailCheckView,
+    LoginView,
+    RegistrationView,
+    UserAutocompleteView,
+)
 
 urlpatterns: list[URLPattern] = [
     path("registration/", RegistrationView.as_view(), name="registration"),
@@ -10,4 +15,9 @@ urlpatterns: list[URLPattern] = [
         name="login",
     ),
     path("email-check/", EmailCheckView.as_view(), name="email-check"),
+    path(
+        "users/autocomplete/",
+        UserAutocompleteView.as_view(),
+        name="user-autocomplete",
+    ),
 ]
@@ -1,12 +1,17 @@
-from django.contrib.auth.models import User
 from rest_framework import generics
 from rest_framework.authtoken.models import Token
 from rest_framework.authtoken.views import ObtainAuthToken
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from auth_app.api.helpers import getProfileForUser, getValidEmail
-from auth_app.api.serializers import LoginSerializer, RegistrationSerializer
+from auth_app.api.helpers import getValidEmail
+from auth_app.api.serializers import (
+    AutocompleteQuerySerializer,
+    LoginSerializer,
+    RegistrationSerializer,
+)
+from auth_app.autocomplete import user_autocomplete
+from auth_app.email_check import find_member
 
 
 class RegistrationView(generics.CreateAPIView):
@@ -14,7 +19,9 @@ class RegistrationView(generics.CreateAPIView):
     API view for registering a new user.
 
     Uses the RegistrationSerializer to handle incoming POST requests
-    with registration details and create a new user and profile.
+    with registration details and create a new user and profile. The
+    password is hashed on the password hashing pool, which answers
+    with 503 while it is saturated.
     """
 
     permission_classes = []
@@ -27,6 +34,8 @@ class LoginView(ObtainAuthToken):
 
     Accepts login credentials via POST, validates them using the
     LoginSerializer, and returns an auth token along with user info.
+    The password is checked on the password hashing pool, which
+    answers with 503 while it is saturated.
     """
 
     serializer_class = LoginSerializer
@@ -61,33 +70,51 @@ class EmailCheckView(generics.RetrieveAPIView):
     API view to check if a user exists by email.
 
     Requires the request to be authenticated. Looks up a User by
-    validated email query parameter and returns their id, email,
-    and full name if found.
+    validated email query parameter, ignoring case, and returns their
+    id, email, and full name if found.
     """
 
     permission_classes = [IsAuthenticated]
-    queryset = User.objects.all()
 
     def retrieve(self, request, *args, **kwargs):
         """
         Handle retrieval of a user by email.
 
         Extracts and validates the email from query parameters,
-        looks up a matching user, and returns a Response with user
-        profile details. If not found, returns 404 status.
+        looks up the user together with their profile in one query,
+        and returns a Response with user profile details. If not
+        found, returns 404 status; recently unknown emails are
+        answered without a query.
         """
         email = getValidEmail(request.query_params)
 
-        if not (user := self.queryset.filter(email=email).first()):
+        if not (member := find_member(email)):
             return Response(status=404)
 
-        if not (profile := getProfileForUser(user)):
-            return Response(status=404)
+        user_id, email, fullname = member
+        return Response({"id": user_id, "email": email, "fullname": fullname})
+
+
+class UserAutocompleteView(generics.GenericAPIView):
+    """
+    API view suggesting users whose email or full name starts with
+    the typed prefix, for the member picker.
+
+    Requires the request to be authenticated. Matches ignore case and
+    any word of the full name, and are served from the in-process
+    autocomplete index without a query once it is loaded.
+    """
 
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        query = AutocompleteQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+        users = user_autocomplete.search(params["q"], params["limit"])  # type: ignore
         return Response(
-            {
-                "id": user.pk,
-                "email": user.email,
-                "fullname": profile.fullname,
-            }
+            [
+                {"id": user_id, "email": email, "fullname": fullname}
+                for user_id, email, fullname in users
+            ]
         )
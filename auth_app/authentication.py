@@ -0,0 +1,83 @@
+import copy
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from rest_framework import exceptions
+from rest_framework.authentication import (
+    TokenAuthentication,
+    get_authorization_header,
+)
+
+from core.cache import LRUCache
+
+_config = getattr(settings, "TOKEN_AUTH_CACHE", {})
+
+token_cache = LRUCache(
+    max_size=_config.get("MAX_SIZE", 10_000),
+    ttl=_config.get("TTL", 300),
+)
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Drop-in replacement for DRF's TokenAuthentication with a cache.
+
+    Resolved tokens are kept in a bounded, TTL-limited in-process
+    cache that maps the token key to the token and its user. The user
+    is loaded together with its UserProfile, so neither is queried
+    again while the entry is cached. Entries are dropped by the
+    signal handlers in `auth_app.signals` when a token is deleted or
+    its user changes.
+    """
+
+    def authenticate_credentials(self, key):
+        entry = token_cache.get(key)
+        if entry is None:
+            entry = self.load_credentials(key)
+        return self.cached_result(entry)
+
+    async def aauthenticate(self, request):
+        """
+        Async variant of authenticate() for async views.
+
+        Tokens found in the cache are resolved on the event loop,
+        only cache misses are looked up in a worker thread.
+        """
+        auth = get_authorization_header(request).split()
+        if len(auth) != 2 or auth[0].lower() != self.keyword.lower().encode():
+            # No token or a malformed header, neither needs the database.
+            return self.authenticate(request)
+
+        try:
+            key = auth[1].decode()
+        except UnicodeError:
+            return self.authenticate(request)
+
+        entry = token_cache.get(key)
+        if entry is None:
+            entry = await sync_to_async(self.load_credentials)(key)
+        return self.cached_result(entry)
+
+    def load_credentials(self, key):
+        """
+        Load the token with its user and profile and cache them.
+        """
+        model = self.get_model()
+        try:
+            token = model.objects.select_related(
+                "user", "user__userprofile"
+            ).get(key=key)
+        except model.DoesNotExist:
+            raise exceptions.AuthenticationFailed("Invalid token.")
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed("User inactive or deleted.")
+
+        entry = (token.user, token)
+        token_cache.set(key, entry)
+        return entry
+
+    def cached_result(self, entry):
+        user, token = entry
+        # Every request gets its own copy of the shared cached user.
+        return (copy.copy(user), token)
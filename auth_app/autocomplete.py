@@ -0,0 +1,314 @@
+import logging
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models.functions import Lower
+
+from auth_app.models import UserProfile
+
+logger = logging.getLogger(__name__)
+
+_config = getattr(settings, "USER_AUTOCOMPLETE", {})
+
+
+def normalize(text: str) -> str:
+    """
+    Lowercase a search text and collapse its whitespace.
+    """
+    return " ".join(text.lower().split())
+
+
+def search_keys(email: str, fullname: str) -> set[str]:
+    """
+    Return the keys a user is found by: the email and the full name
+    starting at each of its words, so "smi" finds "Anna Smith".
+    """
+    words = normalize(fullname).split(" ")
+    keys = {email.lower()}
+    keys.update(" ".join(words[start:]) for start in range(len(words)))
+    keys.discard("")
+    return keys
+
+
+class PrefixIndex:
+    """
+    Sorted in-memory index of users by the prefixes of their keys.
+
+    The keys of all users are kept in one sorted list, with the user
+    ID of each key at the same position of `ids`. The keys starting
+    with a prefix are adjacent, so a search is a binary search for
+    the first of them followed by a scan of at most a few keys per
+    result. Adding or removing a user shifts the arrays, which takes
+    about 25 ms at a million users but is rare compared to searches.
+    Not thread-safe; UserAutocomplete serializes access.
+    """
+
+    def __init__(self, keys=None, ids=None, users=None):
+        self.keys: list[str] = keys if keys is not None else []
+        self.ids = ids if ids is not None else array("q")
+        self.users: dict[int, tuple[str, str]] = users or {}
+
+    @classmethod
+    def build(cls, rows) -> "PrefixIndex":
+        """
+        Build an index from (user ID, email, full name) rows.
+        """
+        users = {}
+        pairs = []
+        for user_id, email, fullname in rows:
+            users[user_id] = (email, fullname)
+            pairs.extend(
+                (key, user_id) for key in search_keys(email, fullname)
+            )
+        pairs.sort()
+        return cls(
+            [key for key, _ in pairs],
+            array("q", (user_id for _, user_id in pairs)),
+            users,
+        )
+
+    def __len__(self) -> int:
+        return len(self.users)
+
+    def add(self, user_id: int, email: str, fullname: str) -> None:
+        self.remove(user_id)
+        self.users[user_id] = (email, fullname)
+        for key in search_keys(email, fullname):
+            position = bisect_left(self.keys, key)
+            while (
+                position < len(self.keys)
+                and self.keys[position] == key
+                and self.ids[position] < user_id
+            ):
+                position += 1
+            self.keys.insert(position, key)
+            self.ids.insert(position, user_id)
+
+    def remove(self, user_id: int) -> None:
+        user = self.users.pop(user_id, None)
+        if user is None:
+            return
+        for key in search_keys(*user):
+            position = bisect_left(self.keys, key)
+            while position < len(self.keys) and self.keys[position] == key:
+                if self.ids[position] == user_id:
+                    del self.keys[position]
+                    del self.ids[position]
+                    break
+                position += 1
+
+    def search(self, prefix: str, limit: int) -> list[tuple[int, str, str]]:
+        """
+        Return the (user ID, email, full name) of the first `limit`
+        users with a key starting with the normalized prefix, ordered
+        by their first matching key.
+        """
+        found: dict[int, None] = {}
+        keys, ids = self.keys, self.ids
+        position = bisect_left(keys, prefix)
+        while (
+            len(found) < limit
+            and position < len(keys)
+            and keys[position].startswith(prefix)
+        ):
+            found[ids[position]] = None
+            position += 1
+        return [(user_id, *self.users[user_id]) for user_id in found]
+
+
+def prefix_upper_bound(prefix: str) -> str | None:
+    """
+    Return the smallest string above all strings starting with the
+    prefix, or None if there is none.
+
+    Trailing maximal code points cannot be incremented and are
+    dropped, and the surrogate range, which cannot be stored, is
+    skipped.
+    """
+    prefix = prefix.rstrip(chr(sys.maxunicode))
+    if not prefix:
+        return None
+    code = ord(prefix[-1]) + 1
+    if 0xD800 <= code <= 0xDFFF:
+        code = 0xE000
+    return prefix[:-1] + chr(code)
+
+
+def fallback_search(prefix: str, limit: int) -> list[tuple[int, str, str]]:
+    """
+    Search users with two queries while the index is not loaded.
+
+    Matches the prefix against the whole lowercased email and full
+    name only, not against later words of the name. Each query is a
+    range over a LOWER() expression index, which unlike LIKE is used
+    by SQLite regardless of case sensitivity and escaping.
+    """
+    bounds = {"key__gte": prefix}
+    upper = prefix_upper_bound(prefix)
+    if upper is not None:
+        bounds["key__lt"] = upper
+    matches = {}
+    for field in ("user__email", "fullname"):
+        rows = (
+            UserProfile.objects.alias(key=Lower(field))
+            .filter(**bounds)
+            .order_by("key")
+            .values_list("user_id", "user__email", "fullname")[:limit]
+        )
+        for user_id, email, fullname in rows:
+            keys = [
+                key
+                for key in (email.lower(), normalize(fullname))
+                if key.startswith(prefix)
+            ]
+            matches[user_id] = (min(keys, default=prefix), email, fullname)
+    ordered = sorted(matches.items(), key=lambda item: (item[1][0], item[0]))
+    return [
+        (user_id, email, fullname)
+        for user_id, (_, email, fullname) in ordered[:limit]
+    ]
+
+
+class UserAutocomplete:
+    """
+    Prefix search over the emails and full names of users with a
+    profile, served by an in-process PrefixIndex.
+
+    The index is loaded in a background thread on the first search;
+    until it is ready, searches fall back to indexed queries. Saved
+    and deleted users and profiles are re-read into the index once
+    their transaction commits. Changes committed while the index
+    loads are re-read after it is swapped in, so none are lost. Other
+    processes only learn about changes when their index is rebuilt,
+    which happens in the background every `rebuild_interval`
+    seconds while the previous index keeps serving searches.
+    """
+
+    def __init__(self, rebuild_interval: float):
+        self.rebuild_interval = rebuild_interval
+        self._lock = threading.Lock()
+        self._index: PrefixIndex | None = None
+        self._loaded_at = 0.0
+        self._loading = False
+        self._changed: set[int] = set()
+
+    @property
+    def ready(self) -> bool:
+        return self._index is not None
+
+    def search(self, prefix: str, limit: int) -> list[tuple[int, str, str]]:
+        """
+        Return the (user ID, email, full name) of the first `limit`
+        users whose email or full name starts with the prefix.
+        """
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        if (
+            self._index is None
+            or time.monotonic() - self._loaded_at > self.rebuild_interval
+        ):
+            self.start_loading()
+        with self._lock:
+            if self._index is not None:
+                return self._index.search(prefix, limit)
+        return fallback_search(prefix, limit)
+
+    def start_loading(self) -> None:
+        """
+        Load the index in a background thread unless one is running.
+        """
+        with self._lock:
+            if self._loading:
+                return
+            self._loading = True
+        threading.Thread(
+            target=self._load_in_background,
+            name="user-autocomplete",
+            daemon=True,
+        ).start()
+
+    def _load_in_background(self) -> None:
+        try:
+            self.load()
+        except Exception:
+            logger.exception("Loading the user autocomplete index failed.")
+        finally:
+            connections.close_all()
+
+    def load(self) -> None:
+        """
+        Read all users into a new index and swap it in.
+        """
+        with self._lock:
+            self._loading = True
+            self._changed = set()
+        try:
+            index = PrefixIndex.build(
+                UserProfile.objects.values_list(
+                    "user_id", "user__email", "fullname"
+                ).iterator(chunk_size=10_000)
+            )
+        except Exception:
+            with self._lock:
+                self._loading = False
+            raise
+        with self._lock:
+            changed, self._changed = self._changed, set()
+            self._index = index
+            self._loaded_at = time.monotonic()
+            self._loading = False
+        self.refresh(changed)
+
+    def refresh(self, user_ids) -> None:
+        """
+        Re-read users into the index, removing those without a profile.
+        """
+        if not user_ids or self._index is None:
+            return
+        rows = {
+            user_id: (email, fullname)
+            for user_id, email, fullname in UserProfile.objects.filter(
+                user_id__in=user_ids
+            ).values_list("user_id", "user__email", "fullname")
+        }
+        with self._lock:
+            for user_id in user_ids:
+                if user_id in rows:
+                    self._index.add(user_id, *rows[user_id])
+                else:
+                    self._index.remove(user_id)
+
+    def changed(self, user_id: int) -> None:
+        """
+        Refresh a user in the index once the transaction commits.
+        Nothing is read while the index is not loaded.
+        """
+
+        def refresh():
+            with self._lock:
+                if self._loading:
+                    self._changed.add(user_id)
+            self.refresh([user_id])
+
+        if self._index is not None or self._loading:
+            transaction.on_commit(refresh)
+
+    def clear(self) -> None:
+        """
+        Drop the index, so the next search loads it again.
+        """
+        with self._lock:
+            self._index = None
+            self._loaded_at = 0.0
+            self._changed = set()
+
+
+user_autocomplete = UserAutocomplete(
+    rebuild_interval=_config.get("REBUILD_INTERVAL", 3600),
+)
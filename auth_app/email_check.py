@@ -0,0 +1,93 @@
+import threading
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Value
+from django.db.models.functions import Lower
+
+from auth_app.models import UserProfile
+from core.cache import LRUCache
+
+_config = getattr(settings, "EMAIL_CHECK_CACHE", {})
+
+
+class UnknownEmails:
+    """
+    In-process TTL set of emails that belong to no user with a profile.
+
+    The member picker checks an email on every keystroke and most of
+    the partial addresses are unknown, so they are answered from this
+    set without a query. Emails are compared lowercased. `forget()` is
+    called when a user or profile is saved. It also bumps a
+    generation, so a lookup that started before the save cannot add
+    its now outdated miss afterwards. Other processes only see a new
+    user once their entry expires after `ttl` seconds.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.entries = LRUCache(max_size=max_size, ttl=ttl)
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def __contains__(self, email: str) -> bool:
+        return self.entries.get(email.lower(), False)
+
+    def add(self, email: str, generation: int) -> None:
+        with self._lock:
+            if generation == self._generation:
+                self.entries.set(email.lower(), True)
+
+    def forget(self, email: str) -> None:
+        with self._lock:
+            self._generation += 1
+            self.entries.delete(email.lower())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self.entries.clear()
+
+
+unknown_emails = UnknownEmails(
+    max_size=_config.get("MAX_SIZE", 10_000),
+    ttl=_config.get("TTL", 60),
+)
+
+
+def find_member(email: str):
+    """
+    Return the (user ID, email, full name) of the user with the given
+    email ignoring case, or None if there is no such user with a
+    profile.
+
+    Uses one query joining the profile, served by the LOWER(email)
+    index of the users table. Emails with no match are remembered in
+    `unknown_emails`.
+    """
+    if email in unknown_emails:
+        return None
+
+    generation = unknown_emails.generation
+    match = (
+        UserProfile.objects.alias(email_lower=Lower("user__email"))
+        .filter(email_lower=Lower(Value(email)))
+        .order_by("user_id")
+        .values_list("user_id", "user__email", "fullname")
+        .first()
+    )
+    if match is None:
+        unknown_emails.add(email, generation)
+    return match
+
+
+def forget_email_on_commit(email: str) -> None:
+    """
+    Drop an email from `unknown_emails` now and again once the
+    transaction commits, like the board access invalidation.
+    """
+    unknown_emails.forget(email)
+    transaction.on_commit(lambda: unknown_emails.forget(email))
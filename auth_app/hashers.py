@@ -0,0 +1,22 @@
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2 hasher taking its iteration count from the
+    PASSWORD_HASH_ITERATIONS setting, see `manage.py
+    tune_password_hasher`.
+
+    It keeps the `pbkdf2_sha256` algorithm name, so existing hashes
+    still verify, and hashes with another iteration count are
+    upgraded in the background on the user's next login. Without the
+    setting, Django's default iteration count applies.
+    """
+
+    @property
+    def iterations(self):
+        return (
+            getattr(settings, "PASSWORD_HASH_ITERATIONS", None)
+            or PBKDF2PasswordHasher.iterations
+        )
@@ -0,0 +1,237 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, make_password
+from django.contrib.auth.models import User
+from django.db import connections, transaction
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+logger = logging.getLogger(__name__)
+
+_config = getattr(settings, "PASSWORD_HASHING", {})
+
+
+class HashingUnavailable(APIException):
+    """
+    Raised when the password hashing pool has no room for a request.
+    Rendered as 503 with a Retry-After header.
+    """
+
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Too many logins at once, please try again shortly."
+    default_code = "hashing_unavailable"
+
+    def __init__(self, wait: int):
+        super().__init__()
+        self.wait = wait
+
+
+class PasswordHashingPool:
+    """
+    Bounded thread pool running the password hashes of the process.
+
+    A PBKDF2 hash takes hundreds of milliseconds of CPU. Login and
+    registration hand their hashes to the pool and wait for the
+    result, so at most `workers` hashes run at a time however many
+    logins arrive at once, and the other cores stay available to
+    unrelated requests. hashlib releases the GIL while hashing, so the
+    workers do not stall the request threads either.
+
+    At most `max_queued` hashes wait for a free worker. Further hashes
+    are rejected with HashingUnavailable instead of queuing without
+    limit, which would only turn a login storm into timeouts. When
+    the pool is disabled, hashes run in the calling thread.
+    """
+
+    def __init__(
+        self,
+        enabled: bool,
+        workers: int,
+        max_queued: int,
+        retry_after: int = 1,
+    ):
+        self.enabled = enabled
+        self.workers = workers
+        self.max_queued = max_queued
+        self.retry_after = retry_after
+        self._executor = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+        self._peak_queued = 0
+        self._hashes = 0
+        self._rejected = 0
+        self._wait_total = 0.0
+        self._hash_total = 0.0
+        self._hash_max = 0.0
+
+    def run(self, func, *args):
+        """
+        Run func(*args) on the pool and return its result.
+        """
+        if not self.enabled:
+            return func(*args)
+        return self.submit(func, *args).result()
+
+    async def arun(self, func, *args):
+        """
+        Async variant of run, awaiting the hash without blocking the
+        event loop.
+        """
+        if not self.enabled:
+            return func(*args)
+        return await asyncio.wrap_future(self.submit(func, *args))
+
+    def submit(self, func, *args) -> Future:
+        """
+        Queue func(*args) on the pool, or raise HashingUnavailable if
+        `max_queued` hashes are already waiting for a worker.
+        """
+        with self._lock:
+            if self._pending - self._running >= self.max_queued:
+                self._rejected += 1
+                raise HashingUnavailable(self.retry_after)
+            self._pending += 1
+            self._peak_queued = max(
+                self._peak_queued, self._pending - self._running
+            )
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    self.workers, thread_name_prefix="password-hashing"
+                )
+            executor = self._executor
+        return executor.submit(self._timed, time.perf_counter(), func, args)
+
+    def _timed(self, queued_at: float, func, args):
+        started = time.perf_counter()
+        with self._lock:
+            self._running += 1
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._running -= 1
+                self._pending -= 1
+                self._hashes += 1
+                self._wait_total += started - queued_at
+                self._hash_total += elapsed
+                self._hash_max = max(self._hash_max, elapsed)
+
+    def stats(self) -> dict:
+        """
+        Return the queue depth and the hash timings of the pool.
+        """
+        with self._lock:
+            hashes = self._hashes
+            return {
+                "enabled": self.enabled,
+                "workers": self.workers,
+                "running": self._running,
+                "queued": self._pending - self._running,
+                "peak_queued": self._peak_queued,
+                "hashes": hashes,
+                "rejected": self._rejected,
+                "mean_wait_ms": (
+                    self._wait_total / hashes * 1000 if hashes else 0.0
+                ),
+                "mean_hash_ms": (
+                    self._hash_total / hashes * 1000 if hashes else 0.0
+                ),
+                "max_hash_ms": self._hash_max * 1000,
+            }
+
+
+password_hashing = PasswordHashingPool(
+    enabled=_config.get("ENABLED", True),
+    workers=_config.get("WORKERS", 2),
+    max_queued=_config.get("MAX_QUEUED", 32),
+    retry_after=_config.get("RETRY_AFTER", 1),
+)
+
+
+def hash_password(password: str) -> str:
+    """
+    Return the hash of a password for User.password, computed on the
+    hashing pool.
+    """
+    return password_hashing.run(make_password, password)
+
+
+async def ahash_password(password: str) -> str:
+    return await password_hashing.arun(make_password, password)
+
+
+def rehash(user_id, encoded: str, password: str) -> bool:
+    """
+    Store a new hash of a password, computed with the current hasher
+    settings, unless the user's hash changed from `encoded` meanwhile.
+    Returns True if the hash was replaced.
+    """
+    try:
+        return bool(
+            User.objects.filter(pk=user_id, password=encoded).update(
+                password=make_password(password)
+            )
+        )
+    finally:
+        connections.close_all()
+
+
+def rehash_in_background(user, password: str) -> None:
+    """
+    Upgrade the outdated hash of a user without delaying the login.
+
+    The new hash is computed and stored on the hashing pool once the
+    current transaction commits. Only the hash the password was
+    verified against is replaced, so a password change in the meantime
+    wins. When the pool is saturated the upgrade is skipped and
+    retried on the next login.
+    """
+
+    def submit():
+        try:
+            password_hashing.submit(rehash, user.pk, user.password, password)
+        except HashingUnavailable:
+            logger.info("Skipped the hash upgrade of user %s.", user.pk)
+
+    if password_hashing.enabled:
+        transaction.on_commit(submit)
+    else:
+        user.set_password(password)
+        user.save(update_fields=["password"])
+
+
+def verify_password(user, password: str) -> bool:
+    """
+    Check a password against the hash of a user on the hashing pool.
+
+    Like User.check_password, a correct password stored with outdated
+    hasher settings gets a new hash, but in the background.
+    """
+    outdated = []
+    valid = password_hashing.run(
+        check_password, password, user.password, outdated.append
+    )
+    if valid and outdated:
+        rehash_in_background(user, password)
+    return valid
+
+
+async def averify_password(user, password: str) -> bool:
+    """
+    Async variant of verify_password.
+    """
+    outdated = []
+    valid = await password_hashing.arun(
+        check_password, password, user.password, outdated.append
+    )
+    if valid and outdated:
+        await sync_to_async(rehash_in_background)(user, password)
+    return valid
@@ -0,0 +1,79 @@
+import random
+import resource
+import time
+
+from django.core.management.base import BaseCommand
+
+from auth_app.autocomplete import PrefixIndex
+from core.benchmark import summarize
+
+FIRST_NAMES = ("Anna", "Ben", "Clara", "David", "Emma", "Felix", "Greta")
+LAST_NAMES = ("Schmidt", "Meyer", "Weber", "Wagner", "Becker", "Hoffmann")
+
+
+class Command(BaseCommand):
+    """
+    Measure the user autocomplete index on synthetic users.
+
+    Builds a PrefixIndex of `--users` generated users in memory and
+    reports the build time and memory, the latency of top-k searches
+    for random prefixes of one to six characters, and the latency of
+    adding and removing a user. No database is involved.
+    """
+
+    help = "Benchmark the user autocomplete index on synthetic users."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1_000_000)
+        parser.add_argument("--searches", type=int, default=10_000)
+        parser.add_argument("--limit", type=int, default=10)
+        parser.add_argument("--seed", type=int, default=1)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        rows = [
+            (
+                n,
+                f"user{n}@example{n % 97}.com",
+                f"{rng.choice(FIRST_NAMES)}{n % 1000} "
+                f"{rng.choice(LAST_NAMES)}{n % 997}",
+            )
+            for n in range(1, options["users"] + 1)
+        ]
+
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        started = time.perf_counter()
+        index = PrefixIndex.build(rows)
+        built = time.perf_counter() - started
+        grown = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss
+        self.stdout.write(
+            f"{len(index)} users, {len(index.keys)} keys: built in "
+            f"{built:.1f} s, peak RSS +{grown / 1024:.0f} MiB"
+        )
+
+        for length in (1, 2, 4, 6):
+            durations = []
+            for _ in range(options["searches"]):
+                _, email, fullname = rng.choice(rows)
+                text = rng.choice((email, fullname, fullname.split()[-1]))
+                prefix = text.lower()[:length]
+                started = time.perf_counter()
+                index.search(prefix, options["limit"])
+                durations.append(time.perf_counter() - started)
+            stats = summarize(durations)
+            self.stdout.write(
+                f"search top {options['limit']}, {length}-character prefix: "
+                f"p50 {stats['p50_ms']:.3f} ms, p99 {stats['p99_ms']:.3f} ms"
+            )
+
+        durations = []
+        for n in range(options["users"] + 1, options["users"] + 101):
+            started = time.perf_counter()
+            index.add(n, f"new{n}@example.com", f"New User {n}")
+            index.remove(n)
+            durations.append(time.perf_counter() - started)
+        stats = summarize(durations)
+        self.stdout.write(
+            f"add and remove a user: p50 {stats['p50_ms']:.2f} ms, "
+            f"p99 {stats['p99_ms']:.2f} ms"
+        )
@@ -0,0 +1,169 @@
+import io
+import json
+import sys
+import threading
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.core.wsgi import get_wsgi_application
+from django.db import connections
+from django.db.models import Max
+from rest_framework.authtoken.models import Token
+
+from auth_app.hashing import password_hashing
+from auth_app.models import UserProfile
+from boards_app.models import Board
+from core.benchmark import summarize
+
+EMAIL = "password-hashing@example.com"
+PASSWORD = "benchmark-password"
+
+
+class Command(BaseCommand):
+    """
+    Measure a login storm with and without the password hashing pool.
+
+    Worker threads send logins concurrently through the WSGI
+    application while a probe thread keeps requesting the board list,
+    first with every login hashing in its request thread, then with
+    the hashes going through the pool. Reports login throughput and
+    latency, rejected logins, the probe latency and the pool metrics.
+    The temporary user and board are deleted at the end.
+    """
+
+    help = "Benchmark logins with and without the password hashing pool."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=8)
+        parser.add_argument("--logins", type=int, default=3)
+
+    def handle(self, *args, **options):
+        user = self.create_user()
+        enabled = password_hashing.enabled
+        try:
+            token = Token.objects.create(user=user)
+            board = Board.objects.create(
+                owner=user.userprofile, title="Hashing"
+            )
+            board.members.add(user.userprofile)
+            self.stdout.write(
+                f"{options['workers']} login workers, "
+                f"{password_hashing.workers} hashing workers"
+            )
+            for pooled in (False, True):
+                password_hashing.enabled = pooled
+                self.run_storm(
+                    "pool" if pooled else "inline",
+                    token.key,
+                    options["workers"],
+                    options["logins"],
+                )
+            self.stdout.write(f"pool stats: {password_hashing.stats()}")
+        finally:
+            password_hashing.enabled = enabled
+            user.delete()
+
+    def create_user(self):
+        """
+        Create a user and profile sharing the same ID.
+
+        The board permissions compare the user's ID with profile IDs,
+        so both are aligned for the benchmark user.
+        """
+        pk = 1 + max(
+            User.objects.aggregate(pk=Max("pk"))["pk"] or 0,
+            UserProfile.objects.aggregate(pk=Max("pk"))["pk"] or 0,
+        )
+        user = User.objects.create_user(
+            pk=pk, username=EMAIL, email=EMAIL, password=PASSWORD
+        )
+        UserProfile.objects.create(pk=pk, user=user, fullname="Hashing")
+        return user
+
+    def run_storm(self, label, token, workers, logins):
+        application = get_wsgi_application()
+        login_durations, probe_durations = [], []
+        rejected = []
+        done = threading.Event()
+        barrier = threading.Barrier(workers + 1)
+
+        def request(method, path, payload=None, headers=None):
+            body = json.dumps(payload).encode() if payload else b""
+            environ = {
+                "REQUEST_METHOD": method,
+                "PATH_INFO": path,
+                "QUERY_STRING": "",
+                "CONTENT_TYPE": "application/json",
+                "CONTENT_LENGTH": str(len(body)),
+                "SERVER_NAME": "localhost",
+                "SERVER_PORT": "80",
+                "SERVER_PROTOCOL": "HTTP/1.1",
+                "HTTP_HOST": "localhost",
+                "wsgi.url_scheme": "http",
+                "wsgi.input": io.BytesIO(body),
+                "wsgi.errors": sys.stderr,
+                **(headers or {}),
+            }
+            statuses = []
+            started = time.perf_counter()
+            response = application(
+                environ, lambda status, headers: statuses.append(status)
+            )
+            b"".join(response)
+            response.close()
+            return time.perf_counter() - started, statuses[0]
+
+        def login_worker():
+            barrier.wait()
+            try:
+                for _ in range(logins):
+                    elapsed, status = request(
+                        "POST",
+                        "/api/login/",
+                        {"email": EMAIL, "password": PASSWORD},
+                    )
+                    if status.startswith("503"):
+                        rejected.append(status)
+                    else:
+                        login_durations.append(elapsed)
+            finally:
+                connections.close_all()
+
+        def probe():
+            barrier.wait()
+            try:
+                while not done.is_set():
+                    elapsed, _ = request(
+                        "GET",
+                        "/api/boards/",
+                        headers={"HTTP_AUTHORIZATION": f"Token {token}"},
+                    )
+                    probe_durations.append(elapsed)
+                    time.sleep(0.01)
+            finally:
+                connections.close_all()
+
+        threads = [
+            threading.Thread(target=login_worker) for _ in range(workers)
+        ]
+        probe_thread = threading.Thread(target=probe)
+        probe_thread.start()
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        done.set()
+        probe_thread.join()
+
+        logins_stats = summarize(login_durations)
+        probe_stats = summarize(probe_durations)
+        self.stdout.write(
+            f"{label}: {len(login_durations) / elapsed:.1f} logins/s, "
+            f"login p50 {logins_stats['p50_ms']:.0f} ms, "
+            f"p99 {logins_stats['p99_ms']:.0f} ms, {len(rejected)} rejected; "
+            f"board list p50 {probe_stats['p50_ms']:.1f} ms, "
+            f"p99 {probe_stats['p99_ms']:.1f} ms"
+        )
@@ -0,0 +1,67 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIRequestFactory
+
+from auth_app.authentication import (
+    CachedTokenAuthentication,
+    token_cache,
+)
+from auth_app.models import UserProfile
+from core.benchmark import summarize, time_calls
+
+
+class Command(BaseCommand):
+    """
+    Compare the stock TokenAuthentication with CachedTokenAuthentication.
+
+    Authenticates the same request repeatedly with both backends and
+    reports latency percentiles and queries per request. A temporary
+    user is created inside a transaction that is rolled back at the end.
+    """
+
+    help = "Benchmark the cached token authentication backend."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=5_000)
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+
+        with transaction.atomic():
+            user = User.objects.create(
+                username="benchmark@example.com",
+                email="benchmark@example.com",
+            )
+            UserProfile.objects.create(user=user, fullname="Bench Mark")
+            token = Token.objects.create(user=user)
+            request = APIRequestFactory().get(
+                "/", HTTP_AUTHORIZATION=f"Token {token.key}"
+            )
+
+            token_cache.clear()
+            for backend in (
+                TokenAuthentication(),
+                CachedTokenAuthentication(),
+            ):
+                self.run_backend(backend, request, iterations)
+
+            transaction.set_rollback(True)
+
+    def run_backend(self, backend, request, iterations):
+        with CaptureQueriesContext(connection) as queries:
+            durations = time_calls(
+                lambda: backend.authenticate(request), iterations
+            )
+        stats = summarize(durations)
+
+        self.stdout.write(
+            f"{type(backend).__name__}: "
+            f"mean {stats['mean_ms'] * 1000:.1f} us, "
+            f"p99 {stats['p99_ms'] * 1000:.1f} us, "
+            f"{stats['ops_per_sec']:.0f} auth/s, "
+            f"{len(queries) / iterations:.3f} queries/request"
+        )
@@ -0,0 +1,92 @@
+import math
+import time
+
+from django.contrib.auth.hashers import get_hashers
+from django.core.management.base import BaseCommand, CommandError
+
+from core.benchmark import percentile
+
+# Cost attributes of Django's hashers. Linear costs scale the hash
+# time proportionally, logarithmic ones double it per step.
+LINEAR_COSTS = ("iterations", "time_cost")
+LOG2_COSTS = ("rounds",)
+
+
+class Command(BaseCommand):
+    """
+    Recommend password hasher costs for a target verification time.
+
+    Times each hasher of PASSWORD_HASHERS on this machine at its
+    configured cost, derives the cost that takes `--target-ms` to
+    verify a password, and times the hasher again at that cost to
+    confirm it. Hashers whose library is not installed are skipped.
+    Stored hashes are upgraded to a new cost in the background on the
+    next login of each user.
+    """
+
+    help = "Benchmark the password hashers and recommend their cost."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--target-ms", type=float, default=250.0)
+        parser.add_argument("--samples", type=int, default=5)
+
+    def handle(self, *args, **options):
+        target = options["target_ms"]
+        if target <= 0:
+            raise CommandError("--target-ms must be positive.")
+
+        for index, hasher in enumerate(get_hashers()):
+            name = type(hasher).__name__
+            if hasher.library:
+                try:
+                    hasher._load_library()
+                except ValueError:
+                    self.stdout.write(f"{name}: not installed, skipped")
+                    continue
+
+            attribute = self.cost_attribute(hasher)
+            if attribute is None:
+                self.stdout.write(f"{name}: no tunable cost, skipped")
+                continue
+
+            cost = getattr(hasher, attribute)
+            measured = self.time_hasher(hasher, options["samples"])
+            recommended = self.recommend(attribute, cost, measured, target)
+            tuned = type(name, (type(hasher),), {attribute: recommended})()
+            confirmed = self.time_hasher(tuned, options["samples"])
+            self.stdout.write(
+                f"{name}: {attribute}={cost} takes {measured:.0f} ms, "
+                f"{attribute}={recommended} takes {confirmed:.0f} ms"
+                + (" (preferred)" if index == 0 else "")
+            )
+            if index == 0 and attribute == "iterations":
+                self.stdout.write(
+                    f"  Set PASSWORD_HASH_ITERATIONS={recommended} to use it."
+                )
+
+    def cost_attribute(self, hasher):
+        for attribute in LINEAR_COSTS + LOG2_COSTS:
+            if isinstance(getattr(hasher, attribute, None), int):
+                return attribute
+        return None
+
+    def time_hasher(self, hasher, samples: int) -> float:
+        """
+        Return the median time in milliseconds of verifying a password.
+        """
+        encoded = hasher.encode("benchmark password", hasher.salt())
+        durations = []
+        for _ in range(samples):
+            started = time.perf_counter()
+            hasher.verify("benchmark password", encoded)
+            durations.append(time.perf_counter() - started)
+        return percentile(durations, 0.5) * 1000
+
+    def recommend(self, attribute, cost, measured, target) -> int:
+        if attribute in LOG2_COSTS:
+            return max(4, cost + round(math.log2(target / measured)))
+        recommended = cost * target / measured
+        if attribute == "iterations":
+            # Round to a thousand iterations like Django's defaults.
+            return max(1000, int(round(recommended, -3)))
+        return max(1, round(recommended))
@@ -0,0 +1,23 @@
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Index the lowercased email of users for the case-insensitive
+    lookup of /api/email-check/. Created with SQL, since the User
+    model belongs to django.contrib.auth.
+    """
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("auth_app", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            "CREATE INDEX IF NOT EXISTS auth_user_email_lower_idx "
+            "ON auth_user (LOWER(email))",
+            "DROP INDEX IF EXISTS auth_user_email_lower_idx",
+        ),
+    ]
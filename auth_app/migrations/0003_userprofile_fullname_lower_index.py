@@ -0,0 +1,20 @@
+# Generated by Django 6.1.2 on 2026-10-18 21:27
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth_app', '0002_user_email_lower_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='userprofile',
+            index=models.Index(django.db.models.functions.text.Lower('fullname'), name='profile_fullname_lower_idx'),
+        ),
+    ]
@@ -1,10 +1,17 @@
 from django.contrib.auth.models import User
 from django.db import models
+from django.db.models.functions import Lower
 
 
 class UserProfile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE)
     fullname = models.CharField(max_length=100)
 
+    class Meta:
+        indexes = [
+            # Serves the prefix search of the user autocomplete.
+            models.Index(Lower("fullname"), name="profile_fullname_lower_idx"),
+        ]
+
     def __str__(self):
         return self.fullname
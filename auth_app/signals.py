@@ -0,0 +1,61 @@
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from auth_app.authentication import token_cache
+from auth_app.autocomplete import user_autocomplete
+from auth_app.email_check import forget_email_on_commit
+from auth_app.models import UserProfile
+
+
+def forget_token_on_commit(key: str) -> None:
+    """
+    Drop a token from `token_cache` now and again once the transaction
+    commits, like the board access invalidation.
+
+    The second invalidation removes entries that concurrent requests
+    may have re-populated from the not yet committed state.
+    """
+    token_cache.delete(key)
+    transaction.on_commit(lambda: token_cache.delete(key))
+
+
+@receiver(post_delete, sender=Token)
+def token_deleted(sender, instance, **kwargs):
+    forget_token_on_commit(instance.key)
+
+
+def invalidate_user_tokens(user_id) -> None:
+    keys = Token.objects.filter(user_id=user_id).values_list("key", flat=True)
+    for key in keys:
+        forget_token_on_commit(key)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def user_changed(sender, instance, **kwargs):
+    """
+    Drop cached tokens of a user that was changed or deleted.
+
+    This covers deactivation as well as changes to fields that are
+    served from the cached user instance. The email is dropped from
+    the unknown emails of the email check, which covers registration,
+    and the user is refreshed in the autocomplete index. A new user
+    has no tokens yet, so registration skips the token query.
+    """
+    if not kwargs.get("created"):
+        invalidate_user_tokens(instance.pk)
+    forget_email_on_commit(instance.email)
+    user_autocomplete.changed(instance.pk)
+
+
+@receiver(post_save, sender=UserProfile)
+@receiver(post_delete, sender=UserProfile)
+def profile_changed(sender, instance, **kwargs):
+    # Tokens may be cached from before the user had a profile.
+    invalidate_user_tokens(instance.user_id)
+    # The email check only finds users with a profile.
+    forget_email_on_commit(instance.user.email)
+    user_autocomplete.changed(instance.user_id)
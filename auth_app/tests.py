@@ -1,3 +1,452 @@
-from django.test import TestCase
+import io
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import (
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from auth_app.authentication import token_cache
+from auth_app.autocomplete import user_autocomplete
+from auth_app.email_check import unknown_emails
+from auth_app.hashing import (
+    HashingUnavailable,
+    PasswordHashingPool,
+    password_hashing,
+    rehash,
+)
+from auth_app.models import UserProfile
+
+
+class PasswordHashingPoolTests(SimpleTestCase):
+    """
+    Verify the admission control and the metrics of the hashing pool.
+    """
+
+    def test_rejects_hashes_beyond_the_queue(self):
+        pool = PasswordHashingPool(
+            enabled=True, workers=1, max_queued=1, retry_after=3
+        )
+        started, release = threading.Event(), threading.Event()
+
+        def block():
+            started.set()
+            release.wait()
+
+        running = pool.submit(block)
+        started.wait()
+        queued = pool.submit(len, "queued")
+        with self.assertRaises(HashingUnavailable) as raised:
+            pool.submit(len, "rejected")
+        self.assertEqual(raised.exception.wait, 3)
+        self.assertEqual(pool.stats()["queued"], 1)
+
+        release.set()
+        running.result()
+        self.assertEqual(queued.result(), 6)
+        stats = pool.stats()
+        self.assertEqual(stats["hashes"], 2)
+        self.assertEqual(stats["rejected"], 1)
+        self.assertEqual(stats["peak_queued"], 1)
+        self.assertEqual(stats["queued"] + stats["running"], 0)
+
+
+@override_settings(
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]
+)
+class LoginTests(TestCase):
+    """
+    Verify that the sync and async login views authenticate through
+    the hashing pool and answer 503 while it is saturated.
+    """
+
+    paths = ("/api/login/", "/api/async/login/")
+
+    def setUp(self):
+        user = User.objects.create_user(
+            username="user@example.com",
+            email="user@example.com",
+            password="secret",
+        )
+        UserProfile.objects.create(user=user, fullname="User Example")
+        self.user = user
+        self.client = APIClient()
+
+    def login(self, path, password):
+        return self.client.post(
+            path,
+            {"email": "user@example.com", "password": password},
+            format="json",
+        )
+
+    def test_login(self):
+        for path in self.paths:
+            with self.subTest(path=path):
+                hashes = password_hashing.stats()["hashes"]
+                response = self.login(path, "secret")
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.json()["user_id"], self.user.pk)
+                self.assertEqual(response.json()["fullname"], "User Example")
+                self.assertEqual(
+                    password_hashing.stats()["hashes"], hashes + 1
+                )
+
+                response = self.login(path, "wrong")
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(
+                    response.json(),
+                    {"non_field_errors": ["Invalid email or password"]},
+                )
+
+    def test_saturated_pool(self):
+        with mock.patch.object(
+            password_hashing, "submit", side_effect=HashingUnavailable(1)
+        ):
+            for path in self.paths:
+                with self.subTest(path=path):
+                    response = self.login(path, "secret")
+                    self.assertEqual(response.status_code, 503)
+                    self.assertEqual(response["Retry-After"], "1")
+
+
+@override_settings(
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]
+)
+class RegistrationTests(TestCase):
+    """
+    Verify that registration writes the user, profile and token in one
+    transaction and reports taken emails from the unique constraint.
+    """
+
+    def register(self, email="new@example.com"):
+        return APIClient().post(
+            "/api/registration/",
+            {
+                "fullname": "New User",
+                "email": email,
+                "password": "a-long-password",
+                "repeated_password": "a-long-password",
+            },
+            format="json",
+        )
+
+    def test_registration_is_one_transaction(self):
+        with self.assertNumQueries(5) as queries:
+            response = self.register()
+        self.assertEqual(response.status_code, 201)
+        statements = [query["sql"].split()[0] for query in queries]
+        self.assertEqual(
+            statements,
+            ["SAVEPOINT", "INSERT", "INSERT", "INSERT", "RELEASE"],
+        )
+        user = User.objects.get(username="new@example.com")
+        self.assertEqual(response.json()["token"], user.auth_token.key)
+        self.assertEqual(response.json()["fullname"], "New User")
+        self.assertEqual(user.userprofile.fullname, "New User")
+        self.assertTrue(user.check_password("a-long-password"))
+
+    def test_taken_email_is_rejected(self):
+        self.assertEqual(self.register().status_code, 201)
+        response = self.register()
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"email": ["Email already exists"]})
+        self.assertEqual(User.objects.count(), 1)
+
+
+@override_settings(
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]
+)
+class ImportUsersTests(TestCase):
+    """
+    Verify that import_users creates users with profile and token,
+    and skips taken emails and invalid records.
+    """
+
+    def test_import(self):
+        User.objects.create(username="taken@example.com")
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name) / "users.csv"
+        path.write_text(
+            "email,fullname,password,password_hash\n"
+            "anna@example.com,Anna Smith,secret,\n"
+            "taken@example.com,Taken,secret,\n"
+            f"bob@example.com,Bob Stone,,{make_password('hashed')}\n"
+            "not-an-email,Invalid,secret,\n"
+            "anna@example.com,Anna Again,secret,\n"
+            "carla@example.com,Carla Jones,,\n"
+        )
+        stdout, stderr = io.StringIO(), io.StringIO()
+        call_command(
+            "import_users",
+            path,
+            processes=1,
+            batch_size=2,
+            stdout=stdout,
+            stderr=stderr,
+        )
+
+        self.assertIn("Imported 3 users", stdout.getvalue())
+        self.assertIn(
+            "skipped 2 taken emails and 1 invalid", stdout.getvalue()
+        )
+        self.assertIn("line 5: invalid email", stderr.getvalue())
+        users = {
+            user.username: user
+            for user in User.objects.select_related("userprofile")
+        }
+        self.assertEqual(
+            users["anna@example.com"].userprofile.fullname, "Anna Smith"
+        )
+        self.assertEqual(users["anna@example.com"].last_name, "Smith")
+        self.assertTrue(users["anna@example.com"].check_password("secret"))
+        self.assertTrue(users["bob@example.com"].check_password("hashed"))
+        self.assertFalse(users["carla@example.com"].has_usable_password())
+        self.assertEqual(Token.objects.count(), 3)
+
+
+@override_settings(
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]
+)
+class EmailCheckTests(TestCase):
+    """
+    Verify the case-insensitive single-query lookup of the email check
+    and the cache of unknown emails.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create(
+            username="Member@Example.com", email="Member@Example.com"
+        )
+        UserProfile.objects.create(user=user, fullname="Member Example")
+        cls.member = user
+
+    def setUp(self):
+        unknown_emails.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.member)
+
+    def check(self, email):
+        return self.client.get("/api/email-check/", {"email": email})
+
+    def test_lookup_ignores_case(self):
+        with self.assertNumQueries(1):
+            response = self.check("member@example.COM")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {
+                "id": self.member.pk,
+                "email": "Member@Example.com",
+                "fullname": "Member Example",
+            },
+        )
+
+    def test_unknown_emails_are_cached_until_registration(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(self.check("new@example.com").status_code, 404)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.check("NEW@example.com").status_code, 404)
+
+        response = APIClient().post(
+            "/api/registration/",
+            {
+                "fullname": "New User",
+                "email": "new@example.com",
+                "password": "a-long-password",
+                "repeated_password": "a-long-password",
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.check("new@example.com").status_code, 200)
+
+
+class TokenCacheTests(TestCase):
+    """
+    Verify that cached tokens are dropped when the token is deleted or
+    its user deactivated, including entries re-populated by requests
+    before the write commits.
+    """
+
+    def setUp(self):
+        token_cache.clear()
+        self.addCleanup(token_cache.clear)
+        user = User.objects.create(
+            username="user@example.com", email="user@example.com"
+        )
+        UserProfile.objects.create(user=user, fullname="User Example")
+        self.user = user
+        self.token = Token.objects.create(user=user)
+        self.client = APIClient(
+            headers={"Authorization": f"Token {self.token.key}"}
+        )
+
+    def assert_status(self, status_code):
+        self.assertEqual(
+            self.client.get("/api/boards/").status_code, status_code
+        )
+
+    def assert_invalidated(self, write):
+        self.assert_status(200)
+        entry = token_cache.get(self.token.key)
+        self.assertIsNotNone(entry)
+        with self.captureOnCommitCallbacks(execute=True):
+            write()
+            self.assertIsNone(token_cache.get(self.token.key))
+            # A concurrent request caching the not yet committed state.
+            token_cache.set(self.token.key, entry)
+        self.assertIsNone(token_cache.get(self.token.key))
+        self.assert_status(401)
+
+    def test_token_deletion_invalidates_the_cache(self):
+        self.assert_invalidated(Token.objects.get(pk=self.token.pk).delete)
+
+    def test_user_deactivation_invalidates_the_cache(self):
+        def deactivate():
+            self.user.is_active = False
+            self.user.save()
+
+        self.assert_invalidated(deactivate)
+
+
+class UserAutocompleteTests(TestCase):
+    """
+    Verify the query fallback of the cold autocomplete index, the
+    word prefix search of the loaded index and its updates on save
+    and delete.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = {}
+        for email, fullname in (
+            ("anna@example.com", "Anna  Smith"),
+            ("bob@example.com", "Bob Stone"),
+            ("smitty@example.com", "Smitty Werben"),
+        ):
+            user = User.objects.create(username=email, email=email)
+            UserProfile.objects.create(user=user, fullname=fullname)
+            cls.users[fullname.split()[0]] = user
+
+    def setUp(self):
+        user_autocomplete.clear()
+        self.addCleanup(user_autocomplete.clear)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.users["Anna"])
+
+    def search(self, q, **params):
+        response = self.client.get(
+            "/api/users/autocomplete/", {"q": q, **params}
+        )
+        self.assertEqual(response.status_code, 200)
+        return [user["fullname"] for user in response.json()]
+
+    def test_cold_index_falls_back_to_queries(self):
+        with mock.patch.object(user_autocomplete, "start_loading") as start:
+            with self.assertNumQueries(2):
+                self.assertEqual(self.search("SM"), ["Smitty Werben"])
+            self.assertEqual(self.search("bob@"), ["Bob Stone"])
+        start.assert_called()
+        self.assertFalse(user_autocomplete.ready)
+
+    def test_cold_index_accepts_prefixes_ending_in_any_code_point(self):
+        with mock.patch.object(user_autocomplete, "start_loading"):
+            for q in ("a\U0010ffff", "\U0010ffff", "a\ud7ff", "smitty\uffff"):
+                with self.subTest(q=q):
+                    self.assertEqual(self.search(q), [])
+
+    def test_loaded_index_matches_words_without_queries(self):
+        user_autocomplete.load()
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                self.search("sm"), ["Anna  Smith", "Smitty Werben"]
+            )
+            self.assertEqual(self.search("anna sm"), ["Anna  Smith"])
+            self.assertEqual(self.search("sm", limit=1), ["Anna  Smith"])
+            self.assertEqual(self.search("x"), [])
+
+    def test_index_follows_saves_and_deletes(self):
+        user_autocomplete.load()
+        with self.captureOnCommitCallbacks(execute=True):
+            user = User.objects.create(
+                username="carla@example.com", email="carla@example.com"
+            )
+            profile = UserProfile.objects.create(
+                user=user, fullname="Carla Smart"
+            )
+        self.assertEqual(self.search("smar"), ["Carla Smart"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            profile.fullname = "Carla Jones"
+            profile.save()
+        self.assertEqual(self.search("smar"), [])
+        self.assertEqual(self.search("jon"), ["Carla Jones"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            user.delete()
+        self.assertEqual(self.search("carla"), [])
+
+    def test_requires_a_query(self):
+        response = self.client.get("/api/users/autocomplete/")
+        self.assertEqual(response.status_code, 400)
+
+
+@override_settings(
+    PASSWORD_HASHERS=["auth_app.hashers.TunedPBKDF2PasswordHasher"],
+    PASSWORD_HASH_ITERATIONS=1000,
+)
+class RehashOnLoginTests(TransactionTestCase):
+    """
+    Verify that hashes with an outdated cost are upgraded after a
+    successful login, and that a changed hash is left alone.
+
+    Runs without a wrapping transaction, since the upgrade is written
+    by the hashing pool once the login has committed.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="user@example.com",
+            email="user@example.com",
+            password="secret",
+        )
+        UserProfile.objects.create(user=self.user, fullname="User Example")
+
+    def stored_hash(self):
+        return User.objects.values_list("password", flat=True).get()
+
+    def test_outdated_hash_is_upgraded_after_login(self):
+        self.assertTrue(self.stored_hash().startswith("pbkdf2_sha256$1000$"))
+        with self.settings(PASSWORD_HASH_ITERATIONS=2000):
+            response = APIClient().post(
+                "/api/login/",
+                {"email": "user@example.com", "password": "secret"},
+                format="json",
+            )
+            self.assertEqual(response.status_code, 200)
+
+            deadline = time.monotonic() + 5
+            while not self.stored_hash().startswith("pbkdf2_sha256$2000$"):
+                self.assertLess(time.monotonic(), deadline)
+                time.sleep(0.01)
+            self.assertTrue(
+                User.objects.get().check_password("secret"),
+            )
+
+    def test_changed_hash_is_not_replaced(self):
+        stored = self.stored_hash()
+        self.assertFalse(rehash(self.user.pk, "outdated", "secret"))
+        self.assertEqual(self.stored_hash(), stored)
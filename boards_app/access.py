@@ -0,0 +1,151 @@
+from typing import NamedTuple
+
+from django.conf import settings
+
+from boards_app.models import Board
+from core.cache import LRUCache
+from tasks_app.models import Task
+
+
+class BoardACL(NamedTuple):
+    """
+    Access control data of a single board.
+
+    Holds the owner's profile ID and a frozenset of member profile
+    IDs, which is everything needed to answer membership checks.
+    """
+
+    owner_id: int
+    member_ids: frozenset
+
+    def allows(self, profile_id) -> bool:
+        return profile_id == self.owner_id or profile_id in self.member_ids
+
+
+class BoardAccessCache:
+    """
+    In-process cache for board access checks.
+
+    Maps board IDs to their BoardACL and task IDs to their board ID.
+    Both maps are bounded LRU caches with a TTL. Entries are dropped
+    by the signal handlers in `boards_app.signals` whenever a board,
+    its members or a task change, the TTL bounds staleness for writes
+    made by other processes.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.boards = LRUCache(max_size, ttl)
+        self.tasks = LRUCache(max_size, ttl)
+
+    def get_board_acl(self, board_id) -> BoardACL | None:
+        """
+        Return the BoardACL for board_id, or None if the board does
+        not exist.
+        """
+        acl = self.boards.get(board_id)
+        if acl is not None:
+            return acl
+
+        owner_id = (
+            Board.objects.filter(pk=board_id)
+            .values_list("owner_id", flat=True)
+            .first()
+        )
+        if owner_id is None:
+            return None
+
+        member_ids = Board.members.through.objects.filter(
+            board_id=board_id
+        ).values_list("userprofile_id", flat=True)
+        acl = BoardACL(owner_id, frozenset(member_ids))
+        self.boards.set(board_id, acl)
+        return acl
+
+    def get_task_board_id(self, task_id) -> int | None:
+        """
+        Return the ID of the board the task belongs to, or None if
+        the task does not exist.
+        """
+        board_id = self.tasks.get(task_id)
+        if board_id is not None:
+            return board_id
+
+        board_id = (
+            Task.objects.filter(pk=task_id)
+            .values_list("board_id", flat=True)
+            .first()
+        )
+        if board_id is not None:
+            self.tasks.set(task_id, board_id)
+        return board_id
+
+    async def aget_board_acl(self, board_id) -> BoardACL | None:
+        """
+        Async variant of get_board_acl using the async ORM on misses.
+        """
+        acl = self.boards.get(board_id)
+        if acl is not None:
+            return acl
+
+        owner_id = await (
+            Board.objects.filter(pk=board_id)
+            .values_list("owner_id", flat=True)
+            .afirst()
+        )
+        if owner_id is None:
+            return None
+
+        member_ids = Board.members.through.objects.filter(
+            board_id=board_id
+        ).values_list("userprofile_id", flat=True)
+        acl = BoardACL(
+            owner_id, frozenset([pk async for pk in member_ids.aiterator()])
+        )
+        self.boards.set(board_id, acl)
+        return acl
+
+    async def aget_task_board_id(self, task_id) -> int | None:
+        """
+        Async variant of get_task_board_id.
+        """
+        board_id = self.tasks.get(task_id)
+        if board_id is not None:
+            return board_id
+
+        board_id = await (
+            Task.objects.filter(pk=task_id)
+            .values_list("board_id", flat=True)
+            .afirst()
+        )
+        if board_id is not None:
+            self.tasks.set(task_id, board_id)
+        return board_id
+
+    def has_access(self, board_id, profile_id) -> bool:
+        acl = self.get_board_acl(board_id)
+        return acl is not None and acl.allows(profile_id)
+
+    def is_owner(self, board_id, profile_id) -> bool:
+        acl = self.get_board_acl(board_id)
+        return acl is not None and acl.owner_id == profile_id
+
+    def invalidate_board(self, board_id) -> None:
+        self.boards.delete(board_id)
+
+    def invalidate_task(self, task_id) -> None:
+        self.tasks.delete(task_id)
+
+    def clear(self) -> None:
+        self.boards.clear()
+        self.tasks.clear()
+
+    def stats(self) -> dict:
+        return {"boards": self.boards.stats(), "tasks": self.tasks.stats()}
+
+
+_config = getattr(settings, "BOARD_ACCESS_CACHE", {})
+
+board_access = BoardAccessCache(
+    max_size=_config.get("MAX_SIZE", 10_000),
+    ttl=_config.get("TTL", 60),
+)
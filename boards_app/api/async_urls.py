@@ -0,0 +1,8 @@
+from django.urls import path
+
+from boards_app.api.async_views import board_detail, board_list
+
+urlpatterns = [
+    path("", board_list, name="async-board-list"),
+    path("<int:pk>/", board_detail, name="async-board-detail"),
+]
@@ -0,0 +1,65 @@
+from rest_framework.exceptions import NotFound, PermissionDenied
+
+from auth_app.api.helpers import agetProfileForUser
+from boards_app.access import board_access
+from boards_app.api.fast_serializers import aboard_detail
+from boards_app.api.helpers import (
+    annotate_board_counters,
+    board_detail_queryset,
+    boards_for_profile,
+)
+from boards_app.api.serializers import (
+    BoardDetailSerializer,
+    BoardListSerializer,
+)
+from boards_app.models import Board
+from boards_app.response_cache import board_cache
+from core.async_api import async_api_view
+from tasks_app.api.fast_serializers import fast_serializers_enabled
+
+
+@async_api_view
+async def board_list(request):
+    """
+    Async variant of the board list of BoardsViewSet.
+
+    Boards and their counters are read with the async ORM, the
+    serializer only renders the already loaded rows.
+    """
+    profile = await agetProfileForUser(request.user)
+
+    async def build():
+        boards = annotate_board_counters(boards_for_profile(profile))
+        rows = [board async for board in boards.aiterator()]
+        return BoardListSerializer(rows, many=True).data
+
+    return await board_cache.aget_list(profile, build)
+
+
+@async_api_view
+async def board_detail(request, pk):
+    """
+    Async variant of the board detail of BoardsViewSet.
+
+    Access is checked against the cached board ACL before the board,
+    its members and its tasks are loaded.
+    """
+    acl = await board_access.aget_board_acl(pk)
+    if acl is None:
+        raise NotFound("No Board matches the given query.")
+
+    profile = await agetProfileForUser(request.user)
+    if profile is None or not acl.allows(profile.pk):
+        raise PermissionDenied()
+
+    board = await Board.objects.filter(pk=pk).afirst()
+    if board is None:
+        raise NotFound("No Board matches the given query.")
+
+    async def build():
+        if fast_serializers_enabled():
+            return await aboard_detail(board)
+        detail = await board_detail_queryset().aget(pk=pk)
+        return BoardDetailSerializer(detail).data
+
+    return await board_cache.aget_detail(board, build)
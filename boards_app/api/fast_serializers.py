@@ -0,0 +1,49 @@
+from auth_app.models import UserProfile
+from tasks_app.api.fast_serializers import (
+    afetch_values,
+    atask_rows,
+    profile_data,
+    task_rows,
+)
+from tasks_app.models import Task
+
+
+def member_values(board):
+    return UserProfile.objects.filter(board_members=board.pk).values_list(
+        "id", "user__email", "fullname"
+    )
+
+
+def board_detail_data(board, members, tasks) -> dict:
+    return {
+        "id": board.pk,
+        "title": board.title,
+        "members": [profile_data(*values) for values in members],
+        "owner_id": board.owner_id,
+        "tasks": [row.data for row in tasks],
+    }
+
+
+def board_detail(board) -> dict:
+    """
+    Render a board like BoardDetailSerializer from value rows.
+
+    Members and tasks are read with `values_list()` in one query each
+    and rendered without serializer instances. The board itself only
+    needs its own columns, without prefetches.
+    """
+    tasks = Task.objects.filter(board_id=board.pk)
+    return board_detail_data(
+        board, list(member_values(board)), task_rows(tasks, with_board=False)
+    )
+
+
+async def aboard_detail(board) -> dict:
+    """
+    Async variant of board_detail.
+    """
+    members = await afetch_values(member_values(board))
+    tasks = Task.objects.filter(board_id=board.pk)
+    return board_detail_data(
+        board, members, await atask_rows(tasks, with_board=False)
+    )
@@ -0,0 +1,163 @@
+from django.db.models import (
+    Count,
+    IntegerField,
+    OuterRef,
+    Prefetch,
+    Q,
+    QuerySet,
+    Subquery,
+)
+from django.db.models.functions import Coalesce
+
+from auth_app.api.serializers import UserProfileSerializer
+from auth_app.models import UserProfile
+from boards_app.changes import compacted_through, latest_seq
+from boards_app.models import Board, BoardChange
+from tasks_app.api.serializers import (
+    BoardTaskListSerializer,
+    CommentDetailSerializer,
+)
+from tasks_app.models import Comment, Task
+
+
+def boards_for_profile(profile) -> QuerySet[Board]:
+    """
+    Return all boards the given profile owns or is a member of.
+
+    Membership is resolved through a subquery on the members
+    through table instead of a join, so the result needs no
+    DISTINCT and can be aggregated without duplicated rows.
+    """
+    member_of = Board.members.through.objects.filter(
+        userprofile=profile
+    ).values("board_id")
+    return Board.objects.filter(Q(owner=profile) | Q(pk__in=member_of))
+
+
+def annotate_board_counters(queryset: QuerySet[Board]) -> QuerySet[Board]:
+    """
+    Annotate boards with the counters used by BoardListSerializer.
+
+    Ticket counters are conditional aggregates over a single join
+    on the tasks table, grouped by board. The member count comes
+    from a correlated subquery so the members join cannot multiply
+    the task rows. Everything is fetched in one query.
+    """
+    member_count = (
+        Board.members.through.objects.filter(board_id=OuterRef("pk"))
+        .order_by()
+        .values("board_id")
+        .annotate(total=Count("userprofile_id"))
+        .values("total")
+    )
+    return queryset.annotate(
+        member_count=Coalesce(
+            Subquery(member_count, output_field=IntegerField()), 0
+        ),
+        ticket_count=Count("tickets"),
+        tasks_to_do_count=Count(
+            "tickets", filter=Q(tickets__status=Task.Status.TODO)
+        ),
+        tasks_high_prio_count=Count(
+            "tickets", filter=Q(tickets__priority=Task.Priority.HIGH)
+        ),
+    )
+
+
+def board_detail_queryset() -> QuerySet[Board]:
+    """
+    Return boards prepared for rendering with BoardDetailSerializer.
+
+    Members are prefetched together with their users, and tasks are
+    prefetched with assignee and reviewer profiles and their users.
+    A board is therefore loaded with a fixed number of queries,
+    independent of its number of tasks.
+    """
+    members = UserProfile.objects.select_related("user")
+    tasks = Task.objects.select_related("assignee__user", "reviewer__user")
+    return Board.objects.prefetch_related(
+        Prefetch("members", queryset=members),
+        Prefetch("tickets", queryset=tasks),
+    )
+
+
+def collapse_changes(board_id, since, upto) -> dict:
+    """
+    Reduce the change log of a board to the final operation per object.
+
+    Returns a mapping of (kind, object_id) to the last recorded
+    operation between the two sequence numbers.
+    """
+    entries = (
+        BoardChange.objects.filter(
+            board_id=board_id, seq__gt=since, seq__lte=upto
+        )
+        .order_by("seq")
+        .values_list("kind", "object_id", "op")
+    )
+    return {(kind, object_id): op for kind, object_id, op in entries}
+
+
+def build_board_delta(board: Board, since: int) -> dict:
+    """
+    Build the compact delta of a board since a change log sequence.
+
+    Changed objects are sent once with their current data, deleted
+    objects only by ID. If the requested sequence is older than the
+    compacted part of the log, or newer than the log itself, only
+    `resync: true` is returned and the client must reload the board.
+    """
+    upto = latest_seq()
+    delta = {"board": board.pk, "since": since, "seq": upto}
+    if since < compacted_through() or since > upto:
+        return {**delta, "resync": True}
+
+    changes = collapse_changes(board.pk, since, upto)
+    upserts = {kind: set() for kind in BoardChange.Kind.values}
+    deleted = {kind: set() for kind in BoardChange.Kind.values}
+    for (kind, object_id), op in changes.items():
+        target = deleted if op == BoardChange.Operation.DELETE else upserts
+        target[kind].add(object_id)
+
+    board_data = None
+    if board.pk in upserts[BoardChange.Kind.BOARD]:
+        members = board.members.select_related("user")
+        board_data = {
+            "id": board.pk,
+            "title": board.title,
+            "owner_id": board.owner_id,
+            "members": UserProfileSerializer(members, many=True).data,
+        }
+
+    tasks = Task.objects.filter(
+        board=board, pk__in=upserts[BoardChange.Kind.TASK]
+    ).select_related("assignee__user", "reviewer__user")
+    tasks_data = BoardTaskListSerializer(tasks, many=True).data
+    # Tasks that are gone or were moved away count as deleted.
+    deleted[BoardChange.Kind.TASK] |= upserts[BoardChange.Kind.TASK] - {
+        task["id"] for task in tasks_data
+    }
+
+    comments = Comment.objects.filter(
+        task__board=board, pk__in=upserts[BoardChange.Kind.COMMENT]
+    ).select_related("author")
+    comments_data = [
+        {**CommentDetailSerializer(comment).data, "task": comment.task_id}
+        for comment in comments
+    ]
+    deleted[BoardChange.Kind.COMMENT] |= upserts[BoardChange.Kind.COMMENT] - {
+        comment["id"] for comment in comments_data
+    }
+
+    return {
+        **delta,
+        "resync": False,
+        "board_data": board_data,
+        "tasks": tasks_data,
+        "comments": comments_data,
+        "deleted": {
+            "board": board.pk in deleted[BoardChange.Kind.BOARD],
+            "tasks": sorted(deleted[BoardChange.Kind.TASK]),
+            "comments": sorted(deleted[BoardChange.Kind.COMMENT]),
+        },
+    }
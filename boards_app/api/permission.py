@@ -1,19 +1,37 @@
-from django.shortcuts import get_object_or_404
+from django.http import Http404
 from rest_framework.permissions import BasePermission
 
+from boards_app.access import board_access
 from tasks_app.models import Comment, Task
 
 
+def get_board_id(obj):
+    """
+    Resolve the board ID for a Board, Task or Comment instance.
+
+    Comments are resolved through the cached task-to-board mapping,
+    so the comment's task does not have to be loaded.
+    """
+    if isinstance(obj, Task):
+        return obj.board_id
+
+    if isinstance(obj, Comment):
+        return board_access.get_task_board_id(obj.task_id)
+
+    return obj.pk
+
+
 class IsBoardMemberOrOwner(BasePermission):
     """
     Custom permission to allow access only if the user is a board member or the
     board owner.
 
     This permission class checks both view-level and object-level access. At
-    the view level it obtains the task by its ID and verifies if the request
-    user belongs to the board's members or is the board owner. At the object
-    level, it handles Task and Comment objects and resolves the board to
-    perform the same membership and ownership checks.
+    the view level it resolves the task's board by the task ID and verifies if
+    the request user belongs to the board's members or is the board owner. At
+    the object level, it handles Task and Comment objects and resolves the
+    board to perform the same membership and ownership checks. Both levels
+    read the board's members and owner from the in-process board access cache.
     """
 
     def has_permission(self, request, view):
@@ -21,30 +39,15 @@ class IsBoardMemberOrOwner(BasePermission):
         if not task_id:
             return True
 
-        task = get_object_or_404(Task.objects.all(), pk=task_id)
+        board_id = board_access.get_task_board_id(task_id)
+        if board_id is None:
+            raise Http404("No Task matches the given query.")
 
-        board = task.board
-        user = request.user
-
-        is_member = board.members.filter(id=user.id).exists()
-        is_owner = board.owner_id == user.id
-
-        return is_member or is_owner
+        return board_access.has_access(board_id, request.user.id)
 
     def has_object_permission(self, request, view, obj):
-        user = request.user
-
-        if isinstance(obj, Task):
-            obj = obj.board
-
-        if isinstance(obj, Comment):
-            obj = obj.task.board
-
-        members = obj.members.all()
-        owner_id = obj.owner_id
-        is_member = members.filter(id=user.id).exists()
-        is_owner = owner_id == user.id
-        return is_member or is_owner
+        board_id = get_board_id(obj)
+        return board_access.has_access(board_id, request.user.id)
 
 
 class IsBoardOwner(BasePermission):
@@ -52,14 +55,11 @@ class IsBoardOwner(BasePermission):
     Custom permission to allow access only if the user is the board owner.
 
     This permission is determined at object level. For Task objects, it
-    resolves the board before checking ownership.
+    resolves the board's owner through the board access cache.
     """
 
     def has_object_permission(self, request, view, obj):
-        user = request.user
-
         if isinstance(obj, Task):
-            obj = obj.board
+            return board_access.is_owner(obj.board_id, request.user.id)
 
-        owner_id = obj.owner_id
-        return owner_id == user.id
+        return obj.owner_id == request.user.id
@@ -21,7 +21,7 @@ class BoardDetailSerializer(serializers.ModelSerializer):
     tasks = BoardTaskListSerializer(
         source="tickets", many=True, read_only=True
     )
-    owner_id = serializers.IntegerField(source="owner.id", read_only=True)
+    owner_id = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Board
@@ -52,13 +52,14 @@ class BoardListSerializer(serializers.ModelSerializer):
     Serializer for listing boards.
 
     Automatically sets the current authenticated user's profile
-    as the owner using a hidden default. Also provides a count of
-    members via a custom method field.
+    as the owner using a hidden default. The counters are read from
+    annotations provided by `annotate_board_counters` and only fall
+    back to per-board COUNT queries when an annotation is missing.
     """
 
     owner = serializers.HiddenField(default=CurrentUserProfileDefault())
     member_count = serializers.SerializerMethodField()
-    owner_id = serializers.IntegerField(source="owner.id", read_only=True)
+    owner_id = serializers.IntegerField(read_only=True)
     ticket_count = serializers.SerializerMethodField()
     tasks_to_do_count = serializers.SerializerMethodField()
     tasks_high_prio_count = serializers.SerializerMethodField()
@@ -79,15 +80,39 @@ class BoardListSerializer(serializers.ModelSerializer):
         extra_kwargs = {"members": {"write_only": True}}
 
     def get_member_count(self, obj):
-        return obj.members.count()
+        count = getattr(obj, "member_count", None)
+        if count is None:
+            count = obj.members.count()
+        return count
 
     def get_ticket_count(self, obj):
-        return obj.tickets.count()
+        count = getattr(obj, "ticket_count", None)
+        if count is None:
+            count = obj.tickets.count()
+        return count
 
     def get_tasks_to_do_count(self, obj):
-        tasks = obj.tickets.filter(status=Task.Status.TODO)
-        return tasks.count()
+        count = getattr(obj, "tasks_to_do_count", None)
+        if count is None:
+            tasks = obj.tickets.filter(status=Task.Status.TODO)
+            count = tasks.count()
+        return count
 
     def get_tasks_high_prio_count(self, obj):
-        tasks = obj.tickets.filter(priority=Task.Priority.HIGH)
-        return tasks.count()
+        count = getattr(obj, "tasks_high_prio_count", None)
+        if count is None:
+            tasks = obj.tickets.filter(priority=Task.Priority.HIGH)
+            count = tasks.count()
+        return count
+
+
+class BoardChangesQuerySerializer(serializers.Serializer):
+    """
+    Serializer for validating the query parameters of the board
+    changes endpoint.
+
+    `since` is the change log sequence number the client has last
+    seen, as returned in the `seq` field of a previous response.
+    """
+
+    since = serializers.IntegerField(min_value=0)
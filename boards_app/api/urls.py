@@ -1,8 +1,12 @@
+from django.urls import path
 from rest_framework import routers
 
 from boards_app.api.views import BoardsViewSet
+from boards_app.streams import events_require_asgi
 
 router = routers.SimpleRouter()
 router.register(r"", BoardsViewSet, basename="boards")
 
-urlpatterns = router.urls
+urlpatterns = [
+    path("<int:pk>/events/", events_require_asgi, name="board-events"),
+] + router.urls
@@ -1,24 +1,40 @@
-from django.db.models import Q, QuerySet
+from django.db.models import QuerySet
+from rest_framework import status
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
-from auth_app.models import UserProfile
+from auth_app.api.helpers import getProfileForRequest
+from boards_app.api.fast_serializers import board_detail
+from boards_app.api.helpers import (
+    annotate_board_counters,
+    board_detail_queryset,
+    boards_for_profile,
+    build_board_delta,
+)
 from boards_app.api.permission import IsBoardMemberOrOwner, IsBoardOwner
 from boards_app.api.serializers import (
+    BoardChangesQuerySerializer,
     BoardDetailSerializer,
     BoardListSerializer,
     UpdateBoardSerializer,
 )
 from boards_app.models import Board
+from boards_app.response_cache import board_cache
+from core.conditional import conditional_response, request_etag
+from core.write_queue import QueuedWritesMixin
+from tasks_app.api.fast_serializers import fast_serializers_enabled
 
 
-class BoardsViewSet(ModelViewSet):
+class BoardsViewSet(QueuedWritesMixin, ModelViewSet):
     """
     ViewSet for Board objects that handles permissions, queryset filtering,
     and serializer selection based on the action being performed.
 
     Uses custom permissions to ensure that only board members or the board
-    owner have access, and only the board owner can delete.
+    owner have access, and only the board owner can delete. Writes go
+    through the write queue when it is enabled.
     """
 
     permission_classes = [IsAuthenticated & IsBoardMemberOrOwner]
@@ -37,12 +53,86 @@ class BoardsViewSet(ModelViewSet):
         return BoardDetailSerializer
 
     def get_queryset(self) -> QuerySet[Board]:
-        if self.action == "list":
-            user = self.request.user
-            profile = UserProfile.objects.filter(user=user).first()
+        if self.action in ("list", "create"):
+            profile = getProfileForRequest(self.request)
             # Only return boards where the profile is owner or member
-            return Board.objects.filter(
-                Q(owner=profile) | Q(members=profile)
-            ).distinct()
+            return annotate_board_counters(boards_for_profile(profile))
 
         return Board.objects.all()
+
+    def list(self, request, *args, **kwargs):
+        """
+        Return the boards of the user with their counters.
+
+        Served from the board response cache while none of the boards
+        changed. The ETag is the cache key, so clients holding the
+        current list get a 304.
+        """
+        profile = getProfileForRequest(request)
+        versions = list(board_cache.board_versions(profile))
+        return conditional_response(
+            request,
+            request_etag(request, board_cache.list_key(versions)),
+            lambda: Response(
+                board_cache.get_list(profile, self.build_list, versions)
+            ),
+        )
+
+    def build_list(self):
+        boards = self.filter_queryset(self.get_queryset())
+        return self.get_serializer(boards, many=True).data
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Return the board with its members and tasks.
+
+        Served from the board response cache while the board's version
+        is unchanged. With FAST_SERIALIZERS the members and tasks are
+        rendered from value rows instead of through
+        BoardDetailSerializer. The board's version is the ETag, so
+        clients holding the current board get a 304.
+        """
+        board = self.get_object()
+        return conditional_response(
+            request,
+            request_etag(request, board.pk, board.version),
+            lambda: Response(
+                board_cache.get_detail(board, lambda: self.build_detail(board))
+            ),
+        )
+
+    def build_detail(self, board):
+        if fast_serializers_enabled():
+            return board_detail(board)
+        board = board_detail_queryset().get(pk=board.pk)
+        return self.get_serializer(board).data
+
+    def create(self, request, *args, **kwargs):
+        """
+        Create a board and respond with its annotated counters.
+
+        The new board is re-read through the annotated list queryset,
+        so the response is rendered without per-counter queries.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        self.perform_create(serializer)
+
+        board = self.get_queryset().get(pk=serializer.instance.pk)
+        data = self.get_serializer(board).data
+        headers = self.get_success_headers(data)
+        return Response(data, status=status.HTTP_201_CREATED, headers=headers)
+
+    @action(detail=True, methods=["get"])
+    def changes(self, request, *args, **kwargs):
+        """
+        Return what changed on the board since a change log sequence.
+
+        Clients pass the `seq` of their last response as `since` and
+        apply the returned delta instead of reloading the whole board.
+        """
+        query = BoardChangesQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        board = self.get_object()
+        since = query.validated_data["since"]  # type: ignore
+        return Response(build_board_delta(board, since))
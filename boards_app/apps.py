@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class BoardsAppConfig(AppConfig):
     name = "boards_app"
+
+    def ready(self):
+        from boards_app import signals  # noqa: F401
@@ -0,0 +1,136 @@
+import logging
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connections, models, transaction
+from django.db.models import F, Max
+from django.utils import timezone
+
+from boards_app.events import publish_changes
+from boards_app.models import Board, BoardChange, ChangeLogWatermark
+
+logger = logging.getLogger(__name__)
+
+_config = getattr(settings, "CHANGE_LOG", {})
+RETENTION = timedelta(seconds=_config.get("RETENTION", 7 * 24 * 3600))
+COMPACT_INTERVAL = _config.get("COMPACT_INTERVAL", 3600)
+
+_compaction_lock = threading.Lock()
+_last_compaction = time.monotonic()
+
+
+def bump_board_versions(boards) -> None:
+    """
+    Increment the version of the given boards, a board ID or a
+    queryset of boards.
+
+    Runs in the caller's transaction, so the new version becomes
+    visible together with the write that caused it.
+    """
+    if not isinstance(boards, models.QuerySet):
+        boards = Board.objects.filter(pk=boards)
+    boards.update(version=F("version") + 1)
+
+
+def record_change(board_id, kind, object_id, op) -> None:
+    """
+    Append a single entry to the change log of a board and bump the
+    board's version.
+    """
+    entry = BoardChange.objects.create(
+        board_id=board_id, kind=kind, object_id=object_id, op=op
+    )
+    bump_board_versions(board_id)
+    publish_changes([entry])
+    maybe_compact_in_background()
+
+
+def record_changes(board_id, kind, object_ids, op) -> None:
+    """
+    Append one entry per object ID with a single bulk insert and bump
+    the board's version once.
+
+    Used by write paths that bypass model signals, such as
+    `bulk_create`.
+    """
+    entries = BoardChange.objects.bulk_create(
+        BoardChange(board_id=board_id, kind=kind, object_id=object_id, op=op)
+        for object_id in object_ids
+    )
+    if entries:
+        bump_board_versions(board_id)
+    publish_changes(entries)
+    maybe_compact_in_background()
+
+
+def latest_seq() -> int:
+    """
+    Return the highest sequence number ever recorded.
+
+    Falls back to the compaction watermark when the log is empty.
+    """
+    seq = BoardChange.objects.aggregate(seq=Max("seq"))["seq"]
+    return seq if seq is not None else compacted_through()
+
+
+def compacted_through() -> int:
+    watermark = ChangeLogWatermark.objects.filter(pk=1).first()
+    return watermark.compacted_through if watermark else 0
+
+
+def compact_change_log(retention: timedelta = RETENTION) -> int:
+    """
+    Remove change log entries older than the retention window.
+
+    The highest removed sequence number is stored as the watermark,
+    so clients asking for older changes are told to resync. Returns
+    the number of removed entries.
+    """
+    cutoff = timezone.now() - retention
+    with transaction.atomic():
+        upper = BoardChange.objects.filter(created_at__lt=cutoff).aggregate(
+            seq=Max("seq")
+        )["seq"]
+        if upper is None:
+            return 0
+
+        deleted, _ = BoardChange.objects.filter(seq__lte=upper).delete()
+        watermark, _ = ChangeLogWatermark.objects.get_or_create(pk=1)
+        if upper > watermark.compacted_through:
+            watermark.compacted_through = upper
+            watermark.save(update_fields=["compacted_through"])
+    return deleted
+
+
+def _compact_worker() -> None:
+    try:
+        removed = compact_change_log()
+        logger.info("Compacted %d change log entries.", removed)
+    except Exception:
+        logger.exception("Change log compaction failed.")
+    finally:
+        connections.close_all()
+        _compaction_lock.release()
+
+
+def maybe_compact_in_background() -> None:
+    """
+    Start a compaction thread if the compaction interval has passed.
+
+    At most one compaction runs per process at a time. Set
+    CHANGE_LOG["COMPACT_INTERVAL"] to None to disable background
+    compaction and run `manage.py compact_change_log` instead.
+    """
+    global _last_compaction
+
+    if not COMPACT_INTERVAL:
+        return
+    if time.monotonic() - _last_compaction < COMPACT_INTERVAL:
+        return
+    if not _compaction_lock.acquire(blocking=False):
+        return
+
+    _last_compaction = time.monotonic()
+    threading.Thread(target=_compact_worker, daemon=True).start()
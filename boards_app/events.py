@@ -0,0 +1,171 @@
+import asyncio
+import threading
+from collections import defaultdict
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+_config = getattr(settings, "BOARD_EVENTS", {})
+QUEUE_SIZE = _config.get("QUEUE_SIZE", 100)
+POLL_INTERVAL = _config.get("POLL_INTERVAL", 1.0)
+
+# Sent to a subscriber whose queue overflowed. The client has missed
+# events and must fetch the board changes since its last sequence.
+OVERFLOW = {"type": "overflow"}
+
+
+class Subscription:
+    """
+    A single subscriber to the events of one board.
+
+    Events are delivered through a bounded asyncio queue owned by the
+    subscriber's event loop. Publishing never blocks: when the queue
+    is full the subscriber gets a single overflow event instead.
+    """
+
+    def __init__(self, board_id, loop, queue_size: int = QUEUE_SIZE):
+        self.board_id = board_id
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.overflowed = False
+
+    def deliver(self, event) -> None:
+        """
+        Put an event into the queue. Must run on the subscriber's loop.
+        """
+        if self.overflowed:
+            return
+        if self.queue.full():
+            self.overflowed = True
+            self.queue.get_nowait()
+            event = OVERFLOW
+        self.queue.put_nowait(event)
+
+    def deliver_threadsafe(self, event) -> None:
+        self.loop.call_soon_threadsafe(self.deliver, event)
+
+    async def get(self):
+        event = await self.queue.get()
+        if event is OVERFLOW:
+            self.overflowed = False
+        return event
+
+
+class InProcessBackend:
+    """
+    Pub/sub backend delivering events to subscribers of this process.
+
+    Suitable for a single worker. Publishing is thread-safe, so model
+    signal handlers running in request threads can publish directly
+    into the event loops serving the subscribers.
+    """
+
+    def __init__(self):
+        self._subscriptions = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, board_id) -> Subscription:
+        subscription = Subscription(board_id, asyncio.get_running_loop())
+        with self._lock:
+            self._subscriptions[board_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscriptions.get(subscription.board_id)
+            if subscribers is None:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscriptions[subscription.board_id]
+
+    def publish(self, board_id, event) -> None:
+        self.fan_out(board_id, event)
+
+    def fan_out(self, board_id, event) -> None:
+        with self._lock:
+            subscribers = list(self._subscriptions.get(board_id, ()))
+        for subscription in subscribers:
+            subscription.deliver_threadsafe(event)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subs) for subs in self._subscriptions.values())
+
+
+class ChangeLogBackend(InProcessBackend):
+    """
+    Pub/sub backend using the board change log as a shared broker.
+
+    Intended for deployments with several worker processes. Instead of
+    publishing in-process, every worker polls the BoardChange table
+    for new entries in one background task and fans them out to its
+    local subscribers, so events written by any worker reach all of
+    them without an external broker.
+    """
+
+    def __init__(self, poll_interval: float = POLL_INTERVAL):
+        super().__init__()
+        self.poll_interval = poll_interval
+        self._poller = None
+
+    def subscribe(self, board_id) -> Subscription:
+        subscription = super().subscribe(board_id)
+        if self._poller is None or self._poller.done():
+            self._poller = asyncio.get_running_loop().create_task(self.poll())
+        return subscription
+
+    def publish(self, board_id, event) -> None:
+        # The change log entry itself is the published message.
+        pass
+
+    async def poll(self) -> None:
+        from boards_app.changes import latest_seq
+        from boards_app.models import BoardChange
+
+        last_seq = await sync_to_async(latest_seq)()
+        while self.subscriber_count():
+            await asyncio.sleep(self.poll_interval)
+            entries = await sync_to_async(list)(
+                BoardChange.objects.filter(seq__gt=last_seq).order_by("seq")
+            )
+            for entry in entries:
+                last_seq = entry.seq
+                self.fan_out(entry.board_id, change_event(entry))
+
+
+def change_event(entry) -> dict:
+    """
+    Return the event published for a BoardChange entry.
+    """
+    return {
+        "type": "change",
+        "seq": entry.seq,
+        "kind": entry.kind,
+        "id": entry.object_id,
+        "op": entry.op,
+    }
+
+
+def publish_changes(entries) -> None:
+    """
+    Publish change log entries once the current transaction commits.
+
+    Subscribers therefore never see events for rolled back writes.
+    """
+    entries = list(entries)
+    if not entries:
+        return
+
+    def publish():
+        for entry in entries:
+            hub.publish(entry.board_id, change_event(entry))
+
+    transaction.on_commit(publish)
+
+
+hub = import_string(
+    _config.get("BACKEND", "boards_app.events.InProcessBackend")
+)()
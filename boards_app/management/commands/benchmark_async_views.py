@@ -0,0 +1,209 @@
+import asyncio
+import datetime
+import io
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.core.wsgi import get_wsgi_application
+from rest_framework.authtoken.models import Token
+
+from auth_app.models import UserProfile
+from boards_app.models import Board, BoardChange
+from core.benchmark import summarize
+from tasks_app.models import Comment, Task
+
+MODES = ("wsgi", "asgi-sync", "asgi-async")
+
+
+class Command(BaseCommand):
+    """
+    Compare the sync and async read endpoints under concurrency.
+
+    Runs the board list, board detail, assigned-to-me, reviewing and
+    comment list endpoints with a fixed number of concurrent clients
+    in three modes: the sync views through the WSGI application on a
+    thread pool (like a threaded WSGI server), the sync views through
+    the ASGI application, and the async views under /api/async/
+    through the ASGI application. Reports throughput, latency
+    percentiles and the peak number of threads per mode. The
+    temporary user and board are deleted at the end.
+    """
+
+    help = "Benchmark sync vs async read views under WSGI and ASGI."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=2_000)
+        parser.add_argument("--concurrency", type=int, default=50)
+        parser.add_argument("--tasks", type=int, default=50)
+        parser.add_argument(
+            "--mode", choices=MODES, action="append", dest="modes"
+        )
+
+    def handle(self, *args, **options):
+        user = User.objects.create(
+            username="async-benchmark@example.com",
+            email="async-benchmark@example.com",
+        )
+        board = None
+        try:
+            board, token, task = self.create_data(user, options["tasks"])
+            paths = [
+                "/boards/",
+                f"/boards/{board.pk}/",
+                "/tasks/assigned-to-me/",
+                "/tasks/reviewing/",
+                f"/tasks/{task.pk}/comments/",
+            ]
+            for mode in options["modes"] or MODES:
+                self.run_mode(
+                    mode,
+                    paths,
+                    token.key,
+                    options["requests"],
+                    options["concurrency"],
+                )
+        finally:
+            user.delete()
+            if board is not None:
+                BoardChange.objects.filter(board_id=board.pk).delete()
+
+    def create_data(self, user, task_count):
+        profile = UserProfile.objects.create(user=user, fullname="Bench Mark")
+        token = Token.objects.create(user=user)
+        board = Board.objects.create(owner=profile, title="Async benchmark")
+        board.members.add(profile)
+        tasks = Task.objects.bulk_create(
+            Task(
+                board=board,
+                creator=profile,
+                title=f"Task {i}",
+                assignee=profile,
+                reviewer=profile,
+                due_date=datetime.date(2026, 1, 1) + datetime.timedelta(i),
+                comments_count=10 if i == 0 else 0,
+            )
+            for i in range(task_count)
+        )
+        Comment.objects.bulk_create(
+            Comment(task=tasks[0], author=profile, content=f"Comment {i}")
+            for i in range(10)
+        )
+        return board, token, tasks[0]
+
+    def run_mode(self, mode, paths, token, total, concurrency):
+        prefix = "/api/async" if mode == "asgi-async" else "/api"
+        urls = [prefix + path for path in paths]
+        self.peak_threads = threading.active_count()
+
+        started = time.perf_counter()
+        if mode == "wsgi":
+            durations = self.run_wsgi(urls, token, total, concurrency)
+        else:
+            durations = asyncio.run(
+                self.run_asgi(urls, token, total, concurrency)
+            )
+        elapsed = time.perf_counter() - started
+
+        stats = summarize(durations)
+        self.stdout.write(
+            f"{mode}: {len(durations) / elapsed:.0f} req/s, "
+            f"p50 {stats['p50_ms']:.1f} ms, p99 {stats['p99_ms']:.1f} ms, "
+            f"peak threads {self.peak_threads}"
+        )
+
+    def track_threads(self):
+        self.peak_threads = max(self.peak_threads, threading.active_count())
+
+    def run_wsgi(self, urls, token, total, concurrency):
+        application = get_wsgi_application()
+
+        def request(index):
+            environ = {
+                "REQUEST_METHOD": "GET",
+                "PATH_INFO": urls[index % len(urls)],
+                "QUERY_STRING": "",
+                "SERVER_NAME": "localhost",
+                "SERVER_PORT": "80",
+                "SERVER_PROTOCOL": "HTTP/1.1",
+                "HTTP_HOST": "localhost",
+                "HTTP_AUTHORIZATION": f"Token {token}",
+                "wsgi.url_scheme": "http",
+                "wsgi.input": io.BytesIO(),
+                "wsgi.errors": sys.stderr,
+            }
+            statuses = []
+            started = time.perf_counter()
+            response = application(
+                environ, lambda status, headers: statuses.append(status)
+            )
+            b"".join(response)
+            response.close()
+            duration = time.perf_counter() - started
+            self.track_threads()
+            if not statuses[0].startswith("200"):
+                raise RuntimeError(f"{environ['PATH_INFO']}: {statuses[0]}")
+            return duration
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            return list(pool.map(request, range(total)))
+
+    async def run_asgi(self, urls, token, total, concurrency):
+        from core.asgi import application
+
+        durations = []
+        counter = iter(range(total))
+
+        async def request(path):
+            status = None
+            done = asyncio.Event()
+            sent = False
+
+            async def receive():
+                nonlocal sent
+                if not sent:
+                    sent = True
+                    return {"type": "http.request", "body": b""}
+                await done.wait()
+                return {"type": "http.disconnect"}
+
+            async def send(message):
+                nonlocal status
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+                elif not message.get("more_body"):
+                    done.set()
+
+            scope = {
+                "type": "http",
+                "asgi": {"version": "3.0"},
+                "http_version": "1.1",
+                "method": "GET",
+                "scheme": "http",
+                "path": path,
+                "raw_path": path.encode(),
+                "query_string": b"",
+                "root_path": "",
+                "headers": [
+                    (b"host", b"localhost"),
+                    (b"authorization", f"Token {token}".encode()),
+                ],
+                "client": ("127.0.0.1", 0),
+                "server": ("localhost", 80),
+            }
+            started = time.perf_counter()
+            await application(scope, receive, send)
+            durations.append(time.perf_counter() - started)
+            self.track_threads()
+            if status != 200:
+                raise RuntimeError(f"{path}: {status}")
+
+        async def client():
+            for index in counter:
+                await request(urls[index % len(urls)])
+
+        await asyncio.gather(*(client() for _ in range(concurrency)))
+        return durations
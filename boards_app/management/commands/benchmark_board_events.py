@@ -0,0 +1,190 @@
+import asyncio
+import gc
+import threading
+import time
+import tracemalloc
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.authtoken.models import Token
+
+from auth_app.models import UserProfile
+from boards_app.changes import record_change
+from boards_app.events import hub
+from boards_app.models import Board, BoardChange
+from core.benchmark import summarize
+
+
+class Subscriber:
+    """
+    A fake SSE client speaking ASGI to the Django application.
+    """
+
+    def __init__(self, application, path, token):
+        self.application = application
+        self.scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": b"",
+            "root_path": "",
+            "headers": [
+                (b"host", b"localhost"),
+                (b"accept", b"text/event-stream"),
+                (b"authorization", f"Token {token}".encode()),
+            ],
+            "client": ("127.0.0.1", 0),
+            "server": ("localhost", 80),
+        }
+        self.status = None
+        self.ready = asyncio.Event()
+        self.disconnected = asyncio.Event()
+        self.received = 0
+        self.sent_request = False
+        self.last_event_at = None
+
+    async def receive(self):
+        if not self.sent_request:
+            self.sent_request = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await self.disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(self, message):
+        if message["type"] == "http.response.start":
+            self.status = message["status"]
+            if self.status != 200:
+                self.ready.set()
+        elif message["type"] == "http.response.body":
+            body = message.get("body", b"")
+            if b"event: ready" in body:
+                self.ready.set()
+            count = body.count(b"event: change")
+            if count:
+                self.received += count
+                self.last_event_at = time.perf_counter()
+
+    def run(self):
+        return asyncio.create_task(
+            self.application(self.scope, self.receive, self.send)
+        )
+
+
+class Command(BaseCommand):
+    """
+    Load test the board event stream.
+
+    Opens many concurrent SSE connections against the project's ASGI
+    application in a single event loop, then reports the number of
+    open subscriptions, the threads in use, the traced memory per
+    subscriber and the fan-out latency of board changes written from
+    a request thread. The temporary user and board are deleted at
+    the end.
+    """
+
+    help = "Benchmark memory and fan-out of board event streams."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--subscribers", type=int, default=2_000)
+        parser.add_argument("--events", type=int, default=50)
+
+    def handle(self, *args, **options):
+        user = User.objects.create(
+            username="events-benchmark@example.com",
+            email="events-benchmark@example.com",
+        )
+        board = None
+        try:
+            profile = UserProfile.objects.create(
+                user=user, fullname="Bench Mark"
+            )
+            token = Token.objects.create(user=user)
+            board = Board.objects.create(
+                owner=profile, title="Events benchmark"
+            )
+            asyncio.run(
+                self.run(
+                    board, token.key, options["subscribers"], options["events"]
+                )
+            )
+        finally:
+            user.delete()
+            if board is not None:
+                BoardChange.objects.filter(board_id=board.pk).delete()
+
+    async def run(self, board, token, count, events):
+        from core.asgi import application
+
+        path = f"/api/boards/{board.pk}/events/"
+
+        gc.collect()
+        tracemalloc.start()
+        baseline, _ = tracemalloc.get_traced_memory()
+        started = time.perf_counter()
+
+        subscribers = [
+            Subscriber(application, path, token) for _ in range(count)
+        ]
+        tasks = [subscriber.run() for subscriber in subscribers]
+        await asyncio.gather(*(s.ready.wait() for s in subscribers))
+        connect_seconds = time.perf_counter() - started
+
+        failed = sum(1 for s in subscribers if s.status != 200)
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        per_subscriber = (current - baseline) / count
+
+        self.stdout.write(
+            f"{count} connections opened in {connect_seconds:.2f} s, "
+            f"{failed} failed"
+        )
+        self.stdout.write(
+            f"open subscriptions: {hub.subscriber_count()}, "
+            f"threads: {threading.active_count()}"
+        )
+        self.stdout.write(
+            f"memory: {per_subscriber / 1024:.1f} KiB per subscriber, "
+            f"{(current - baseline) / 2**20:.1f} MiB total, "
+            f"peak {peak / 2**20:.1f} MiB"
+        )
+
+        latencies = await self.publish(board, subscribers, events)
+        stats = summarize(latencies)
+        self.stdout.write(
+            f"fan-out of {events} events to {count} subscribers: "
+            f"p50 {stats['p50_ms']:.1f} ms, p99 {stats['p99_ms']:.1f} ms"
+        )
+
+        for subscriber in subscribers:
+            subscriber.disconnected.set()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.stdout.write(
+            f"open subscriptions after disconnect: {hub.subscriber_count()}"
+        )
+
+    async def publish(self, board, subscribers, events):
+        """
+        Write one change per event and measure the time until every
+        subscriber has received it.
+        """
+
+        def write_change():
+            with transaction.atomic():
+                record_change(board.pk, "board", board.pk, "update")
+
+        latencies = []
+        for expected in range(1, events + 1):
+            started = time.perf_counter()
+            await sync_to_async(write_change)()
+            while any(s.received < expected for s in subscribers):
+                await asyncio.sleep(0.0005)
+            finished = max(s.last_event_at for s in subscribers)
+            latencies.append(finished - started)
+        return latencies
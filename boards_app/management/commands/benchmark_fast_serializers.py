@@ -0,0 +1,114 @@
+import datetime
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from auth_app.models import UserProfile
+from boards_app.api.fast_serializers import board_detail
+from boards_app.api.helpers import board_detail_queryset
+from boards_app.api.serializers import BoardDetailSerializer
+from boards_app.models import Board
+from core.benchmark import summarize, time_calls
+from tasks_app.api.fast_serializers import task_rows
+from tasks_app.api.serializers import TaskListSerializer
+from tasks_app.models import Task
+
+
+class Command(BaseCommand):
+    """
+    Compare the DRF serializers with the fast-path rendering.
+
+    Renders the detail of a board and the assigned-to-me task list of
+    its owner to JSON bytes, once through BoardDetailSerializer and
+    TaskListSerializer and once from value rows, including the
+    queries. Fails if the two outputs differ. The temporary board is
+    created inside a transaction that is rolled back at the end.
+    """
+
+    help = "Benchmark the fast-path serializers against DRF."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tasks", type=int, default=5_000)
+        parser.add_argument("--iterations", type=int, default=20)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            board, owner = self.create_board(options["tasks"])
+            renderer = JSONRenderer()
+            tasks = (
+                Task.objects.filter(assignee=owner)
+                .select_related("assignee__user", "reviewer__user")
+                .order_by("due_date", "id")
+            )
+
+            self.compare(
+                "board detail",
+                lambda: renderer.render(
+                    BoardDetailSerializer(
+                        board_detail_queryset().get(pk=board.pk)
+                    ).data
+                ),
+                lambda: renderer.render(
+                    board_detail(Board.objects.get(pk=board.pk))
+                ),
+                options["iterations"],
+            )
+            self.compare(
+                "assigned-to-me",
+                lambda: renderer.render(
+                    TaskListSerializer(tasks, many=True).data
+                ),
+                lambda: renderer.render(
+                    [row.data for row in task_rows(tasks)]
+                ),
+                options["iterations"],
+            )
+            transaction.set_rollback(True)
+
+    def create_board(self, task_count):
+        profiles = [
+            UserProfile.objects.create(
+                user=User.objects.create(
+                    username=f"fast-{i}@example.com",
+                    email=f"fast-{i}@example.com",
+                ),
+                fullname=f"Fast Serializer {i}",
+            )
+            for i in range(5)
+        ]
+        owner = profiles[0]
+        board = Board.objects.create(owner=owner, title="Fast serializers")
+        board.members.add(*profiles)
+        Task.objects.bulk_create(
+            Task(
+                board=board,
+                creator=owner,
+                title=f"Task {i}",
+                description="Benchmark task " * (i % 5),
+                status=Task.Status.values[i % 4],
+                priority=Task.Priority.values[i % 3],
+                assignee=owner if i % 3 else profiles[i % 5],
+                reviewer=profiles[i % 5] if i % 2 else None,
+                due_date=datetime.date(2026, 1, 1)
+                + datetime.timedelta(i % 365),
+                comments_count=i % 7,
+            )
+            for i in range(task_count)
+        )
+        return board, owner
+
+    def compare(self, label, serializer, fast, iterations):
+        if serializer() != fast():
+            raise CommandError(f"{label}: the outputs differ.")
+
+        slow_stats = summarize(time_calls(serializer, iterations))
+        fast_stats = summarize(time_calls(fast, iterations))
+        self.stdout.write(
+            f"{label}: serializer p50 {slow_stats['p50_ms']:.1f} ms, "
+            f"p99 {slow_stats['p99_ms']:.1f} ms; "
+            f"fast p50 {fast_stats['p50_ms']:.1f} ms, "
+            f"p99 {fast_stats['p99_ms']:.1f} ms; "
+            f"{slow_stats['p50_ms'] / fast_stats['p50_ms']:.1f}x faster"
+        )
@@ -0,0 +1,28 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from boards_app.changes import RETENTION, compact_change_log
+
+
+class Command(BaseCommand):
+    """
+    Remove board change log entries older than the retention window.
+
+    Complements the background compaction for deployments that prefer
+    to run it from cron.
+    """
+
+    help = "Compact the board change log."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--retention",
+            type=int,
+            default=int(RETENTION.total_seconds()),
+            help="Retention window in seconds.",
+        )
+
+    def handle(self, *args, **options):
+        removed = compact_change_log(timedelta(seconds=options["retention"]))
+        self.stdout.write(f"Removed {removed} change log entries.")
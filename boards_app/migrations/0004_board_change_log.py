@@ -0,0 +1,34 @@
+# Generated by Django 6.0 on 2026-10-18 20:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0003_alter_board_members'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeLogWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('compacted_through', models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='BoardChange',
+            fields=[
+                ('seq', models.BigAutoField(primary_key=True, serialize=False)),
+                ('board_id', models.PositiveBigIntegerField()),
+                ('kind', models.CharField(choices=[('board', 'Board'), ('task', 'Task'), ('comment', 'Comment')], max_length=7)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('op', models.CharField(choices=[('insert', 'Insert'), ('update', 'Update'), ('delete', 'Delete')], max_length=6)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['board_id', 'seq'], name='boardchange_board_seq_idx')],
+            },
+        ),
+    ]
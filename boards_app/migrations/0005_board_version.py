@@ -0,0 +1,18 @@
+# Generated by Django 6.1.2 on 2026-10-18 21:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0004_board_change_log'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='board',
+            name='version',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.1.2 on 2026-10-18 22:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0005_board_version'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='board',
+            name='version',
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -9,7 +9,10 @@ class Board(models.Model):
 
     A Board is owned by a single UserProfile and can have multiple
     UserProfile members associated with it. Boards also have a title
-    to identify them.
+    to identify them. `version` is bumped by every write to the board,
+    its members, tasks or comments and keys the response cache. It is
+    only changed in the database by bump_board_versions, never written
+    back from an instance.
     """
 
     owner = models.ForeignKey(
@@ -22,6 +25,80 @@ class Board(models.Model):
         related_name="board_members",
     )
     title = models.CharField(max_length=254)
+    version = models.PositiveBigIntegerField(default=0, editable=False)
 
     def __str__(self):
         return self.title
+
+    def save(self, *args, **kwargs):
+        """
+        Save the board without `version` on updates.
+
+        Writing back the version an instance was loaded with would let
+        a stale instance reset it, so that two different states of the
+        board end up with the same version after the bump.
+        """
+        if not self._state.adding and not kwargs.get("force_insert"):
+            update_fields = kwargs.get("update_fields")
+            if update_fields is None:
+                update_fields = [
+                    field.name
+                    for field in self._meta.concrete_fields
+                    if not field.primary_key
+                ]
+            kwargs["update_fields"] = [
+                name for name in update_fields if name != "version"
+            ]
+        super().save(*args, **kwargs)
+
+
+class BoardChange(models.Model):
+    """
+    Append-only log entry describing a change on a board.
+
+    Every insert, update or delete of a Board, Task or Comment is
+    recorded with a monotonically increasing sequence number. Entries
+    keep plain IDs instead of foreign keys so that they outlive the
+    changed objects. Old entries are removed by compaction.
+    """
+
+    class Kind(models.TextChoices):
+        BOARD = "board", "Board"
+        TASK = "task", "Task"
+        COMMENT = "comment", "Comment"
+
+    class Operation(models.TextChoices):
+        INSERT = "insert", "Insert"
+        UPDATE = "update", "Update"
+        DELETE = "delete", "Delete"
+
+    seq = models.BigAutoField(primary_key=True)
+    board_id = models.PositiveBigIntegerField()
+    kind = models.CharField(max_length=7, choices=Kind.choices)
+    object_id = models.PositiveBigIntegerField()
+    op = models.CharField(max_length=6, choices=Operation.choices)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["board_id", "seq"], name="boardchange_board_seq_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"#{self.seq} {self.op} {self.kind} {self.object_id}"
+
+
+class ChangeLogWatermark(models.Model):
+    """
+    Highest sequence number removed from the change log by compaction.
+
+    Clients that ask for changes since an older sequence number must
+    do a full resync. The table holds a single row.
+    """
+
+    compacted_through = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self):
+        return f"Compacted through #{self.compacted_through}"
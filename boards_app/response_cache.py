@@ -0,0 +1,200 @@
+import hashlib
+import threading
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+
+from boards_app.api.helpers import boards_for_profile
+from boards_app.models import Board
+
+_config = getattr(settings, "BOARD_RESPONSE_CACHE", {})
+_MISSING = object()
+MISS, HIT, DISCARDED = range(3)
+
+
+class BoardResponseCache:
+    """
+    Cache of board list and board detail payloads.
+
+    Keys contain the version of every board a payload is built from:
+    the board's version for a detail, and a hash of the (ID, version)
+    pairs of all boards visible to the user for a list. Every write to
+    a board, its members, tasks or comments bumps the board's version
+    in the writing transaction (see `boards_app.changes`), so once the
+    write is committed the key changes and readers miss instead of
+    getting the old payload. Entries of old versions are simply never
+    read again and expire with the cache timeout.
+
+    A freshly built payload is only stored if the versions read again
+    afterwards still produce the same key, so a write committed while
+    the payload was built cannot leave its result under the old key.
+    Requests inside an atomic block bypass the cache, as they may see
+    versions of writes that are not committed yet.
+    """
+
+    kinds = ("list", "detail")
+
+    def __init__(self, enabled: bool, alias: str, timeout: float):
+        self.enabled = enabled
+        self.alias = alias
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._counts = {kind: [0, 0, 0] for kind in self.kinds}
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def detail_key(self, board_id, version) -> str:
+        return f"board-detail:{board_id}:{version}"
+
+    def list_key(self, versions) -> str:
+        pairs = ",".join(f"{pk}:{version}" for pk, version in versions)
+        return f"board-list:{hashlib.sha1(pairs.encode()).hexdigest()}"
+
+    def board_versions(self, profile):
+        return (
+            boards_for_profile(profile)
+            .order_by("pk")
+            .values_list("pk", "version")
+        )
+
+    def board_version(self, board_id):
+        return (
+            Board.objects.filter(pk=board_id)
+            .values_list("version", flat=True)
+            .first()
+        )
+
+    def get_detail(self, board, build):
+        """
+        Return the detail payload of a loaded board, calling build()
+        on a miss.
+        """
+        return self.fetch(
+            "detail",
+            self.detail_key(board.pk, board.version),
+            lambda: self.detail_key(board.pk, self.board_version(board.pk)),
+            build,
+        )
+
+    def get_list(self, profile, build, versions=None):
+        """
+        Return the board list payload of a profile, calling build()
+        on a miss. `versions` are the profile's board versions if the
+        caller has already read them.
+        """
+
+        def current_key():
+            return self.list_key(self.board_versions(profile))
+
+        if not self.usable():
+            return build()
+        key = current_key() if versions is None else self.list_key(versions)
+        return self.fetch("list", key, current_key, build)
+
+    async def aget_detail(self, board, build):
+        """
+        Async variant of get_detail, build is a coroutine function.
+        """
+
+        async def current_key():
+            version = await sync_to_async(self.board_version)(board.pk)
+            return self.detail_key(board.pk, version)
+
+        return await self.afetch(
+            "detail",
+            self.detail_key(board.pk, board.version),
+            current_key,
+            build,
+        )
+
+    async def aget_list(self, profile, build):
+        """
+        Async variant of get_list, build is a coroutine function.
+        """
+
+        async def current_key():
+            versions = await sync_to_async(list)(self.board_versions(profile))
+            return self.list_key(versions)
+
+        return await self.afetch(
+            "list", await current_key(), current_key, build
+        )
+
+    def usable(self) -> bool:
+        return self.enabled and not connection.in_atomic_block
+
+    def fetch(self, kind, key, current_key, build):
+        if not self.usable():
+            return build()
+        data = self.cache.get(key, _MISSING)
+        if data is not _MISSING:
+            self.count(kind, HIT)
+            return data
+
+        self.count(kind, MISS)
+        data = build()
+        if current_key() == key:
+            self.cache.set(key, data, self.timeout)
+        else:
+            self.count(kind, DISCARDED)
+        return data
+
+    async def afetch(self, kind, key, current_key, build):
+        if not self.enabled:
+            return await build()
+        data = await self.cache.aget(key, _MISSING)
+        if data is not _MISSING:
+            self.count(kind, HIT)
+            return data
+
+        self.count(kind, MISS)
+        data = await build()
+        if await current_key() == key:
+            await self.cache.aset(key, data, self.timeout)
+        else:
+            self.count(kind, DISCARDED)
+        return data
+
+    def count(self, kind, index) -> None:
+        with self._lock:
+            self._counts[kind][index] += 1
+
+    def clear(self) -> None:
+        """
+        Drop all cached payloads and reset the counters.
+        """
+        self.cache.clear()
+        with self._lock:
+            for values in self._counts.values():
+                values[:] = [0, 0, 0]
+
+    def stats(self) -> dict:
+        """
+        Return hits, misses and hit rate per payload kind. `discarded`
+        counts payloads not stored because a write raced the build.
+        """
+        with self._lock:
+            counts = {
+                kind: list(values) for kind, values in self._counts.items()
+            }
+        stats = {}
+        for kind, (misses, hits, discarded) in counts.items():
+            lookups = hits + misses
+            stats[kind] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "discarded": discarded,
+            }
+        return stats
+
+
+board_cache = BoardResponseCache(
+    enabled=_config.get("ENABLED", True),
+    alias=_config.get("CACHE", "default"),
+    timeout=_config.get("TIMEOUT", 300),
+)
@@ -0,0 +1,188 @@
+from collections import defaultdict
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+)
+from django.dispatch import receiver
+from django.utils import timezone
+
+from auth_app.models import UserProfile
+from boards_app.access import board_access
+from boards_app.changes import record_change, record_changes
+from boards_app.models import Board, BoardChange
+from tasks_app.models import Comment, Task
+
+Kind = BoardChange.Kind
+Operation = BoardChange.Operation
+
+
+def invalidate_on_commit(invalidate, key) -> None:
+    """
+    Drop a cache entry now and again once the transaction commits.
+
+    The second invalidation removes entries that concurrent requests
+    may have re-populated from the not yet committed state.
+    """
+    invalidate(key)
+    transaction.on_commit(lambda: invalidate(key))
+
+
+def save_operation(created: bool) -> str:
+    return Operation.INSERT if created else Operation.UPDATE
+
+
+@receiver(m2m_changed, sender=Board.members.through)
+def board_members_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse and action == "pre_clear":
+        # Clearing from the profile side does not report the boards,
+        # so they are collected while the rows still exist.
+        instance._cleared_board_ids = list(
+            instance.board_members.values_list("pk", flat=True)
+        )
+        return
+    if not action.startswith("post_"):
+        return
+
+    if not reverse:
+        board_ids = [instance.pk]
+    elif action == "post_clear":
+        board_ids = vars(instance).pop("_cleared_board_ids", [])
+    else:
+        board_ids = list(pk_set or ())
+
+    for board_id in board_ids:
+        invalidate_on_commit(board_access.invalidate_board, board_id)
+        record_change(board_id, Kind.BOARD, board_id, Operation.UPDATE)
+
+
+@receiver(post_save, sender=Board)
+def board_saved(sender, instance, created, **kwargs):
+    invalidate_on_commit(board_access.invalidate_board, instance.pk)
+    record_change(
+        instance.pk, Kind.BOARD, instance.pk, save_operation(created)
+    )
+    # The version was bumped in the database only.
+    instance.refresh_from_db(fields=["version"])
+
+
+@receiver(post_delete, sender=Board)
+def board_deleted(sender, instance, **kwargs):
+    invalidate_on_commit(board_access.invalidate_board, instance.pk)
+    record_change(instance.pk, Kind.BOARD, instance.pk, Operation.DELETE)
+
+
+@receiver(post_save, sender=Task)
+def task_saved(sender, instance, created, **kwargs):
+    invalidate_on_commit(board_access.invalidate_task, instance.pk)
+    record_change(
+        instance.board_id, Kind.TASK, instance.pk, save_operation(created)
+    )
+
+
+@receiver(post_delete, sender=Task)
+def task_deleted(sender, instance, **kwargs):
+    invalidate_on_commit(board_access.invalidate_task, instance.pk)
+    record_change(instance.board_id, Kind.TASK, instance.pk, Operation.DELETE)
+
+
+def comment_changed(comment, op) -> None:
+    """
+    Record a comment change together with an update of its task,
+    whose comment count changes with it.
+    """
+    board_id = board_access.get_task_board_id(comment.task_id)
+    if board_id is None:
+        return
+    record_change(board_id, Kind.COMMENT, comment.pk, op)
+    record_change(board_id, Kind.TASK, comment.task_id, Operation.UPDATE)
+
+
+@receiver(post_save, sender=Comment)
+def comment_saved(sender, instance, created, **kwargs):
+    comment_changed(instance, save_operation(created))
+
+
+@receiver(post_delete, sender=Comment)
+def comment_deleted(sender, instance, **kwargs):
+    comment_changed(instance, Operation.DELETE)
+
+
+def ids_by_board(rows) -> dict[int, list[int]]:
+    """
+    Group (board ID, object ID) rows by board.
+    """
+    grouped = defaultdict(list)
+    for board_id, object_id in rows:
+        grouped[board_id].append(object_id)
+    return grouped
+
+
+def profile_changed(profile_id) -> None:
+    """
+    Record updates of the boards, tasks and comments that render the
+    profile and bump the `updated_at` of the tasks and comments.
+
+    Boards show the names and emails of their owner and members,
+    tasks those of their assignee and reviewer, and comments their
+    author's name, so clients applying deltas must re-read them all.
+    """
+    tasks = Task.objects.filter(
+        Q(assignee_id=profile_id) | Q(reviewer_id=profile_id)
+    )
+    comments = Comment.objects.filter(author_id=profile_id)
+    now = timezone.now()
+    tasks.update(updated_at=now)
+    comments.update(updated_at=now)
+
+    board_ids = Board.objects.filter(
+        Q(owner_id=profile_id)
+        | Q(
+            pk__in=Board.members.through.objects.filter(
+                userprofile_id=profile_id
+            ).values("board_id")
+        )
+    ).values_list("pk", flat=True)
+    for board_id in board_ids:
+        record_change(board_id, Kind.BOARD, board_id, Operation.UPDATE)
+    for board_id, task_ids in ids_by_board(
+        tasks.values_list("board_id", "pk")
+    ).items():
+        record_changes(board_id, Kind.TASK, task_ids, Operation.UPDATE)
+    for board_id, comment_ids in ids_by_board(
+        comments.values_list("task__board_id", "pk")
+    ).items():
+        record_changes(board_id, Kind.COMMENT, comment_ids, Operation.UPDATE)
+
+
+@receiver(post_save, sender=UserProfile)
+def profile_saved(sender, instance, created, **kwargs):
+    if not created:
+        profile_changed(instance.pk)
+
+
+@receiver(pre_delete, sender=UserProfile)
+def profile_deleted(sender, instance, **kwargs):
+    """
+    Handle a profile deletion while its memberships and tasks still
+    reference it.
+
+    The deletion cascades to the board memberships and clears the
+    assignee and reviewer of tasks without sending any signals.
+    """
+    profile_changed(instance.pk)
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, created, update_fields, **kwargs):
+    # Logins only update last_login, which no board renders.
+    if created or (update_fields and "email" not in update_fields):
+        return
+    profile = UserProfile.objects.filter(user=instance).first()
+    if profile is not None:
+        profile_changed(profile.pk)
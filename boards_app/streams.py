@@ -0,0 +1,225 @@
+import asyncio
+import json
+import re
+from urllib.parse import parse_qs
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from django.http import JsonResponse
+from rest_framework import exceptions
+
+from auth_app.authentication import CachedTokenAuthentication
+from boards_app.access import board_access
+from boards_app.changes import latest_seq
+from boards_app.events import OVERFLOW, hub
+
+EVENTS_PATH = re.compile(r"^/api/boards/(?P<pk>\d+)/events/$")
+HEARTBEAT = getattr(settings, "BOARD_EVENTS", {}).get("HEARTBEAT", 15)
+RETRY_MS = 3000
+
+
+class BoardEventsRouter:
+    """
+    ASGI application serving board event streams next to Django.
+
+    Requests for /api/boards/{id}/events/ are answered here, all
+    other requests are passed on to the wrapped Django application.
+    Django's ASGI handler keeps a dedicated thread for every request
+    until the response is finished, so long-lived streams served
+    through it would still need a thread per client. Here every
+    open stream is only a suspended coroutine on the event loop.
+    """
+
+    def __init__(self, application):
+        self.application = application
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            match = EVENTS_PATH.match(scope["path"])
+            if match:
+                await board_events(scope, receive, send, int(match["pk"]))
+                return
+        await self.application(scope, receive, send)
+
+
+def run_db(func):
+    """
+    Wrap func to run in the loop's shared thread pool.
+
+    Connections are closed afterwards like at the end of a Django
+    request, since no request signals fire for streams.
+    """
+
+    def wrapper(*args):
+        close_old_connections()
+        try:
+            return func(*args)
+        finally:
+            close_old_connections()
+
+    return sync_to_async(wrapper, thread_sensitive=False)
+
+
+def get_token_key(scope) -> str | None:
+    """
+    Return the token from the Authorization header or, since the
+    browser EventSource API cannot set headers, the `token` query
+    parameter.
+    """
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            auth = value.split()
+            if len(auth) == 2 and auth[0].lower() == b"token":
+                return auth[1].decode(errors="replace")
+    query = parse_qs(scope.get("query_string", b"").decode())
+    return query.get("token", [None])[0]
+
+
+def authorize(key, board_id) -> tuple[int, str] | None:
+    """
+    Resolve the token and check access to the board.
+
+    Returns None on success, otherwise the status code and message.
+    """
+    if not key:
+        return 401, "Authentication credentials were not provided."
+    try:
+        user, _ = CachedTokenAuthentication().authenticate_credentials(key)
+    except exceptions.AuthenticationFailed as exc:
+        return 401, str(exc.detail)
+
+    acl = board_access.get_board_acl(board_id)
+    if acl is None:
+        return 404, "Not found."
+    profile = getattr(user, "userprofile", None)
+    if profile is None or not acl.allows(profile.pk):
+        return 403, "You do not have permission to perform this action."
+    return None
+
+
+def cors_headers(scope) -> list[tuple[bytes, bytes]]:
+    """
+    Return the CORS headers for the request's origin, matching the
+    django-cors-headers settings applied to the regular API.
+    """
+    origin = next(
+        (value for name, value in scope["headers"] if name == b"origin"), None
+    )
+    if origin is None:
+        return []
+    allowed = getattr(settings, "CORS_ALLOW_ALL_ORIGINS", False) or (
+        origin.decode(errors="replace")
+        in getattr(settings, "CORS_ALLOWED_ORIGINS", [])
+    )
+    if not allowed:
+        return []
+    return [(b"access-control-allow-origin", origin), (b"vary", b"origin")]
+
+
+async def send_error(send, scope, status: int, detail: str) -> None:
+    body = json.dumps({"detail": detail}).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                *cors_headers(scope),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+def format_event(event: dict) -> bytes:
+    lines = []
+    if "seq" in event:
+        lines.append(f"id: {event['seq']}")
+    lines.append(f"event: {event['type']}")
+    lines.append(f"data: {json.dumps(event)}")
+    return ("\n".join(lines) + "\n\n").encode()
+
+
+async def write_events(send, subscription, heartbeat: float) -> None:
+    """
+    Send the events of a subscription until the task is cancelled.
+
+    The first event is `ready` carrying the current change log
+    sequence. Clients use it, or the ID of the last received event,
+    as `since` for /api/boards/{id}/changes/ to fetch the data behind
+    the events. An `overflow` event means events were dropped and the
+    client has to catch up the same way. Idle streams receive a
+    comment line every heartbeat seconds.
+    """
+    body = {"type": "http.response.body", "more_body": True}
+    await send({**body, "body": f"retry: {RETRY_MS}\n\n".encode()})
+    seq = await run_db(latest_seq)()
+    await send({**body, "body": format_event({"type": "ready", "seq": seq})})
+
+    while True:
+        try:
+            event = await asyncio.wait_for(subscription.get(), heartbeat)
+        except TimeoutError:
+            await send({**body, "body": b": heartbeat\n\n"})
+            continue
+        if event is OVERFLOW or event["seq"] > seq:
+            await send({**body, "body": format_event(event)})
+
+
+async def wait_for_disconnect(receive) -> None:
+    while (await receive())["type"] != "http.disconnect":
+        pass
+
+
+async def board_events(scope, receive, send, board_id, heartbeat=HEARTBEAT):
+    """
+    Stream task, comment and member changes of a board as
+    server-sent events until the client disconnects.
+    """
+    if scope["method"] != "GET":
+        await send_error(
+            send, scope, 405, f'Method "{scope["method"]}" not allowed.'
+        )
+        return
+
+    error = await run_db(authorize)(get_token_key(scope), board_id)
+    if error is not None:
+        await send_error(send, scope, *error)
+        return
+
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"text/event-stream"),
+                (b"cache-control", b"no-cache"),
+                (b"x-accel-buffering", b"no"),
+                *cors_headers(scope),
+            ],
+        }
+    )
+
+    subscription = hub.subscribe(board_id)
+    writer = asyncio.ensure_future(write_events(send, subscription, heartbeat))
+    watcher = asyncio.ensure_future(wait_for_disconnect(receive))
+    try:
+        await asyncio.wait(
+            {writer, watcher}, return_when=asyncio.FIRST_COMPLETED
+        )
+    finally:
+        hub.unsubscribe(subscription)
+        writer.cancel()
+        watcher.cancel()
+
+
+def events_require_asgi(request, pk):
+    """
+    Answer event stream requests that reached Django, which only
+    happens when the project is not served through `core.asgi`.
+    """
+    return JsonResponse(
+        {"detail": "Event streams require the ASGI server."}, status=501
+    )
@@ -1,3 +1,632 @@
-from django.test import TestCase
+import datetime
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from auth_app.authentication import token_cache
+from auth_app.models import UserProfile
+from boards_app.access import board_access
+from boards_app.changes import (
+    bump_board_versions,
+    compact_change_log,
+    compacted_through,
+    latest_seq,
+)
+from boards_app.models import Board, BoardChange
+from boards_app.response_cache import board_cache
+from tasks_app.models import Comment, Task
+
+
+def create_profile(email, fullname):
+    user = User.objects.create(username=email, email=email)
+    return UserProfile.objects.create(user=user, fullname=fullname)
+
+
+class BoardDetailQueryCountTests(TestCase):
+    """
+    Verify that the board detail endpoint uses a constant number of
+    queries, independent of the number of tasks on the board.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = create_profile("owner@example.com", "Owner Example")
+        cls.member = create_profile("member@example.com", "Member Example")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.owner.user)
+
+    def create_board(self, task_count):
+        board = Board.objects.create(owner=self.owner, title="Board")
+        board.members.add(self.owner, self.member)
+
+        tasks = Task.objects.bulk_create(
+            Task(
+                board=board,
+                creator=self.owner,
+                title=f"Task {i}",
+                assignee=self.owner if i % 2 else self.member,
+                reviewer=self.member if i % 3 else None,
+                due_date=datetime.date(2026, 1, 1),
+                comments_count=0 if i % 2 else 1,
+            )
+            for i in range(task_count)
+        )
+        Comment.objects.bulk_create(
+            Comment(task=task, author=self.member, content="Comment")
+            for task in tasks[::2]
+        )
+        return board
+
+    def count_detail_queries(self, board):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(f"/api/boards/{board.pk}/")
+        self.assertEqual(response.status_code, 200)
+        return len(context), response.json()
+
+    def test_query_count_is_independent_of_task_count(self):
+        small_count, small = self.count_detail_queries(self.create_board(10))
+        large_count, large = self.count_detail_queries(
+            self.create_board(10_000)
+        )
+
+        self.assertEqual(len(small["tasks"]), 10)
+        self.assertEqual(len(large["tasks"]), 10_000)
+        self.assertEqual(small_count, large_count)
+
+    def test_detail_payload(self):
+        board = self.create_board(2)
+        _, data = self.count_detail_queries(board)
+
+        self.assertEqual(data["owner_id"], self.owner.pk)
+        self.assertEqual(
+            sorted(member["email"] for member in data["members"]),
+            ["member@example.com", "owner@example.com"],
+        )
+        tasks = sorted(data["tasks"], key=lambda task: task["id"])
+        self.assertEqual(tasks[0]["comments_count"], 1)
+        self.assertEqual(tasks[1]["comments_count"], 0)
+        self.assertEqual(tasks[0]["assignee"]["email"], "member@example.com")
+        self.assertIsNone(tasks[0]["reviewer"])
+
+
+class AsyncReadViewTests(TestCase):
+    """
+    Verify that the async read views under /api/async/ return the same
+    payloads as their sync counterparts.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = create_profile("owner@example.com", "Owner Example")
+        cls.member = create_profile("member@example.com", "Member Example")
+        cls.outsider = create_profile("out@example.com", "Out Sider")
+        cls.token = Token.objects.create(user=cls.member.user)
+
+        cls.board = Board.objects.create(owner=cls.owner, title="Board")
+        cls.board.members.add(cls.owner, cls.member)
+        cls.task = Task.objects.create(
+            board=cls.board,
+            creator=cls.owner,
+            title="Task",
+            assignee=cls.member,
+            reviewer=cls.member,
+            due_date=datetime.date(2026, 1, 1),
+            comments_count=1,
+        )
+        Comment.objects.create(
+            task=cls.task, author=cls.owner, content="Comment"
+        )
+
+    def setUp(self):
+        token_cache.clear()
+        board_access.clear()
+        self.headers = {"Authorization": f"Token {self.token.key}"}
+
+    async def assert_same_response(self, path):
+        sync_client = APIClient(headers=self.headers)
+        await sync_to_async(board_cache.clear)()
+        expected = await sync_to_async(sync_client.get)(f"/api{path}")
+        await sync_to_async(board_cache.clear)()
+        response = await self.async_client.get(
+            f"/api/async{path}", headers=self.headers
+        )
+
+        self.assertEqual(response.status_code, expected.status_code)
+        self.assertEqual(response.content, expected.content)
+
+    async def test_responses_match_sync_views(self):
+        for path in (
+            "/boards/",
+            f"/boards/{self.board.pk}/",
+            "/tasks/assigned-to-me/",
+            "/tasks/reviewing/",
+            "/tasks/assigned-to-me/?page_size=1",
+            f"/tasks/{self.task.pk}/comments/",
+            f"/tasks/{self.task.pk}/comments/?page_size=1",
+        ):
+            with self.subTest(path=path):
+                await self.assert_same_response(path)
+
+    async def test_plain_token_authentication(self):
+        # Unlike CachedTokenAuthentication, it does not load the profile
+        # with the user, so the views must not read it on the event loop.
+        with self.settings(
+            REST_FRAMEWORK={
+                "DEFAULT_AUTHENTICATION_CLASSES": [
+                    "rest_framework.authentication.TokenAuthentication",
+                ]
+            }
+        ):
+            await self.test_responses_match_sync_views()
+
+    async def test_errors(self):
+        response = await self.async_client.get("/api/async/boards/")
+        self.assertEqual(response.status_code, 401)
+
+        other = await Board.objects.acreate(owner=self.outsider, title="Other")
+        for path, status_code in (
+            ("/api/async/boards/0/", 404),
+            ("/api/async/tasks/0/comments/", 404),
+            (f"/api/async/boards/{other.pk}/", 403),
+        ):
+            with self.subTest(path=path):
+                response = await self.async_client.get(
+                    path, headers=self.headers
+                )
+                self.assertEqual(response.status_code, status_code)
+
+
+class FastSerializerTests(TestCase):
+    """
+    Verify that the fast-path rendering of the board detail and the
+    task lists is byte-for-byte identical to the DRF serializers.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = create_profile("owner@example.com", "Owner Example")
+        cls.member = create_profile("member@example.com", "Mémber Ünïcode")
+        cls.board = Board.objects.create(owner=cls.owner, title="Bööard")
+        cls.board.members.add(cls.owner, cls.member)
+        other = Board.objects.create(owner=cls.member, title="Other")
+        other.members.add(cls.member)
+
+        Task.objects.bulk_create(
+            Task(
+                board=cls.board if i % 4 else other,
+                creator=cls.owner,
+                title=f"Task {i} “quoted”",
+                description="" if i % 3 else f"Line\nbreak {i}",
+                status=Task.Status.values[i % 4],
+                priority=Task.Priority.values[i % 3],
+                assignee=cls.member if i % 2 else None,
+                reviewer=cls.member if i % 5 else cls.owner,
+                due_date=datetime.date(2026, 1, 1 + i % 7),
+                comments_count=i,
+            )
+            for i in range(12)
+        )
+        cls.token = Token.objects.create(user=cls.member.user)
+
+    def setUp(self):
+        token_cache.clear()
+        board_access.clear()
+        self.client = APIClient(
+            headers={"Authorization": f"Token {self.token.key}"}
+        )
+
+    def get(self, path, fast):
+        board_cache.clear()
+        with self.settings(FAST_SERIALIZERS=fast):
+            response = self.client.get(path)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def assert_identical(self, path):
+        expected = self.get(path, fast=False)
+        self.assertEqual(self.get(path, fast=True).content, expected.content)
+        return expected
+
+    def test_responses_are_identical(self):
+        for path in (
+            f"/api/boards/{self.board.pk}/",
+            f"/api/async/boards/{self.board.pk}/",
+            "/api/tasks/assigned-to-me/",
+            "/api/tasks/reviewing/",
+            "/api/async/tasks/assigned-to-me/",
+            "/api/async/tasks/reviewing/",
+            f"/api/tasks/search/?board={self.board.pk}&status=to-do,done",
+        ):
+            with self.subTest(path=path):
+                self.assert_identical(path)
+
+    def test_paginated_responses_are_identical(self):
+        for path in (
+            "/api/tasks/assigned-to-me/?page_size=2",
+            "/api/async/tasks/reviewing/?page_size=3",
+            "/api/tasks/search/?page_size=4",
+        ):
+            with self.subTest(path=path):
+                pages = 0
+                while path:
+                    path = self.assert_identical(path).json()["next"]
+                    pages += 1
+                self.assertGreater(pages, 1)
+
+
+class BoardResponseCacheTests(TransactionTestCase):
+    """
+    Verify that cached board payloads are served until a write to the
+    board, its members, tasks or comments, and never after it.
+
+    Runs without a wrapping transaction, since the cache is bypassed
+    inside atomic blocks.
+    """
+
+    def setUp(self):
+        self.owner = create_profile("owner@example.com", "Owner Example")
+        self.member = create_profile("member@example.com", "Member Example")
+        self.board = Board.objects.create(owner=self.owner, title="Board")
+        self.board.members.add(self.owner, self.member)
+        self.task = Task.objects.create(
+            board=self.board,
+            creator=self.owner,
+            title="Task",
+            assignee=self.member,
+            due_date=datetime.date(2026, 1, 1),
+        )
+        board_cache.clear()
+        board_access.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.owner.user)
+        self.detail_path = f"/api/boards/{self.board.pk}/"
+
+    def get(self, path):
+        response = self.client.get(path)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def hits(self, kind):
+        return board_cache.stats()[kind]["hits"]
+
+    def test_detail_is_cached_until_a_write(self):
+        self.get(self.detail_path)
+        hits = self.hits("detail")
+        with CaptureQueriesContext(connection) as cached:
+            self.get(self.detail_path)
+        self.assertEqual(self.hits("detail"), hits + 1)
+        self.assertEqual(len(cached), 1)
+
+        writes = (
+            lambda: self.client.patch(
+                f"/api/tasks/{self.task.pk}/", {"title": "Renamed"}
+            ),
+            lambda: self.client.post(
+                f"/api/tasks/{self.task.pk}/comments/", {"content": "Hi"}
+            ),
+            lambda: self.client.post(
+                "/api/tasks/bulk/",
+                {
+                    "board": self.board.pk,
+                    "update": [{"id": self.task.pk, "priority": "high"}],
+                },
+                format="json",
+            ),
+            lambda: (
+                UserProfile.objects.filter(pk=self.member.pk).first().save()
+            ),
+        )
+        for write in writes:
+            with self.subTest(write=write):
+                self.get(self.detail_path)
+                hits = self.hits("detail")
+                write()
+                self.get(self.detail_path)
+                self.assertEqual(self.hits("detail"), hits)
+
+        task = self.get(self.detail_path)["tasks"][0]
+        self.assertEqual(task["title"], "Renamed")
+        self.assertEqual(task["comments_count"], 1)
+
+    def test_list_follows_the_board_set(self):
+        self.assertEqual(len(self.get("/api/boards/")), 1)
+        self.assertEqual(self.get("/api/boards/")[0]["ticket_count"], 1)
+
+        Task.objects.create(
+            board=self.board,
+            creator=self.owner,
+            title="Another",
+            due_date=datetime.date(2026, 1, 2),
+        )
+        self.assertEqual(self.get("/api/boards/")[0]["ticket_count"], 2)
+
+        other = Board.objects.create(owner=self.member, title="Other")
+        self.assertEqual(len(self.get("/api/boards/")), 1)
+        other.members.add(self.owner)
+        self.assertEqual(len(self.get("/api/boards/")), 2)
+
+    def assert_member_removed(self, remove):
+        response = self.client.get(self.detail_path)
+        etag = response["ETag"]
+        self.get(self.detail_path)
+        version = Board.objects.get(pk=self.board.pk).version
+
+        remove()
+
+        self.assertGreater(
+            Board.objects.get(pk=self.board.pk).version, version
+        )
+        response = self.client.get(
+            self.detail_path, headers={"If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_member_deletion_invalidates_the_detail(self):
+        detail = self.assert_member_removed(self.member.user.delete)
+        self.assertEqual(
+            [member["id"] for member in detail["members"]], [self.owner.pk]
+        )
+        self.assertIsNone(detail["tasks"][0]["assignee"])
+
+    def test_clearing_boards_of_a_profile_invalidates_the_detail(self):
+        detail = self.assert_member_removed(self.member.board_members.clear)
+        self.assertEqual(
+            [member["id"] for member in detail["members"]], [self.owner.pk]
+        )
+
+    def test_payload_built_during_a_write_is_not_stored(self):
+        board = Board.objects.get(pk=self.board.pk)
+
+        def build():
+            Board.objects.filter(pk=board.pk).update(title="Changed")
+            bump_board_versions(board.pk)
+            return {"title": "Board"}
+
+        discarded = board_cache.stats()["detail"]["discarded"]
+        board_cache.get_detail(board, build)
+
+        self.assertEqual(
+            board_cache.stats()["detail"]["discarded"], discarded + 1
+        )
+        self.assertEqual(self.get(self.detail_path)["title"], "Changed")
+
+
+class ConditionalGetTests(TestCase):
+    """
+    Verify that board and task list responses carry ETags, answer a
+    matching If-None-Match with 304 and change with every write.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = create_profile("owner@example.com", "Owner Example")
+        cls.member = create_profile("member@example.com", "Member Example")
+        cls.board = Board.objects.create(owner=cls.owner, title="Board")
+        cls.board.members.add(cls.owner, cls.member)
+        cls.task = Task.objects.create(
+            board=cls.board,
+            creator=cls.owner,
+            title="Task",
+            assignee=cls.member,
+            reviewer=cls.member,
+            due_date=datetime.date(2026, 1, 1),
+        )
+
+    def setUp(self):
+        board_access.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.member.user)
+        self.detail = f"/api/boards/{self.board.pk}/"
+        self.comments = f"/api/tasks/{self.task.pk}/comments/"
+        self.tasks = ("/api/tasks/assigned-to-me/", "/api/tasks/reviewing/")
+        self.paths = ("/api/boards/", self.detail, self.comments, *self.tasks)
+
+    def etag(self, path):
+        response = self.client.get(path)
+        self.assertEqual(response.status_code, 200)
+        return response["ETag"]
+
+    def rename_member(self):
+        profile = UserProfile.objects.get(pk=self.member.pk)
+        profile.fullname = "Renamed"
+        profile.save()
+
+    def test_unchanged_responses_are_not_modified(self):
+        for path in self.paths:
+            with self.subTest(path=path):
+                etag = self.etag(path)
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(
+                        path, headers={"If-None-Match": f"W/{etag}, other"}
+                    )
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response["ETag"], etag)
+                self.assertEqual(response.content, b"")
+                self.assertLessEqual(len(queries), 2)
+
+    def test_stale_board_saves_change_the_etag(self):
+        stale = Board.objects.get(pk=self.board.pk)
+        current = Board.objects.get(pk=self.board.pk)
+        current.title = "Current"
+        current.save()
+        etag = self.etag(self.detail)
+
+        stale.title = "Stale"
+        stale.save()
+        self.assertNotEqual(stale.version, current.version)
+        self.assertEqual(
+            stale.version, Board.objects.get(pk=self.board.pk).version
+        )
+        response = self.client.get(
+            self.detail, headers={"If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["title"], "Stale")
+
+    def test_writes_change_the_etags(self):
+        writes = (
+            (
+                lambda: self.client.post(self.comments, {"content": "Hi"}),
+                self.paths,
+            ),
+            (
+                lambda: self.client.post(
+                    "/api/tasks/bulk/",
+                    {
+                        "board": self.board.pk,
+                        "update": [{"id": self.task.pk, "priority": "high"}],
+                    },
+                    format="json",
+                ),
+                ("/api/boards/", self.detail, *self.tasks),
+            ),
+            (self.rename_member, (self.detail, self.comments, *self.tasks)),
+            (
+                lambda: Comment.objects.get(task=self.task).delete(),
+                (self.detail, self.comments),
+            ),
+        )
+        for write, paths in writes:
+            etags = {path: self.etag(path) for path in paths}
+            write()
+            for path in paths:
+                with self.subTest(write=write, path=path):
+                    response = self.client.get(
+                        path, headers={"If-None-Match": etags[path]}
+                    )
+                    self.assertEqual(response.status_code, 200)
+
+
+class BoardChangeLogTests(TestCase):
+    """
+    Verify the deltas of the board changes endpoint, including those
+    caused by profile changes, and their resync after compaction.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = create_profile("owner@example.com", "Owner Example")
+        cls.member = create_profile("member@example.com", "Member Example")
+        cls.board = Board.objects.create(owner=cls.owner, title="Board")
+        cls.board.members.add(cls.owner, cls.member)
+        cls.tasks = [
+            Task.objects.create(
+                board=cls.board,
+                creator=cls.owner,
+                title=f"Task {index}",
+                assignee=assignee,
+                due_date=datetime.date(2026, 1, 1),
+            )
+            for index, assignee in enumerate((cls.member, cls.owner, None))
+        ]
+        cls.comment = Comment.objects.create(
+            task=cls.tasks[1], author=cls.member, content="Hi"
+        )
+
+    def setUp(self):
+        board_access.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.owner.user)
+
+    def delta(self, since):
+        response = self.client.get(
+            f"/api/boards/{self.board.pk}/changes/", {"since": since}
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_delta_of_task_and_comment_writes(self):
+        since = latest_seq()
+        first, second, third = self.tasks
+        first.title = "Renamed"
+        first.save()
+        third_id = third.pk
+        third.delete()
+        comment = Comment.objects.create(
+            task=second, author=self.owner, content="New"
+        )
+
+        delta = self.delta(since)
+        self.assertEqual(
+            (delta["resync"], delta["seq"]), (False, latest_seq())
+        )
+        self.assertIsNone(delta["board_data"])
+        self.assertEqual(
+            {task["id"]: task["title"] for task in delta["tasks"]},
+            {first.pk: "Renamed", second.pk: "Task 1"},
+        )
+        self.assertEqual(
+            [comment["id"] for comment in delta["comments"]], [comment.pk]
+        )
+        self.assertEqual(
+            delta["deleted"],
+            {"board": False, "tasks": [third_id], "comments": []},
+        )
+        self.assertEqual(self.delta(delta["seq"])["tasks"], [])
+
+    def test_delta_of_a_profile_change(self):
+        since = latest_seq()
+        profile = UserProfile.objects.get(pk=self.member.pk)
+        profile.fullname = "Renamed"
+        profile.save()
+
+        delta = self.delta(since)
+        self.assertIn(
+            {
+                "id": self.member.pk,
+                "email": "member@example.com",
+                "fullname": "Renamed",
+            },
+            delta["board_data"]["members"],
+        )
+        self.assertEqual(
+            [task["assignee"]["fullname"] for task in delta["tasks"]],
+            ["Renamed"],
+        )
+        self.assertEqual(
+            [comment["author"] for comment in delta["comments"]], ["Renamed"]
+        )
+
+    def test_delta_of_a_profile_deletion(self):
+        since = latest_seq()
+        self.member.delete()
+
+        delta = self.delta(since)
+        self.assertEqual(
+            [member["id"] for member in delta["board_data"]["members"]],
+            [self.owner.pk],
+        )
+        assignees = {task["id"]: task["assignee"] for task in delta["tasks"]}
+        self.assertIsNone(assignees[self.tasks[0].pk])
+        self.assertEqual(delta["deleted"]["comments"], [self.comment.pk])
+
+    def test_compaction_requires_a_resync_of_older_sequences(self):
+        since = latest_seq()
+        self.tasks[0].save()
+        upto = latest_seq()
+        BoardChange.objects.filter(seq__lte=since).update(
+            created_at=timezone.now() - datetime.timedelta(days=2)
+        )
+
+        removed = compact_change_log(datetime.timedelta(days=1))
+        self.assertEqual(removed, since)
+        self.assertEqual(compacted_through(), since)
+        self.assertEqual(compact_change_log(datetime.timedelta(days=1)), 0)
+        self.assertEqual(latest_seq(), upto)
+
+        self.assertTrue(self.delta(since - 1)["resync"])
+        self.assertTrue(self.delta(upto + 1)["resync"])
+        delta = self.delta(since)
+        self.assertFalse(delta["resync"])
+        self.assertEqual(
+            [task["id"] for task in delta["tasks"]], [self.tasks[0].pk]
+        )
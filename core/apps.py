@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    name = "core"
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+
+        from core.sqlite import configure_connection
+
+        connection_created.connect(configure_connection)
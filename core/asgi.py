@@ -2,6 +2,7 @@
 ASGI config for core project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Board event streams are served by ``BoardEventsRouter`` in front of Django.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/6.0/howto/deployment/asgi/
@@ -13,4 +14,8 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+from boards_app.streams import BoardEventsRouter  # noqa: E402
+
+application = BoardEventsRouter(django_application)
@@ -0,0 +1,111 @@
+import functools
+
+from asgiref.sync import sync_to_async
+from django.http import Http404, HttpResponse
+from rest_framework import exceptions, status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+renderer = JSONRenderer()
+
+
+def render(data, status_code: int = status.HTTP_200_OK, headers=None):
+    """
+    Render data the same way DRF's JSONRenderer does for sync views.
+    """
+    return HttpResponse(
+        renderer.render(data),
+        status=status_code,
+        content_type=renderer.media_type,
+        headers=headers,
+    )
+
+
+async def authenticate(request):
+    """
+    Run the configured DRF authentication classes for an async view.
+
+    Classes with an `aauthenticate` coroutine (such as
+    CachedTokenAuthentication) are awaited directly, others run in a
+    worker thread. Returns the (user, auth) tuple of the first class
+    that succeeds, or raises NotAuthenticated.
+    """
+    for authenticator_class in api_settings.DEFAULT_AUTHENTICATION_CLASSES:
+        authenticator = authenticator_class()
+        if hasattr(authenticator, "aauthenticate"):
+            result = await authenticator.aauthenticate(request)
+        else:
+            result = await sync_to_async(authenticator.authenticate)(request)
+        if result is not None:
+            return result
+    raise exceptions.NotAuthenticated()
+
+
+def www_authenticate_header(request):
+    for authenticator_class in api_settings.DEFAULT_AUTHENTICATION_CLASSES:
+        header = authenticator_class().authenticate_header(request)
+        if header:
+            return header
+    return None
+
+
+def async_api_view(view=None, *, methods=("GET",), authenticated=True):
+    """
+    Turn a coroutine into an async API view.
+
+    The view is called with a DRF Request wrapping the HttpRequest
+    (for `query_params`, `data` and pagination), with `user` and
+    `auth` set unless `authenticated` is False, and returns the
+    response data. Only the given `methods` are allowed, GET by
+    default. Errors are rendered like DRF's exception handler renders
+    them for the sync views.
+    """
+    if view is None:
+        return functools.partial(
+            async_api_view, methods=methods, authenticated=authenticated
+        )
+
+    @functools.wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        if request.method not in methods:
+            exc = exceptions.MethodNotAllowed(request.method)
+            return render(
+                {"detail": exc.detail},
+                exc.status_code,
+                {"Allow": ", ".join(methods)},
+            )
+
+        try:
+            api_request = Request(
+                request,
+                parsers=[
+                    parser() for parser in api_settings.DEFAULT_PARSER_CLASSES
+                ],
+            )
+            if authenticated:
+                user, auth = await authenticate(request)
+                api_request.user, api_request.auth = user, auth
+            data = await view(api_request, *args, **kwargs)
+        except exceptions.APIException as exc:
+            headers = {}
+            if isinstance(
+                exc,
+                (exceptions.NotAuthenticated, exceptions.AuthenticationFailed),
+            ):
+                header = www_authenticate_header(request)
+                if header:
+                    headers["WWW-Authenticate"] = header
+                else:
+                    exc.status_code = status.HTTP_403_FORBIDDEN
+            if getattr(exc, "wait", None):
+                headers["Retry-After"] = "%d" % exc.wait
+            detail = exc.detail
+            if not isinstance(detail, (list, dict)):
+                detail = {"detail": detail}
+            return render(detail, exc.status_code, headers)
+        except Http404 as exc:
+            return render({"detail": str(exc)}, status.HTTP_404_NOT_FOUND)
+        return render(data)
+
+    return wrapper
@@ -0,0 +1,94 @@
+import math
+import time
+
+
+def percentile(values, fraction: float) -> float:
+    """
+    Return the given percentile of values using the nearest-rank method.
+
+    `fraction` is expressed between 0 and 1, e.g. 0.99 for p99.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(fraction * len(ordered)) - 1, 0)
+    return ordered[rank]
+
+
+def summarize(durations) -> dict:
+    """
+    Summarize a list of durations in seconds.
+
+    Returns mean and percentile latencies in milliseconds together
+    with the throughput in operations per second.
+    """
+    total = sum(durations)
+    count = len(durations)
+    return {
+        "count": count,
+        "mean_ms": total / count * 1000 if count else 0.0,
+        "p50_ms": percentile(durations, 0.50) * 1000,
+        "p95_ms": percentile(durations, 0.95) * 1000,
+        "p99_ms": percentile(durations, 0.99) * 1000,
+        "ops_per_sec": count / total if total else 0.0,
+    }
+
+
+def time_calls(func, iterations: int) -> list[float]:
+    """
+    Call func the given number of times and return each duration.
+    """
+    durations = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - started)
+    return durations
+
+
+def compare_results(
+    baseline: dict,
+    results: dict,
+    threshold: float,
+    min_delta_ms: float = 1.0,
+    min_delta_kb: float = 64.0,
+) -> list[str]:
+    """
+    Compare endpoint benchmark results with a baseline.
+
+    Both are dicts as written by `manage.py bench_endpoints`. Returns
+    a message for every regression of an endpoint measured in both:
+    any increase of the query count, or a p95 latency or peak memory
+    more than `threshold` (a fraction) above the baseline. Latency and
+    memory changes below `min_delta_ms` and `min_delta_kb` are treated
+    as noise.
+    """
+    regressions = []
+    for size, measured in results["sizes"].items():
+        expected = baseline.get("sizes", {}).get(size)
+        if expected is None:
+            continue
+        for name, current in measured["endpoints"].items():
+            base = expected["endpoints"].get(name)
+            if base is None:
+                continue
+            label = f"{name} ({size} tasks)"
+            if current["queries"] > base["queries"]:
+                regressions.append(
+                    f"{label}: {current['queries']} queries, "
+                    f"baseline {base['queries']}"
+                )
+            for key, unit, min_delta in (
+                ("p95_ms", "ms", min_delta_ms),
+                ("peak_memory_kb", "KiB", min_delta_kb),
+            ):
+                limit = base[key] * (1 + threshold)
+                if (
+                    current[key] > limit
+                    and current[key] - base[key] > min_delta
+                ):
+                    regressions.append(
+                        f"{label}: {key} {current[key]:.1f} {unit}, "
+                        f"baseline {base[key]:.1f} {unit}"
+                    )
+    return regressions
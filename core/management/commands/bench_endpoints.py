@@ -0,0 +1,567 @@
+import datetime
+import io
+import itertools
+import json
+import platform
+import shutil
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import django
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count, F
+from django.test import Client
+from django.test.utils import (
+    setup_test_environment,
+    teardown_test_environment,
+)
+from django.urls import URLResolver, get_resolver
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+
+from auth_app.authentication import token_cache
+from auth_app.autocomplete import user_autocomplete
+from auth_app.email_check import unknown_emails
+from boards_app.access import board_access
+from boards_app.models import Board
+from boards_app.response_cache import board_cache
+from core.benchmark import compare_results, summarize
+from core.middleware import QueryCollector
+from tasks_app.models import Comment, Task
+
+PASSWORD = "bench-password"
+MIN_SAMPLES = 5
+
+
+class Endpoint:
+    """
+    One request measured by the endpoint benchmark.
+
+    `path` is formatted with the benchmark context: the IDs of the
+    benchmark user's `profile`, its largest `board`, the `task` with
+    the most comments on it, another board `member` and its `email`,
+    and the running request number `n`. `data` is a dict or a
+    callable returning the JSON body for a context. `setup` returns
+    extra context for one request, such as an object to delete, and
+    runs outside the timed section. `conditional` requests send the
+    ETag of an untimed GET of the same path as If-None-Match.
+    """
+
+    def __init__(
+        self,
+        route,
+        method="GET",
+        path="",
+        data=None,
+        setup=None,
+        status=200,
+        label="",
+        authenticated=True,
+        conditional=False,
+    ):
+        self.route = route
+        self.method = method
+        self.path = path
+        self.data = data
+        self.setup = setup
+        self.status = status
+        self.authenticated = authenticated
+        self.conditional = conditional
+        self.name = f"{method} {route}" + (f" {label}" if label else "")
+
+    def build(self, context):
+        path = self.path.format(**context)
+        data = self.data(context) if callable(self.data) else self.data
+        return path, json.dumps(data) if data is not None else ""
+
+
+def new_task(context):
+    task = Task.objects.create(
+        board_id=context["board"],
+        creator_id=context["profile"],
+        title=f"Bench task {context['n']}",
+        due_date=datetime.date(2026, 1, 1),
+    )
+    return {"new_task": task.pk}
+
+
+def new_comment(context):
+    comment = Comment.objects.create(
+        task_id=context["task"],
+        author_id=context["profile"],
+        content=f"Bench comment {context['n']}",
+    )
+    Task.objects.filter(pk=context["task"]).update(
+        comments_count=F("comments_count") + 1, updated_at=timezone.now()
+    )
+    return {"new_comment": comment.pk}
+
+
+def new_board(context):
+    board = Board.objects.create(
+        owner_id=context["profile"], title=f"Bench board {context['n']}"
+    )
+    return {"new_board": board.pk}
+
+
+def task_data(context):
+    return {
+        "board": context["board"],
+        "title": f"Bench task {context['n']}",
+        "description": "Created by the benchmark",
+        "status": "to-do",
+        "priority": "medium",
+        "assignee_id": context["profile"],
+        "due_date": "2026-06-01",
+    }
+
+
+ENDPOINTS = [
+    Endpoint("boards-list", path="/api/boards/"),
+    Endpoint(
+        "boards-list",
+        path="/api/boards/",
+        status=304,
+        label="not modified",
+        conditional=True,
+    ),
+    Endpoint(
+        "boards-list",
+        "POST",
+        "/api/boards/",
+        data=lambda c: {
+            "title": f"Bench {c['n']}",
+            "members": [c["member"]],
+        },
+        status=201,
+    ),
+    Endpoint("boards-detail", path="/api/boards/{board}/"),
+    Endpoint(
+        "boards-detail",
+        path="/api/boards/{board}/",
+        status=304,
+        label="not modified",
+        conditional=True,
+    ),
+    Endpoint(
+        "boards-detail",
+        "PATCH",
+        "/api/boards/{board}/",
+        data=lambda c: {"title": f"Board {c['n']}"},
+    ),
+    Endpoint(
+        "boards-detail",
+        "DELETE",
+        "/api/boards/{new_board}/",
+        setup=new_board,
+        status=204,
+    ),
+    Endpoint("boards-changes", path="/api/boards/{board}/changes/?since=0"),
+    Endpoint("tasks-assigned-to-me", path="/api/tasks/assigned-to-me/"),
+    Endpoint(
+        "tasks-assigned-to-me",
+        path="/api/tasks/assigned-to-me/",
+        status=304,
+        label="not modified",
+        conditional=True,
+    ),
+    Endpoint("tasks-reviewing", path="/api/tasks/reviewing/"),
+    Endpoint(
+        "tasks-search",
+        path="/api/tasks/search/?board={board}&status=to-do,in-progress",
+        label="filter",
+    ),
+    Endpoint("tasks-search", path="/api/tasks/search/?q=cache", label="text"),
+    Endpoint(
+        "tasks-bulk",
+        "POST",
+        "/api/tasks/bulk/",
+        data=lambda c: {
+            "board": c["board"],
+            "create": [task_data(c) for _ in range(20)],
+        },
+    ),
+    Endpoint("tasks-list", "POST", "/api/tasks/", data=task_data, status=201),
+    Endpoint(
+        "tasks-detail",
+        "PATCH",
+        "/api/tasks/{task}/",
+        data=lambda c: {"title": f"Task {c['n']}", "priority": "high"},
+    ),
+    Endpoint(
+        "tasks-detail",
+        "DELETE",
+        "/api/tasks/{new_task}/",
+        setup=new_task,
+        status=204,
+    ),
+    Endpoint("task-comments", path="/api/tasks/{task}/comments/"),
+    Endpoint(
+        "task-comments",
+        path="/api/tasks/{task}/comments/",
+        status=304,
+        label="not modified",
+        conditional=True,
+    ),
+    Endpoint(
+        "task-comments",
+        "POST",
+        "/api/tasks/{task}/comments/",
+        data=lambda c: {"content": f"Comment {c['n']}"},
+        status=201,
+    ),
+    Endpoint(
+        "task-comment-detail",
+        "DELETE",
+        "/api/tasks/{task}/comments/{new_comment}/",
+        setup=new_comment,
+        status=204,
+    ),
+    Endpoint("async-board-list", path="/api/async/boards/"),
+    Endpoint("async-board-detail", path="/api/async/boards/{board}/"),
+    Endpoint("async-assigned-to-me", path="/api/async/tasks/assigned-to-me/"),
+    Endpoint("async-reviewing", path="/api/async/tasks/reviewing/"),
+    Endpoint("async-task-comments", path="/api/async/tasks/{task}/comments/"),
+    Endpoint(
+        "registration",
+        "POST",
+        "/api/registration/",
+        data=lambda c: {
+            "fullname": "Bench User",
+            "email": f"bench-{c['n']}@example.com",
+            "password": PASSWORD,
+            "repeated_password": PASSWORD,
+        },
+        status=201,
+        authenticated=False,
+    ),
+    Endpoint(
+        "login",
+        "POST",
+        "/api/login/",
+        data=lambda c: {"email": c["user_email"], "password": PASSWORD},
+        authenticated=False,
+    ),
+    Endpoint(
+        "async-login",
+        "POST",
+        "/api/async/login/",
+        data=lambda c: {"email": c["user_email"], "password": PASSWORD},
+        authenticated=False,
+    ),
+    Endpoint("email-check", path="/api/email-check/?email={email}"),
+    Endpoint(
+        "email-check",
+        path="/api/email-check/?email=nobody@example.com",
+        status=404,
+        label="unknown",
+    ),
+    Endpoint("user-autocomplete", path="/api/users/autocomplete/?q=load-1"),
+]
+
+# Routes of core/urls.py that are deliberately not benchmarked here.
+SKIPPED_ROUTES = {
+    "board-events": "streams over ASGI, see benchmark_board_events",
+}
+
+
+def route_names(patterns=None) -> set[str]:
+    """
+    Return the names of all routes in the root URLconf, except the
+    admin site.
+    """
+    names = set()
+    for pattern in (
+        get_resolver().url_patterns if patterns is None else patterns
+    ):
+        if isinstance(pattern, URLResolver):
+            if pattern.app_name != "admin":
+                names |= route_names(pattern.url_patterns)
+        elif pattern.name:
+            names.add(pattern.name)
+    return names
+
+
+def uncovered_routes() -> set[str]:
+    covered = {endpoint.route for endpoint in ENDPOINTS}
+    return route_names() - covered - set(SKIPPED_ROUTES)
+
+
+class Command(BaseCommand):
+    """
+    Benchmark every API route in-process against generated datasets.
+
+    For each dataset size (the number of tasks) a fresh test database
+    is created and filled by `generate_dataset`, with users and boards
+    scaled to the size. Each endpoint is then requested through the
+    test client as the owner of the largest board, which is the
+    expensive case for the board and task routes. Per endpoint the
+    p50/p95/p99 latency, throughput and query count are recorded, and
+    the peak Python memory of one extra request measured with
+    tracemalloc. Objects to delete are created outside of the timed
+    requests. Each size uses its own temporary database file.
+
+    Results are written as JSON. With `--baseline` the results are
+    compared with an earlier run and the command fails if an endpoint
+    regressed by more than `--threshold`. Everything runs offline
+    against the configured database backend; nothing touches the
+    development database.
+    """
+
+    help = "Benchmark the API endpoints against generated datasets."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=[1_000, 10_000, 100_000],
+            help="Dataset sizes as numbers of tasks.",
+        )
+        parser.add_argument("--iterations", type=int, default=50)
+        parser.add_argument("--warmup", type=int, default=3)
+        parser.add_argument(
+            "--time-limit",
+            type=float,
+            default=10.0,
+            help="Seconds of timed requests after which an endpoint stops.",
+        )
+        parser.add_argument(
+            "--endpoint",
+            action="append",
+            default=[],
+            help='Only run endpoints whose name contains this, e.g. "GET".',
+        )
+        parser.add_argument("--output", default="bench_endpoints.json")
+        parser.add_argument("--baseline")
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.25,
+            help="Allowed relative regression of p95 latency and memory.",
+        )
+        parser.add_argument("--seed", type=int, default=1)
+
+    def handle(self, *args, **options):
+        if missing := uncovered_routes():
+            self.stderr.write(
+                f"Routes without a benchmark: {', '.join(sorted(missing))}"
+            )
+        endpoints = [
+            endpoint
+            for endpoint in ENDPOINTS
+            if not options["endpoint"]
+            or any(part in endpoint.name for part in options["endpoint"])
+        ]
+        self.counter = itertools.count()
+        results = {
+            "meta": {
+                "created": datetime.datetime.now(datetime.UTC).isoformat(),
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "database": connection.vendor,
+                "db_profile": getattr(settings, "DB_PROFILE", None),
+                "iterations": options["iterations"],
+                "seed": options["seed"],
+            },
+            "sizes": {},
+        }
+
+        setup_test_environment(debug=False)
+        try:
+            self.directory = tempfile.mkdtemp(prefix="bench-endpoints-")
+            for size in options["sizes"]:
+                results["sizes"][str(size)] = self.run_size(
+                    size, endpoints, options
+                )
+        finally:
+            teardown_test_environment()
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+        Path(options["output"]).write_text(json.dumps(results, indent=2))
+        self.stdout.write(f"Results written to {options['output']}")
+
+        if options["baseline"]:
+            baseline = json.loads(Path(options["baseline"]).read_text())
+            regressions = compare_results(
+                baseline, results, options["threshold"]
+            )
+            if regressions:
+                raise CommandError(
+                    "Regressions against the baseline:\n  "
+                    + "\n  ".join(regressions)
+                )
+            self.stdout.write(self.style.SUCCESS("No regressions."))
+
+    def run_size(self, size, endpoints, options):
+        users = min(max(size // 100, 20), 5_000)
+        boards = min(max(size // 500, 5), 1_000)
+        # A database file per size: connections that other threads opened
+        # to an in-memory database would keep it alive for the next size.
+        test_settings = connection.settings_dict["TEST"]
+        connection.settings_dict["TEST"] = {
+            **test_settings,
+            "NAME": str(Path(self.directory) / f"bench-{size}.sqlite3"),
+        }
+        old_name = connection.creation.create_test_db(
+            verbosity=0, autoclobber=True, serialize=False
+        )
+        token_cache.clear()
+        board_access.clear()
+        board_cache.clear()
+        unknown_emails.clear()
+        user_autocomplete.clear()
+        try:
+            started = time.perf_counter()
+            call_command(
+                "generate_dataset",
+                users=users,
+                boards=boards,
+                tasks=size,
+                seed=options["seed"],
+                password=PASSWORD,
+                stdout=io.StringIO(),
+            )
+            self.stdout.write(
+                f"\n{size} tasks, {users} users, {boards} boards "
+                f"(generated in {time.perf_counter() - started:.1f} s)"
+            )
+            context = self.build_context()
+            # Searches measure the loaded index, not the query fallback
+            # served while it loads in the background.
+            user_autocomplete.load()
+            measured = {}
+            for endpoint in endpoints:
+                measured[endpoint.name] = stats = self.measure(
+                    endpoint, context, options
+                )
+                self.stdout.write(
+                    f"  {endpoint.name:<40} p50 {stats['p50_ms']:7.2f} ms  "
+                    f"p95 {stats['p95_ms']:7.2f} ms  "
+                    f"p99 {stats['p99_ms']:7.2f} ms  "
+                    f"{stats['ops_per_sec']:7.1f}/s  "
+                    f"{stats['queries']:3} queries  "
+                    f"{stats['peak_memory_kb']:8.0f} KiB"
+                )
+            return {
+                "dataset": {"tasks": size, "users": users, "boards": boards},
+                "endpoints": measured,
+                "board_cache": board_cache.stats(),
+            }
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            connection.settings_dict["TEST"] = test_settings
+            token_cache.clear()
+            board_access.clear()
+            board_cache.clear()
+            unknown_emails.clear()
+            user_autocomplete.clear()
+
+    def build_context(self) -> dict:
+        """
+        Pick the benchmark user and the objects the requests refer to.
+        """
+        board = (
+            Board.objects.select_related("owner__user")
+            .annotate(task_total=Count("tickets"))
+            .order_by("-task_total", "pk")
+            .first()
+        )
+        profile = board.owner
+        task = (
+            Task.objects.filter(board=board)
+            .order_by("-comments_count")
+            .first()
+        )
+        member = board.members.exclude(pk=profile.pk).first() or profile
+        return {
+            "profile": profile.pk,
+            "board": board.pk,
+            "task": task.pk,
+            "member": member.pk,
+            "email": member.user.email,
+            "user_email": profile.user.email,
+            "token": Token.objects.get(user_id=profile.user_id).key,
+        }
+
+    def measure(self, endpoint, context, options) -> dict:
+        """
+        Request an endpoint repeatedly and summarize the measurements.
+
+        Stops early once the timed requests took longer than
+        `--time-limit`, so slow endpoints such as the password hashing
+        ones get at least MIN_SAMPLES samples instead of `--iterations`.
+        """
+        client = (
+            Client(HTTP_AUTHORIZATION=f"Token {context['token']}")
+            if endpoint.authenticated
+            else Client()
+        )
+        for _ in range(options["warmup"]):
+            self.request(client, endpoint, context)
+
+        durations = []
+        queries = 0
+        while len(durations) < options["iterations"]:
+            elapsed, count, _ = self.request(client, endpoint, context)
+            durations.append(elapsed)
+            queries = max(queries, count)
+            if (
+                len(durations) >= MIN_SAMPLES
+                and sum(durations) > options["time_limit"]
+            ):
+                break
+
+        _, _, peak = self.request(client, endpoint, context, trace=True)
+
+        return {
+            **summarize(durations),
+            "queries": queries,
+            "peak_memory_kb": peak / 1024,
+        }
+
+    def request(self, client, endpoint, context, trace=False):
+        """
+        Send one request and return its duration, query count and,
+        with `trace`, the peak memory traced while it was handled.
+        """
+        request_context = {**context, "n": next(self.counter)}
+        if endpoint.setup:
+            request_context.update(endpoint.setup(request_context))
+        path, body = endpoint.build(request_context)
+        headers = {}
+        if endpoint.conditional:
+            headers["If-None-Match"] = client.get(path)["ETag"]
+
+        collector = QueryCollector()
+        peak = 0
+        if trace:
+            tracemalloc.start()
+        try:
+            started = time.perf_counter()
+            with collector.install():
+                response = client.generic(
+                    endpoint.method,
+                    path,
+                    body,
+                    content_type="application/json",
+                    headers=headers,
+                )
+            elapsed = time.perf_counter() - started
+            if trace:
+                _, peak = tracemalloc.get_traced_memory()
+        finally:
+            if trace:
+                tracemalloc.stop()
+
+        if response.status_code != endpoint.status:
+            raise CommandError(
+                f"{endpoint.name} {path} returned {response.status_code}, "
+                f"expected {endpoint.status}: {response.content[:200]!r}"
+            )
+        return elapsed, collector.count, peak
@@ -0,0 +1,113 @@
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, connections, transaction
+from django.db.utils import OperationalError
+
+from core.benchmark import summarize
+from core.sqlite import connection_stats, is_lock_error
+
+TABLE = "core_write_benchmark"
+
+
+class Command(BaseCommand):
+    """
+    Run concurrent writers against the database and report locking.
+
+    Every writer thread alternates autocommit inserts and short
+    read-then-write transactions on a scratch table. Reports write
+    latency, "database is locked" errors and the lock statistics of
+    every writer connection. Compare the default profile with
+    `DB_PROFILE=production`. The scratch table is dropped at the end.
+    """
+
+    help = "Benchmark concurrent SQLite writes and lock handling."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--writers", type=int, default=8)
+        parser.add_argument("--writes", type=int, default=200)
+
+    def handle(self, *args, **options):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {TABLE} "
+                "(id INTEGER PRIMARY KEY, writer INTEGER, value INTEGER)"
+            )
+            cursor.execute("PRAGMA journal_mode")
+            journal_mode = cursor.fetchone()[0]
+        connection.close()
+
+        durations = []
+        errors = []
+        stats = []
+        barrier = threading.Barrier(options["writers"])
+
+        def writer(number):
+            barrier.wait()
+            try:
+                for i in range(options["writes"]):
+                    started = time.perf_counter()
+                    try:
+                        self.write(number, i)
+                    except OperationalError as exc:
+                        if not is_lock_error(exc):
+                            raise
+                        errors.append(exc)
+                    durations.append(time.perf_counter() - started)
+                stats.extend(
+                    entry
+                    for entry in connection_stats()
+                    if entry["thread"] == threading.get_ident()
+                )
+            finally:
+                connections.close_all()
+
+        threads = [
+            threading.Thread(target=writer, args=(number,))
+            for number in range(options["writers"])
+        ]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE {TABLE}")
+
+        summary = summarize(durations)
+        self.stdout.write(
+            f"journal_mode {journal_mode}: {len(durations) / elapsed:.0f} "
+            f"writes/s, p50 {summary['p50_ms']:.1f} ms, "
+            f"p99 {summary['p99_ms']:.1f} ms, {len(errors)} locked errors"
+        )
+        for entry in stats:
+            self.stdout.write(
+                f"  connection {entry['thread']}: "
+                f"{entry['lock_waits']} lock waits, "
+                f"{entry['retries']} retries, {entry['failures']} failures, "
+                f"waited {entry['lock_wait_seconds'] * 1000:.0f} ms "
+                f"(max {entry['max_lock_wait_seconds'] * 1000:.0f} ms)"
+            )
+
+    def write(self, number, i):
+        with connection.cursor() as cursor:
+            if i % 2:
+                cursor.execute(
+                    f"INSERT INTO {TABLE} (writer, value) VALUES (%s, %s)",
+                    [number, i],
+                )
+                return
+
+            with transaction.atomic():
+                cursor.execute(
+                    f"SELECT MAX(value) FROM {TABLE} WHERE writer = %s",
+                    [number],
+                )
+                value = cursor.fetchone()[0] or 0
+                cursor.execute(
+                    f"INSERT INTO {TABLE} (writer, value) VALUES (%s, %s)",
+                    [number, value + 1],
+                )
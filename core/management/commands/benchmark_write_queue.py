@@ -0,0 +1,175 @@
+import datetime
+import io
+import json
+import logging
+import sys
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.core.wsgi import get_wsgi_application
+from django.db import connections
+from django.db.models import Max
+from rest_framework.authtoken.models import Token
+
+from auth_app.models import UserProfile
+from boards_app.models import Board, BoardChange
+from core.benchmark import summarize
+from core.write_queue import write_queue
+from tasks_app.models import Task
+
+
+class Command(BaseCommand):
+    """
+    Measure write latency under contention with and without the queue.
+
+    Worker threads send task PATCHes and comment POSTs concurrently
+    through the WSGI application, first with every request writing in
+    its own thread, then with the writes going through the write
+    queue. Reports throughput, latency percentiles and failed requests
+    for both runs. The temporary user and board are deleted at the
+    end.
+    """
+
+    help = "Benchmark writes with and without the write queue."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=16)
+        parser.add_argument("--writes", type=int, default=100)
+        parser.add_argument("--tasks", type=int, default=20)
+
+    def handle(self, *args, **options):
+        user, profile = self.create_profile()
+        board = None
+        request_logger = logging.getLogger("django.request")
+        level = request_logger.level
+        request_logger.setLevel(logging.CRITICAL)
+        enabled = write_queue.enabled
+        try:
+            token = Token.objects.create(user=user)
+            board = Board.objects.create(owner=profile, title="Write queue")
+            board.members.add(profile)
+            tasks = Task.objects.bulk_create(
+                Task(
+                    board=board,
+                    creator=profile,
+                    title=f"Task {i}",
+                    due_date=datetime.date(2026, 1, 1),
+                )
+                for i in range(options["tasks"])
+            )
+            self.stdout.write(
+                f"database profile: {settings.DB_PROFILE}, "
+                f"{options['workers']} workers"
+            )
+            for queued in (False, True):
+                write_queue.enabled = queued
+                self.run_writes(
+                    "queue" if queued else "direct",
+                    token.key,
+                    [task.pk for task in tasks],
+                    options["workers"],
+                    options["writes"],
+                )
+            self.stdout.write(f"queue stats: {write_queue.stats()}")
+        finally:
+            write_queue.enabled = enabled
+            request_logger.setLevel(level)
+            user.delete()
+            if board is not None:
+                BoardChange.objects.filter(board_id=board.pk).delete()
+
+    def create_profile(self):
+        """
+        Create a user and profile sharing the same ID.
+
+        The board permissions compare the user's ID with profile IDs,
+        so both are aligned for the benchmark user.
+        """
+        pk = 1 + max(
+            User.objects.aggregate(pk=Max("pk"))["pk"] or 0,
+            UserProfile.objects.aggregate(pk=Max("pk"))["pk"] or 0,
+        )
+        user = User.objects.create(
+            pk=pk,
+            username="write-queue@example.com",
+            email="write-queue@example.com",
+        )
+        profile = UserProfile.objects.create(
+            pk=pk, user=user, fullname="Write Queue"
+        )
+        return user, profile
+
+    def run_writes(self, label, token, task_ids, workers, writes):
+        application = get_wsgi_application()
+        durations = []
+        failures = []
+        barrier = threading.Barrier(workers)
+
+        def request(method, path, payload):
+            body = json.dumps(payload).encode()
+            environ = {
+                "REQUEST_METHOD": method,
+                "PATH_INFO": path,
+                "QUERY_STRING": "",
+                "CONTENT_TYPE": "application/json",
+                "CONTENT_LENGTH": str(len(body)),
+                "SERVER_NAME": "localhost",
+                "SERVER_PORT": "80",
+                "SERVER_PROTOCOL": "HTTP/1.1",
+                "HTTP_HOST": "localhost",
+                "HTTP_AUTHORIZATION": f"Token {token}",
+                "wsgi.url_scheme": "http",
+                "wsgi.input": io.BytesIO(body),
+                "wsgi.errors": sys.stderr,
+            }
+            statuses = []
+            started = time.perf_counter()
+            response = application(
+                environ, lambda status, headers: statuses.append(status)
+            )
+            b"".join(response)
+            response.close()
+            durations.append(time.perf_counter() - started)
+            if statuses[0][0] != "2":
+                failures.append(statuses[0])
+
+        def worker(number):
+            barrier.wait()
+            try:
+                for i in range(writes):
+                    task_id = task_ids[(number + i) % len(task_ids)]
+                    if i % 2:
+                        request(
+                            "POST",
+                            f"/api/tasks/{task_id}/comments/",
+                            {"content": f"Comment {number}-{i}"},
+                        )
+                    else:
+                        request(
+                            "PATCH",
+                            f"/api/tasks/{task_id}/",
+                            {"title": f"Task {number}-{i}"},
+                        )
+            finally:
+                connections.close_all()
+
+        threads = [
+            threading.Thread(target=worker, args=(number,))
+            for number in range(workers)
+        ]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        stats = summarize(durations)
+        self.stdout.write(
+            f"{label}: {len(durations) / elapsed:.0f} writes/s, "
+            f"p50 {stats['p50_ms']:.1f} ms, p95 {stats['p95_ms']:.1f} ms, "
+            f"p99 {stats['p99_ms']:.1f} ms, {len(failures)} failed"
+        )
@@ -0,0 +1,247 @@
+import datetime
+import itertools
+import random
+import time
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.authtoken.models import Token
+
+from auth_app.models import UserProfile
+from boards_app.models import Board
+from tasks_app.models import Comment, Task
+
+WORDS = (
+    "api backend bug cache client config database deploy design docs "
+    "endpoint error feature fix frontend index layout login migration "
+    "mobile monitoring onboarding page payment performance query "
+    "refactor release report review search security server settings "
+    "signup sprint styles sync test token upload user validation"
+).split()
+
+STATUSES = [choice for choice, _ in Task.Status.choices]
+STATUS_WEIGHTS = [15, 40, 30, 15]
+PRIORITIES = [choice for choice, _ in Task.Priority.choices]
+PRIORITY_WEIGHTS = [30, 50, 20]
+DUE_START = datetime.date(2026, 1, 1)
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def distribute(total: int, weights) -> list[int]:
+    """
+    Split total into integer parts proportional to weights.
+    """
+    weight_sum = sum(weights)
+    counts = [int(total * weight / weight_sum) for weight in weights]
+    for i in range(total - sum(counts)):
+        counts[i % len(counts)] += 1
+    return counts
+
+
+class Command(BaseCommand):
+    """
+    Generate a synthetic dataset for load and scale testing.
+
+    Creates users with profiles and tokens, boards with members, and
+    tasks and comments. Board sizes follow a Zipf distribution, so a
+    few boards hold most of the tasks, and larger boards get more
+    members. Comment counts per task are exponentially distributed
+    and `comments_count` is set accordingly. All values except the
+    token keys derive from the seed, so the same arguments always
+    produce the same data. The token keys are random like those of
+    real users, since seeded keys could be recomputed by anyone.
+
+    Rows are written with bulk_create in batches, bypassing model
+    signals, so run it against a freshly migrated database, e.g.
+    `DB_NAME=load.sqlite3`. Every user gets the password given with
+    the required `--password` and each profile shares its ID with
+    its user.
+    """
+
+    help = "Generate users, boards, tasks and comments for load testing."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1_000)
+        parser.add_argument("--boards", type=int, default=200)
+        parser.add_argument("--tasks", type=int, default=100_000)
+        parser.add_argument(
+            "--comments",
+            type=float,
+            default=2.0,
+            help="Mean number of comments per task.",
+        )
+        parser.add_argument(
+            "--skew",
+            type=float,
+            default=1.2,
+            help="Zipf exponent of the board sizes.",
+        )
+        parser.add_argument("--seed", type=int, default=1)
+        parser.add_argument("--batch-size", type=int, default=5_000)
+        parser.add_argument("--prefix", default="load")
+        parser.add_argument(
+            "--password",
+            required=True,
+            help="Password of every generated user.",
+        )
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options["seed"])
+        self.batch_size = options["batch_size"]
+        self.prefix = options["prefix"]
+        if options["users"] < 2 or options["boards"] < 1:
+            raise CommandError("At least 2 users and 1 board are required.")
+        if User.objects.filter(
+            username__startswith=f"{self.prefix}-"
+        ).exists():
+            raise CommandError(
+                f'Users with the prefix "{self.prefix}" already exist, use '
+                "a fresh database or another --prefix."
+            )
+
+        started = time.perf_counter()
+        profile_ids = self.create_users(options["users"], options["password"])
+        boards = self.create_boards(
+            profile_ids, options["boards"], options["tasks"], options["skew"]
+        )
+        tasks, comments = self.create_tasks(boards, options["comments"])
+
+        self.stdout.write(
+            f"Created {len(profile_ids)} users, {len(boards)} boards, "
+            f"{tasks} tasks and {comments} comments in "
+            f"{time.perf_counter() - started:.1f} s."
+        )
+
+    def words(self, low: int, high: int) -> str:
+        return " ".join(self.rng.choices(WORDS, k=self.rng.randint(low, high)))
+
+    def create_users(self, count, password) -> list[int]:
+        password_hash = make_password(password)
+        profile_ids = []
+        for numbers in batched(range(count), self.batch_size):
+            with transaction.atomic():
+                users = User.objects.bulk_create(
+                    User(
+                        username=f"{self.prefix}-{n}@example.com",
+                        email=f"{self.prefix}-{n}@example.com",
+                        first_name="Load",
+                        last_name=f"User {n}",
+                        password=password_hash,
+                    )
+                    for n in numbers
+                )
+                # The board permissions compare user IDs with profile IDs.
+                UserProfile.objects.bulk_create(
+                    UserProfile(
+                        pk=user.pk, user=user, fullname=f"Load User {n}"
+                    )
+                    for n, user in zip(numbers, users)
+                )
+                Token.objects.bulk_create(
+                    Token(key=Token.generate_key(), user=user)
+                    for user in users
+                )
+            profile_ids.extend(user.pk for user in users)
+        self.stdout.write(f"Users: {len(profile_ids)}")
+        return profile_ids
+
+    def create_boards(self, profile_ids, count, task_total, skew):
+        """
+        Create the boards and their members.
+
+        Returns (board, member_ids, task_count) tuples. Members are
+        sampled per board, with the owner always a member.
+        """
+        weights = [1 / (rank**skew) for rank in range(1, count + 1)]
+        self.rng.shuffle(weights)
+        task_counts = distribute(task_total, weights)
+
+        plans = []
+        for task_count in task_counts:
+            member_count = int(
+                2 + 2 * task_count**0.3 * self.rng.uniform(0.7, 1.3)
+            )
+            member_count = min(member_count, len(profile_ids), 200)
+            plans.append(
+                (self.rng.sample(profile_ids, member_count), task_count)
+            )
+
+        boards = []
+        for batch in batched(enumerate(plans), self.batch_size):
+            with transaction.atomic():
+                created = Board.objects.bulk_create(
+                    Board(
+                        owner_id=members[0],
+                        title=f"Board {n}: {self.words(1, 3)}",
+                    )
+                    for n, (members, _) in batch
+                )
+                Board.members.through.objects.bulk_create(
+                    Board.members.through(
+                        board_id=board.pk, userprofile_id=member_id
+                    )
+                    for board, (_, (members, _)) in zip(created, batch)
+                    for member_id in members
+                )
+            boards.extend(
+                (board, members, task_count)
+                for board, (_, (members, task_count)) in zip(created, batch)
+            )
+        self.stdout.write(
+            f"Boards: {len(boards)}, largest has {max(task_counts)} tasks"
+        )
+        return boards
+
+    def build_task(self, board, members):
+        rng = self.rng
+        return Task(
+            board_id=board.pk,
+            creator_id=rng.choice(members),
+            title=self.words(2, 6),
+            description=self.words(0, 20),
+            assignee_id=rng.choice(members) if rng.random() < 0.8 else None,
+            reviewer_id=rng.choice(members) if rng.random() < 0.4 else None,
+            status=rng.choices(STATUSES, STATUS_WEIGHTS)[0],
+            priority=rng.choices(PRIORITIES, PRIORITY_WEIGHTS)[0],
+            due_date=DUE_START + datetime.timedelta(rng.randrange(365)),
+            comments_count=int(rng.expovariate(1 / self.comment_mean))
+            if self.comment_mean
+            else 0,
+        )
+
+    def create_tasks(self, boards, comment_mean):
+        self.comment_mean = comment_mean
+        planned = (
+            (self.build_task(board, members), members)
+            for board, members, task_count in boards
+            for _ in range(task_count)
+        )
+
+        task_total = comment_total = 0
+        for number, batch in enumerate(batched(planned, self.batch_size), 1):
+            with transaction.atomic():
+                tasks = Task.objects.bulk_create(task for task, _ in batch)
+                comments = (
+                    Comment(
+                        task_id=task.pk,
+                        author_id=self.rng.choice(members),
+                        content=self.words(3, 15),
+                    )
+                    for task, (_, members) in zip(tasks, batch)
+                    for _ in range(task.comments_count)
+                )
+                for comment_batch in batched(comments, self.batch_size):
+                    Comment.objects.bulk_create(comment_batch)
+                    comment_total += len(comment_batch)
+
+            task_total += len(tasks)
+            if number % 20 == 0:
+                self.stdout.write(f"Tasks: {task_total}")
+        return task_total, comment_total
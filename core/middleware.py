@@ -0,0 +1,171 @@
+import json
+import logging
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+from asgiref.sync import (
+    iscoroutinefunction,
+    markcoroutinefunction,
+    sync_to_async,
+)
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger("core.queries")
+
+
+class QueryBudgetExceeded(Exception):
+    """
+    Raised when a request runs more queries than its route allows and
+    QUERY_INSTRUMENTATION["BUDGET_ACTION"] is "raise".
+    """
+
+
+class QueryCollector:
+    """
+    Execute wrapper counting the queries and DB time of one request.
+
+    Statements are grouped by their SQL text, which is identical for
+    repeated executions of the same query with different parameters,
+    so a statement executed more than once is a duplicate and usually
+    the signature of an N+1 access pattern.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+            self.count += 1
+            self.statements[sql] += 1
+
+    @property
+    def duplicates(self) -> int:
+        return sum(n - 1 for n in self.statements.values() if n > 1)
+
+    def top_duplicate(self):
+        """
+        Return the most repeated statement and its count, or None.
+        """
+        if not self.statements:
+            return None
+        sql, count = self.statements.most_common(1)[0]
+        return (sql, count) if count > 1 else None
+
+    def install(self) -> ExitStack:
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(self))
+        return stack
+
+
+class QueryInstrumentationMiddleware:
+    """
+    Report the queries and DB time of every request.
+
+    Adds a `Server-Timing` header with the DB time, query count and
+    duplicate count, and writes one JSON log line per request to the
+    `core.queries` logger at INFO level. Requests exceeding the query
+    budget of their route (looked up by URL name, then by route) are
+    logged at WARNING level or, with BUDGET_ACTION "raise", fail with
+    QueryBudgetExceeded. Queries run by the write queue's thread are
+    not counted. Works for sync and async views: in async mode
+    the collector is installed on the thread that runs the request's
+    thread-sensitive database calls.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        config = getattr(settings, "QUERY_INSTRUMENTATION", {})
+        self.server_timing = config.get("SERVER_TIMING", True)
+        self.budgets = config.get("BUDGETS", {})
+        self.default_budget = config.get("DEFAULT_BUDGET")
+        self.raise_on_budget = config.get("BUDGET_ACTION", "log") == "raise"
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        started = time.perf_counter()
+        collector = QueryCollector()
+        with collector.install():
+            response = self.get_response(request)
+        return self.finish(request, response, collector, started)
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        collector = QueryCollector()
+        stack = await sync_to_async(collector.install)()
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        return self.finish(request, response, collector, started)
+
+    def get_budget(self, request):
+        """
+        Return the query budget of the request's route.
+
+        Keys are tried from the most to the least specific: method and
+        URL name ("GET boards-list"), URL name, method and route, and
+        route.
+        """
+        match = request.resolver_match
+        if match is None:
+            return self.default_budget
+        for key in (match.view_name, match.route):
+            for name in (f"{request.method} {key}", key):
+                if name in self.budgets:
+                    return self.budgets[name]
+        return self.default_budget
+
+    def finish(self, request, response, collector, started):
+        total_ms = (time.perf_counter() - started) * 1000
+        db_ms = collector.duration * 1000
+        duplicates = collector.duplicates
+
+        if self.server_timing:
+            response["Server-Timing"] = (
+                f'db;dur={db_ms:.2f};desc="{collector.count} queries, '
+                f'{duplicates} duplicates", app;dur={total_ms:.2f}'
+            )
+
+        budget = self.get_budget(request)
+        over_budget = budget is not None and collector.count > budget
+        level = logging.WARNING if over_budget else logging.INFO
+        if logger.isEnabledFor(level):
+            match = request.resolver_match
+            entry = {
+                "method": request.method,
+                "path": request.path,
+                "route": match.view_name if match else None,
+                "status": response.status_code,
+                "queries": collector.count,
+                "duplicates": duplicates,
+                "db_ms": round(db_ms, 2),
+                "total_ms": round(total_ms, 2),
+                "budget": budget,
+            }
+            top = collector.top_duplicate()
+            if top:
+                entry["top_duplicate"] = {"sql": top[0][:200], "count": top[1]}
+            logger.log(level, json.dumps(entry))
+
+        if over_budget and self.raise_on_budget:
+            raise QueryBudgetExceeded(
+                f"{request.method} {request.path} ran {collector.count} "
+                f"queries, the budget is {budget}."
+            )
+        return response
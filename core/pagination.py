@@ -0,0 +1,215 @@
+import base64
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Opaque-cursor keyset pagination over a composite ordering.
+
+    Pages are selected with a range condition on the ordering fields
+    of the last (or first) row of the previous page, so fetching page
+    N costs the same as fetching the first page when an index covers
+    the ordering. The last ordering field must be unique, e.g. `id`.
+
+    Unless `optional` is False, pagination is opt-in: it is only
+    applied when the request contains the `cursor` or `page_size`
+    query parameter, otherwise the view returns the unpaginated list.
+    """
+
+    ordering: tuple[str, ...] = ("id",)
+    optional = True
+    page_size = 50
+    max_page_size = 200
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset = self.prepare_queryset(queryset, request)
+        if queryset is None:
+            return None
+        return self.finish_page(list(queryset[: self.page_size + 1]))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        Async variant of paginate_queryset for async views.
+        """
+        queryset = self.prepare_queryset(queryset, request)
+        if queryset is None:
+            return None
+        rows = queryset[: self.page_size + 1]
+        return self.finish_page([row async for row in rows.aiterator()])
+
+    def prepare_queryset(self, queryset, request):
+        """
+        Return the queryset ordered and filtered for the requested
+        page, or None if pagination is not requested.
+        """
+        params = request.query_params
+        if (
+            self.optional
+            and self.cursor_query_param not in params
+            and self.page_size_query_param not in params
+        ):
+            return None
+
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.fields = [
+            queryset.model._meta.get_field(name) for name in self.ordering
+        ]
+
+        self.cursor_values, self.reverse = self.decode_cursor(request)
+        queryset = queryset.order_by(
+            *(f"-{name}" if self.reverse else name for name in self.ordering)
+        )
+        if self.cursor_values is not None:
+            queryset = queryset.filter(
+                self.build_seek_filter(self.cursor_values, self.reverse)
+            )
+        return queryset
+
+    def finish_page(self, rows):
+        """
+        Trim the rows fetched for a page, which include one extra row
+        to detect further pages, and store the page state.
+        """
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if self.reverse:
+            rows.reverse()
+
+        has_cursor = self.cursor_values is not None
+        self.has_next = has_more if not self.reverse else has_cursor
+        self.has_previous = has_cursor if not self.reverse else has_more
+        self.page = rows
+        return rows
+
+    def get_page_size(self, request) -> int:
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def build_seek_filter(self, values, reverse: bool) -> Q:
+        """
+        Build the condition selecting rows after (or before) values.
+
+        The leading field is constrained with an inclusive range so
+        the database can seek into the index. Ties on each field are
+        broken by the following fields of the ordering.
+        """
+        op = "lt" if reverse else "gt"
+        names = self.ordering
+        after = Q(**{f"{names[-1]}__{op}": values[-1]})
+        for name, value in zip(reversed(names[:-1]), reversed(values[:-1])):
+            after = Q(**{f"{name}__{op}": value}) | (
+                Q(**{name: value}) & after
+            )
+        leading = Q(**{f"{names[0]}__{op}e": values[0]})
+        return leading & after
+
+    def encode_cursor(self, row, reverse: bool) -> str:
+        values = [field.value_to_string(row) for field in self.fields]
+        payload = json.dumps({"v": values, "r": int(reverse)})
+        cursor = base64.urlsafe_b64encode(payload.encode()).decode()
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, cursor
+        )
+
+    def decode_cursor(self, request):
+        """
+        Return the ordering values and direction encoded in the cursor.
+
+        Returns (None, False) when no cursor is given and raises
+        NotFound for cursors that cannot be decoded or hold null or
+        structured values.
+        """
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None, False
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            raw_values = payload["v"]
+            if not isinstance(raw_values, list) or len(raw_values) != len(
+                self.fields
+            ):
+                raise ValueError
+            values = [
+                field.to_python(value)
+                for field, value in zip(self.fields, raw_values)
+                if isinstance(value, (str, int, float))
+            ]
+            # Null or structured values were dropped above, and no
+            # seek condition can be built for them.
+            if len(values) != len(self.fields) or None in values:
+                raise ValueError
+            return values, bool(payload.get("r"))
+        except (TypeError, ValueError, KeyError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True},
+                "previous": {"type": "string", "nullable": True},
+                "results": schema,
+            },
+        }
+
+
+class TaskKeysetPagination(KeysetPagination):
+    """
+    Keyset pagination for task lists ordered by due date.
+    """
+
+    ordering = ("due_date", "id")
+
+
+class TaskSearchPagination(TaskKeysetPagination):
+    """
+    Keyset pagination for task search results, which are always paged.
+    """
+
+    optional = False
+
+
+class CommentKeysetPagination(KeysetPagination):
+    """
+    Keyset pagination for comment lists ordered by creation time.
+    """
+
+    ordering = ("created_at", "id")
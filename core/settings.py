@@ -30,9 +30,13 @@ if not SECRET_KEY:
     raise ValueError("SECRET_KEY is not set in the environment variables.")
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+# With DEBUG on, Django also keeps the last 9000 queries of every
+# connection in memory. Set DEBUG=0 in the environment to disable it.
+DEBUG = os.getenv("DEBUG", "1").lower() in ("1", "true", "yes")
 
-ALLOWED_HOSTS = []
+ALLOWED_HOSTS = [
+    host for host in os.getenv("ALLOWED_HOSTS", "").split(",") if host
+]
 
 
 # Application definition
@@ -47,12 +51,14 @@ INSTALLED_APPS = [
     "corsheaders",
     "rest_framework",
     "rest_framework.authtoken",
+    "core",
     "auth_app",
     "boards_app",
     "tasks_app",
 ]
 
 MIDDLEWARE = [
+    "core.middleware.QueryInstrumentationMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -93,10 +99,48 @@ WSGI_APPLICATION = "core.wsgi.application"
 DATABASES = {  # type: ignore
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+        "NAME": BASE_DIR / os.getenv("DB_NAME", "db.sqlite3"),
     }
 }
 
+# DB_NAME selects another database file in BASE_DIR, e.g. for a
+# dataset created by `manage.py generate_dataset`.
+# Set DB_PROFILE=production to tune SQLite for concurrent use. The
+# profile enables WAL and the PRAGMAs below on every connection,
+# keeps connections open between requests, opens atomic blocks with
+# BEGIN IMMEDIATE and retries statements that hit a locked database
+# with bounded exponential backoff (see core.sqlite). The driver
+# timeout is kept short so lock waits go through the retry loop,
+# where they are counted in the per-connection statistics.
+# Under ASGI, set DB_CONN_MAX_AGE=0: Django opens a connection per
+# request thread there, so persistent connections are not reused.
+DB_PROFILE = os.getenv("DB_PROFILE", "development")
+
+SQLITE = {}
+
+if DB_PROFILE == "production":
+    DATABASES["default"].update(
+        {
+            "CONN_MAX_AGE": int(os.getenv("DB_CONN_MAX_AGE", 600)),
+            "CONN_HEALTH_CHECKS": True,
+            "OPTIONS": {"timeout": 0.05, "transaction_mode": "IMMEDIATE"},
+        }
+    )
+    SQLITE = {
+        "PRAGMAS": {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "cache_size": -64_000,  # in KiB
+            "mmap_size": 256 * 1024 * 1024,
+            "temp_store": "MEMORY",
+        },
+        "LOCK_RETRY": {
+            "ATTEMPTS": 12,
+            "BASE_DELAY": 0.005,
+            "MAX_DELAY": 0.5,
+        },
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -116,6 +160,19 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Django's default hashers, with the PBKDF2 iteration count taken from
+# PASSWORD_HASH_ITERATIONS. Run `manage.py tune_password_hasher` for a
+# value matching this machine. Stored hashes with another cost are
+# upgraded in the background on the next login.
+PASSWORD_HASHERS = [
+    "auth_app.hashers.TunedPBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+PASSWORD_HASH_ITERATIONS = int(os.getenv("PASSWORD_HASH_ITERATIONS", 0))
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/6.0/topics/i18n/
@@ -135,7 +192,150 @@ USE_TZ = True
 STATIC_URL = "static/"
 
 REST_FRAMEWORK = {
+    # Use "rest_framework.authentication.TokenAuthentication" to disable
+    # the in-process token cache.
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.TokenAuthentication",
+        "auth_app.authentication.CachedTokenAuthentication",
     ]
 }
+
+# Render the board detail and the task lists from value rows instead
+# of through their DRF serializers. The JSON is the same; set
+# FAST_SERIALIZERS=0 to fall back to the serializers.
+FAST_SERIALIZERS = os.getenv("FAST_SERIALIZERS", "1") == "1"
+
+# In-process cache of resolved auth tokens used by
+# CachedTokenAuthentication. TTL is in seconds.
+TOKEN_AUTH_CACHE = {
+    "MAX_SIZE": 10_000,
+    "TTL": 300,
+}
+
+# In-process TTL set of emails unknown to /api/email-check/. TTL is in
+# seconds and bounds how long other processes miss a new user.
+EMAIL_CHECK_CACHE = {
+    "MAX_SIZE": 10_000,
+    "TTL": 60,
+}
+
+# In-process prefix index of /api/users/autocomplete/. Each process
+# rebuilds it after REBUILD_INTERVAL seconds to pick up the changes
+# other processes made.
+USER_AUTOCOMPLETE = {
+    "REBUILD_INTERVAL": 3600,
+}
+
+# In-process cache of board owners and members used by the board
+# permission checks. TTL is in seconds.
+BOARD_ACCESS_CACHE = {
+    "MAX_SIZE": 10_000,
+    "TTL": 60,
+}
+
+# The board response cache lives in its own cache so that it can be
+# cleared and sized independently. Set BOARD_CACHE_DIR to share it
+# between worker processes through a file-based cache.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "board_responses": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "board-responses",
+        "OPTIONS": {"MAX_ENTRIES": 1_000},
+    },
+}
+if os.getenv("BOARD_CACHE_DIR"):
+    CACHES["board_responses"] = {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.getenv("BOARD_CACHE_DIR"),
+        "OPTIONS": {"MAX_ENTRIES": 10_000},
+    }
+
+# Versioned cache of the board list and board detail payloads, see
+# boards_app.response_cache. TIMEOUT is in seconds.
+BOARD_RESPONSE_CACHE = {
+    "ENABLED": os.getenv("BOARD_RESPONSE_CACHE", "1") == "1",
+    "CACHE": "board_responses",
+    "TIMEOUT": 300,
+}
+
+# Maximum number of task items accepted by /api/tasks/bulk/.
+TASK_BULK_MAX_ITEMS = 5_000
+
+# Board change log used by /api/boards/{id}/changes/. RETENTION and
+# COMPACT_INTERVAL are in seconds, set COMPACT_INTERVAL to None to
+# disable background compaction.
+CHANGE_LOG = {
+    "RETENTION": 7 * 24 * 3600,
+    "COMPACT_INTERVAL": 3600,
+}
+
+# Live board events served by /api/boards/{id}/events/. BACKEND is
+# InProcessBackend for a single worker or ChangeLogBackend when
+# several worker processes serve events. HEARTBEAT and POLL_INTERVAL
+# are in seconds, QUEUE_SIZE is the number of undelivered events kept
+# per subscriber.
+BOARD_EVENTS = {
+    "BACKEND": "boards_app.events.InProcessBackend",
+    "HEARTBEAT": 15,
+    "QUEUE_SIZE": 100,
+    "POLL_INTERVAL": 1.0,
+}
+
+# Single writer thread per process for the write endpoints of boards,
+# tasks and comments (see core.write_queue). Enable with WRITE_QUEUE=1.
+# MAX_BATCH is the maximum number of writes committed together.
+WRITE_QUEUE = {
+    "ENABLED": os.getenv("WRITE_QUEUE", "0") == "1",
+    "MAX_BATCH": 64,
+}
+
+# Bounded thread pool running the password hashes of login and
+# registration (see auth_app.hashing). At most WORKERS hashes run at a
+# time and at most MAX_QUEUED wait for a worker, further logins get a
+# 503 with Retry-After: RETRY_AFTER seconds.
+PASSWORD_HASHING = {
+    "ENABLED": os.getenv("PASSWORD_HASHING_POOL", "1") == "1",
+    "WORKERS": int(os.getenv("PASSWORD_HASH_WORKERS", 2)),
+    "MAX_QUEUED": int(os.getenv("PASSWORD_HASH_MAX_QUEUED", 32)),
+    "RETRY_AFTER": 1,
+}
+
+# Per-request query instrumentation (core.middleware). BUDGETS maps URL
+# names or routes, optionally prefixed with the HTTP method, to the
+# maximum number of queries of a request, including the token and
+# board access cache misses. DEFAULT_BUDGET applies to all other
+# routes, None disables the check.
+# BUDGET_ACTION is "log" or "raise". Requests over budget are logged
+# as warnings, set QUERY_LOG_LEVEL=INFO to log every request.
+QUERY_INSTRUMENTATION = {
+    "SERVER_TIMING": True,
+    "DEFAULT_BUDGET": None,
+    "BUDGETS": {
+        "GET boards-list": 4,
+        "POST boards-list": 11,
+        "GET boards-detail": 8,
+        "GET boards-changes": 10,
+        "PATCH tasks-detail": 12,
+        "GET tasks-assigned-to-me": 3,
+        "GET tasks-reviewing": 3,
+        "GET tasks-search": 4,
+        "GET task-comments": 5,
+        "POST task-comments": 12,
+    },
+    "BUDGET_ACTION": os.getenv("QUERY_BUDGET_ACTION", "log"),
+}
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {"console": {"class": "logging.StreamHandler"}},
+    "loggers": {
+        "core.queries": {
+            "handlers": ["console"],
+            "level": os.getenv("QUERY_LOG_LEVEL", "WARNING"),
+            "propagate": False,
+        },
+    },
+}
@@ -0,0 +1,159 @@
+import random
+import threading
+import time
+import weakref
+
+from django.conf import settings
+from django.db.utils import OperationalError
+
+LOCK_ERRORS = ("database is locked", "database table is locked", "busy")
+
+_registry = weakref.WeakSet()
+_registry_lock = threading.Lock()
+
+
+class ConnectionStats:
+    """
+    Lock statistics of a single database connection.
+
+    `connections` counts how often the connection was (re)opened,
+    which stays at one while persistent connections are reused.
+    `lock_wait_seconds` is the time spent in statements that hit a
+    lock, including the backoff between their attempts.
+    """
+
+    def __init__(self):
+        self.connections = 0
+        self.lock_waits = 0
+        self.retries = 0
+        self.failures = 0
+        self.lock_wait_seconds = 0.0
+        self.max_lock_wait_seconds = 0.0
+
+    def record_wait(self, seconds: float, failed: bool = False) -> None:
+        if failed:
+            self.failures += 1
+        else:
+            self.lock_waits += 1
+        self.lock_wait_seconds += seconds
+        self.max_lock_wait_seconds = max(self.max_lock_wait_seconds, seconds)
+
+    def as_dict(self) -> dict:
+        return {
+            "connections": self.connections,
+            "lock_waits": self.lock_waits,
+            "retries": self.retries,
+            "failures": self.failures,
+            "lock_wait_seconds": self.lock_wait_seconds,
+            "max_lock_wait_seconds": self.max_lock_wait_seconds,
+        }
+
+
+def is_lock_error(exc: Exception) -> bool:
+    message = str(exc).lower()
+    return any(error in message for error in LOCK_ERRORS)
+
+
+class LockRetry:
+    """
+    Execute wrapper retrying statements that fail on a locked database.
+
+    Only statements outside of atomic blocks are retried. That covers
+    autocommit writes and the BEGIN that opens an atomic block, which
+    takes the write lock up front when the connection uses
+    `transaction_mode: IMMEDIATE`. A statement inside a transaction
+    cannot be retried on its own, its error is raised as before.
+    Delays grow exponentially with jitter and are bounded by
+    `max_delay`; after `attempts` tries the error is raised.
+    """
+
+    def __init__(
+        self, stats: ConnectionStats, attempts: int, base_delay, max_delay
+    ):
+        self.stats = stats
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def __call__(self, execute, sql, params, many, context):
+        connection = context["connection"]
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                result = execute(sql, params, many, context)
+            except OperationalError as exc:
+                if not is_lock_error(exc) or connection.in_atomic_block:
+                    raise
+                attempt += 1
+                if attempt >= self.attempts:
+                    self.stats.record_wait(
+                        time.monotonic() - started, failed=True
+                    )
+                    raise
+                self.stats.retries += 1
+                delay = min(self.max_delay, self.base_delay * 2**attempt)
+                time.sleep(delay * random.uniform(0.5, 1.0))
+            else:
+                if attempt:
+                    self.stats.record_wait(time.monotonic() - started)
+                return result
+
+
+def stats_for(connection) -> ConnectionStats:
+    """
+    Return the statistics of a connection, creating them on first use.
+    """
+    stats = getattr(connection, "sqlite_stats", None)
+    if stats is None:
+        stats = connection.sqlite_stats = ConnectionStats()
+        with _registry_lock:
+            _registry.add(connection)
+    return stats
+
+
+def connection_stats() -> list[dict]:
+    """
+    Return the statistics of all live SQLite connections of the
+    process, one entry per connection (i.e. per thread and alias).
+    """
+    with _registry_lock:
+        connections = list(_registry)
+    return [
+        {
+            "alias": connection.alias,
+            "thread": connection._thread_ident,
+            **connection.sqlite_stats.as_dict(),
+        }
+        for connection in connections
+    ]
+
+
+def configure_connection(sender, connection, **kwargs):
+    """
+    connection_created handler applying the SQLITE settings.
+
+    Sets the configured PRAGMAs on every new connection and installs
+    the LockRetry wrapper once per connection object. Does nothing
+    for other databases or when SQLITE is not configured.
+    """
+    if connection.vendor != "sqlite":
+        return
+    config = getattr(settings, "SQLITE", {})
+    stats = stats_for(connection)
+    stats.connections += 1
+
+    for name, value in config.get("PRAGMAS", {}).items():
+        connection.connection.execute(f"PRAGMA {name} = {value}")
+
+    retry = config.get("LOCK_RETRY")
+    if retry and not getattr(connection, "sqlite_lock_retry", None):
+        connection.sqlite_lock_retry = LockRetry(
+            stats,
+            attempts=retry.get("ATTEMPTS", 10),
+            base_delay=retry.get("BASE_DELAY", 0.005),
+            max_delay=retry.get("MAX_DELAY", 0.5),
+        )
+        # Outermost position: execute_wrapper() context managers pop
+        # the last wrapper when they exit.
+        connection.execute_wrappers.insert(0, connection.sqlite_lock_retry)
@@ -0,0 +1,135 @@
+import io
+
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from auth_app.models import UserProfile
+from boards_app.models import Board
+from core.benchmark import compare_results
+from core.management.commands.bench_endpoints import uncovered_routes
+from core.middleware import QueryBudgetExceeded
+
+
+class QueryInstrumentationMiddlewareTests(TestCase):
+    """
+    Verify the Server-Timing header and the per-route query budgets.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create(username="owner@example.com")
+        cls.profile = UserProfile.objects.create(user=user, fullname="Owner")
+        for i in range(3):
+            board = Board.objects.create(owner=cls.profile, title=f"B{i}")
+            board.members.add(cls.profile)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.profile.user)
+
+    def test_server_timing_header(self):
+        response = self.client.get("/api/boards/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertRegex(
+            response["Server-Timing"],
+            r'^db;dur=[\d.]+;desc="2 queries, 0 duplicates", app;dur=[\d.]+$',
+        )
+
+    def test_over_budget_is_logged(self):
+        settings = {"BUDGETS": {"GET boards-list": 0}, "BUDGET_ACTION": "log"}
+        with override_settings(QUERY_INSTRUMENTATION=settings):
+            client = APIClient()
+            client.force_authenticate(user=self.profile.user)
+            with self.assertLogs("core.queries", "WARNING") as logs:
+                response = client.get("/api/boards/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('"route": "boards-list"', logs.output[0])
+
+    def test_over_budget_raises(self):
+        settings = {"BUDGETS": {"boards-list": 0}, "BUDGET_ACTION": "raise"}
+        with override_settings(QUERY_INSTRUMENTATION=settings):
+            client = APIClient()
+            client.force_authenticate(user=self.profile.user)
+            with self.assertRaises(QueryBudgetExceeded):
+                client.get("/api/boards/")
+
+
+@override_settings(
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]
+)
+class GenerateDatasetTests(TestCase):
+    """
+    Verify that generated datasets repeat with the seed, but their
+    token keys do not, and that the password must be given.
+    """
+
+    def generate(self, prefix, **options):
+        call_command(
+            "generate_dataset",
+            users=3,
+            boards=1,
+            tasks=5,
+            seed=7,
+            prefix=prefix,
+            stdout=io.StringIO(),
+            **options,
+        )
+        users = User.objects.filter(username__startswith=f"{prefix}-")
+        tokens = Token.objects.filter(user__in=users)
+        titles = Board.objects.filter(owner__user__in=users).values_list(
+            "title", flat=True
+        )
+        return set(tokens.values_list("key", flat=True)), list(titles)
+
+    def test_only_token_keys_are_random(self):
+        first_keys, first_titles = self.generate("a", password="secret")
+        second_keys, second_titles = self.generate("b", password="secret")
+        self.assertEqual(len(first_keys), 3)
+        self.assertFalse(first_keys & second_keys)
+        self.assertEqual(first_titles, second_titles)
+
+    def test_password_is_required(self):
+        with self.assertRaises(CommandError):
+            self.generate("c")
+
+
+class EndpointBenchmarkTests(SimpleTestCase):
+    """
+    Verify the route coverage and the baseline comparison of the
+    endpoint benchmark.
+    """
+
+    def results(self, **endpoint):
+        stats = {"queries": 3, "p95_ms": 10.0, "peak_memory_kb": 100.0}
+        return {
+            "sizes": {
+                "1000": {"endpoints": {"GET boards-list": stats | endpoint}}
+            }
+        }
+
+    def test_every_route_is_benchmarked(self):
+        self.assertEqual(uncovered_routes(), set())
+
+    def test_unchanged_results_pass(self):
+        self.assertEqual(
+            compare_results(self.results(), self.results(), 0.25), []
+        )
+
+    def test_noise_below_the_threshold_passes(self):
+        current = self.results(p95_ms=12.0, peak_memory_kb=120.0)
+        self.assertEqual(compare_results(self.results(), current, 0.25), [])
+
+    def test_regressions_are_reported(self):
+        current = self.results(queries=4, p95_ms=20.0, peak_memory_kb=400.0)
+
+        regressions = compare_results(self.results(), current, 0.25)
+
+        self.assertEqual(len(regressions), 3)
+        self.assertIn(
+            "GET boards-list (1000 tasks): 4 queries", regressions[0]
+        )
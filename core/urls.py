@@ -22,5 +22,8 @@ urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/boards/", include("boards_app.api.urls")),
     path("api/tasks/", include("tasks_app.api.urls")),
+    path("api/async/boards/", include("boards_app.api.async_urls")),
+    path("api/async/tasks/", include("tasks_app.api.async_urls")),
+    path("api/async/", include("auth_app.api.async_urls")),
     path("api/", include("auth_app.api.urls")),
 ]
@@ -0,0 +1,142 @@
+import queue
+import threading
+from concurrent.futures import Future
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+
+_config = getattr(settings, "WRITE_QUEUE", {})
+
+
+class WriteQueue:
+    """
+    Runs database writes of the whole process on one writer thread.
+
+    Request threads hand their writes to `run()` and block until the
+    writer thread has committed them. The writer groups writes that
+    arrive together into one short transaction, each write in its own
+    savepoint, so a failing write only rolls back itself. A batch is
+    whatever queued up while the previous batch was being written, so
+    an idle queue adds no delay. Having a single writer per process
+    means requests no longer compete for SQLite's write lock, and a
+    burst of writes costs a few commits instead of one per request.
+
+    Writes are run directly in the calling thread when the queue is
+    disabled, when called from the writer thread itself, or when the
+    caller is inside an atomic block, since the write has to see and
+    be part of the caller's transaction.
+    """
+
+    def __init__(self, enabled: bool, max_batch: int = 64):
+        self.enabled = enabled
+        self.max_batch = max_batch
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._batches = 0
+        self._writes = 0
+        self._failed_batches = 0
+
+    def run(self, func, *args, **kwargs):
+        """
+        Run func(*args, **kwargs) on the writer thread and return its
+        result. Exceptions raised by func are re-raised in the caller.
+        """
+        if (
+            not self.enabled
+            or threading.current_thread() is self._thread
+            or connection.in_atomic_block
+        ):
+            return func(*args, **kwargs)
+
+        future = Future()
+        self._ensure_started()
+        self._queue.put((func, args, kwargs, future))
+        return future.result()
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._work, name="write-queue", daemon=True
+                )
+                self._thread.start()
+
+    def _work(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            close_old_connections()
+            self._run_batch(batch)
+
+    def _run_batch(self, batch) -> None:
+        outcomes = []
+        try:
+            with transaction.atomic():
+                for func, args, kwargs, future in batch:
+                    try:
+                        with transaction.atomic():
+                            result = func(*args, **kwargs)
+                    except Exception as exc:
+                        outcomes.append((future, False, exc))
+                    else:
+                        outcomes.append((future, True, result))
+        except Exception as exc:
+            # The transaction itself failed, none of the writes stuck.
+            with self._stats_lock:
+                self._failed_batches += 1
+            for _, _, _, future in batch:
+                future.set_exception(exc)
+            return
+
+        with self._stats_lock:
+            self._batches += 1
+            self._writes += len(batch)
+        for future, succeeded, value in outcomes:
+            if succeeded:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                "enabled": self.enabled,
+                "batches": self._batches,
+                "writes": self._writes,
+                "failed_batches": self._failed_batches,
+                "mean_batch_size": (
+                    self._writes / self._batches if self._batches else 0.0
+                ),
+                "pending": self._queue.qsize(),
+            }
+
+
+class QueuedWritesMixin:
+    """
+    View mixin sending `perform_create`, `perform_update` and
+    `perform_destroy` of a generic view through the write queue.
+    """
+
+    def perform_create(self, serializer):
+        write_queue.run(super().perform_create, serializer)
+
+    def perform_update(self, serializer):
+        write_queue.run(super().perform_update, serializer)
+
+    def perform_destroy(self, instance):
+        write_queue.run(super().perform_destroy, instance)
+
+
+write_queue = WriteQueue(
+    enabled=_config.get("ENABLED", False),
+    max_batch=_config.get("MAX_BATCH", 64),
+)
@@ -0,0 +1,13 @@
+from django.urls import path
+
+from tasks_app.api.async_views import assigned_to_me, comments_list, reviewing
+
+urlpatterns = [
+    path("assigned-to-me/", assigned_to_me, name="async-assigned-to-me"),
+    path("reviewing/", reviewing, name="async-reviewing"),
+    path(
+        "<int:task_id>/comments/",
+        comments_list,
+        name="async-task-comments",
+    ),
+]
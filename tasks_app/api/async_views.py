@@ -0,0 +1,117 @@
+from django.db.models import QuerySet
+from rest_framework.exceptions import NotFound, PermissionDenied
+
+from auth_app.api.helpers import agetProfileForUser
+from boards_app.access import board_access
+from core.async_api import async_api_view
+from core.pagination import CommentKeysetPagination, TaskKeysetPagination
+from tasks_app.api.fast_serializers import (
+    atask_rows,
+    fast_serializers_enabled,
+)
+from tasks_app.api.serializers import (
+    CommentListAndCreateSerializer,
+    TaskListSerializer,
+)
+from tasks_app.models import Comment, Task
+
+
+async def paginated_data(
+    request, queryset: QuerySet, pagination_class, serializer_class
+):
+    """
+    Serialize a queryset the way the sync list views do, with keyset
+    pagination when the request asks for it.
+    """
+    paginator = pagination_class()
+    page = await paginator.apaginate_queryset(queryset, request)
+    if page is not None:
+        data = serializer_class(
+            page, many=True, context={"request": request}
+        ).data
+        return paginator.get_paginated_response(data).data
+
+    rows = [row async for row in queryset.aiterator()]
+    return serializer_class(rows, many=True, context={"request": request}).data
+
+
+async def task_list_data(request, queryset: QuerySet[Task]):
+    """
+    Render a task list like paginated_data with TaskListSerializer,
+    from value rows when FAST_SERIALIZERS is on.
+    """
+    if not fast_serializers_enabled():
+        return await paginated_data(
+            request, queryset, TaskKeysetPagination, TaskListSerializer
+        )
+
+    paginator = TaskKeysetPagination()
+    page = paginator.prepare_queryset(queryset, request)
+    if page is not None:
+        paginator.finish_page(
+            await atask_rows(page[: paginator.page_size + 1])
+        )
+        data = [row.data for row in paginator.page]
+        return paginator.get_paginated_response(data).data
+    return [row.data for row in await atask_rows(queryset)]
+
+
+async def profile_tasks(request, role: str) -> QuerySet[Task]:
+    profile = await agetProfileForUser(request.user)
+    if not profile:
+        return Task.objects.none()
+    return (
+        Task.objects.filter(**{role: profile})
+        .select_related("assignee__user", "reviewer__user")
+        .order_by("due_date", "id")
+    )
+
+
+@async_api_view
+async def assigned_to_me(request):
+    """
+    Async variant of AssignedToMeView.
+    """
+    return await task_list_data(
+        request, await profile_tasks(request, "assignee")
+    )
+
+
+@async_api_view
+async def reviewing(request):
+    """
+    Async variant of ReviewingView.
+    """
+    return await task_list_data(
+        request, await profile_tasks(request, "reviewer")
+    )
+
+
+@async_api_view
+async def comments_list(request, task_id):
+    """
+    Async variant of the comment list of CommentsListCreateAPI.
+
+    The task's board is resolved through the board access cache, so a
+    repeated request only queries the comments.
+    """
+    board_id = await board_access.aget_task_board_id(task_id)
+    if board_id is None:
+        raise NotFound("No Task matches the given query.")
+
+    acl = await board_access.aget_board_acl(board_id)
+    profile = await agetProfileForUser(request.user)
+    if acl is None or profile is None or not acl.allows(profile.pk):
+        raise PermissionDenied()
+
+    comments = (
+        Comment.objects.filter(task_id=task_id)
+        .select_related("author")
+        .order_by("created_at", "id")
+    )
+    return await paginated_data(
+        request,
+        comments,
+        CommentKeysetPagination,
+        CommentListAndCreateSerializer,
+    )
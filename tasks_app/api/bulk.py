@@ -0,0 +1,204 @@
+from collections import defaultdict
+
+from django.db import connection, transaction
+from django.utils import timezone
+from rest_framework import serializers
+
+from boards_app.access import BoardACL
+from boards_app.changes import record_changes
+from boards_app.models import BoardChange
+from tasks_app.api.serializers import (
+    TaskBulkItemSerializer,
+    TaskBulkUpdateIdSerializer,
+)
+from tasks_app.models import Task
+
+BATCH_SIZE = 500
+
+
+def check_item_members(acl: BoardACL, data: dict) -> dict:
+    """
+    Return validation errors for assignee/reviewer IDs of an item.
+
+    Both IDs are checked against the preloaded board ACL, so no
+    query is needed per item.
+    """
+    errors = {}
+    if data.get("assignee_id") and not acl.allows(data["assignee_id"]):
+        errors["assignee_id"] = ["Assignee must be a member of the board."]
+    if data.get("reviewer_id") and not acl.allows(data["reviewer_id"]):
+        errors["reviewer_id"] = ["Reviewer must be a member of the board."]
+    return errors
+
+
+def validate_item(serializer, acl: BoardACL, item: dict):
+    """
+    Validate a single bulk item and return (validated_data, errors).
+    """
+    try:
+        data = serializer.run_validation(item)
+    except serializers.ValidationError as exc:
+        return None, exc.detail
+    errors = check_item_members(acl, data)
+    return (None, errors) if errors else (data, None)
+
+
+def prepare_creates(board, creator, acl: BoardACL, items):
+    """
+    Validate create items and build unsaved Task instances.
+
+    Returns the tasks to insert together with the per-item results.
+    Results of valid items are completed once the tasks are saved.
+    """
+    serializer = TaskBulkItemSerializer()
+    tasks, results = [], []
+
+    for index, item in enumerate(items):
+        data, errors = validate_item(serializer, acl, item)
+        if errors:
+            results.append({"index": index, "errors": errors})
+            continue
+        tasks.append(Task(board_id=board.pk, creator_id=creator.pk, **data))
+        results.append({"index": index, "id": None, "status": "created"})
+
+    return tasks, results
+
+
+def parse_update_id(serializer, item: dict):
+    """
+    Return the task ID of an update item, or its validation errors.
+    """
+    try:
+        return serializer.run_validation(item)["id"]
+    except serializers.ValidationError as exc:
+        return exc.detail
+
+
+def prepare_updates(board, acl: BoardACL, items):
+    """
+    Validate update items and apply them to the loaded Task instances.
+
+    All referenced tasks of the board are loaded with one query.
+    Returns the changed tasks grouped by the tuple of their changed
+    fields, together with the per-item results.
+    """
+    serializer = TaskBulkItemSerializer(partial=True)
+    id_serializer = TaskBulkUpdateIdSerializer()
+    ids = [parse_update_id(id_serializer, item) for item in items]
+    existing = Task.objects.filter(board=board).in_bulk(
+        [task_id for task_id in ids if isinstance(task_id, int)]
+    )
+
+    changed, results = {}, []
+    for index, item in enumerate(items):
+        if not isinstance(ids[index], int):
+            results.append({"index": index, "errors": ids[index]})
+            continue
+        task = existing.get(ids[index])
+        if task is None:
+            results.append(
+                {
+                    "index": index,
+                    "errors": {"id": ["Task not found on this board."]},
+                }
+            )
+            continue
+
+        item = {key: value for key, value in item.items() if key != "id"}
+        data, errors = validate_item(serializer, acl, item)
+        if errors:
+            results.append({"index": index, "id": task.pk, "errors": errors})
+            continue
+
+        for field, value in data.items():
+            setattr(task, field, value)
+        changed.setdefault(task.pk, (task, set()))[1].update(data)
+        results.append({"index": index, "id": task.pk, "status": "updated"})
+
+    # UPDATE statements bypass auto_now, so the timestamp is set here.
+    now = timezone.now()
+    groups = defaultdict(list)
+    for task, fields in changed.values():
+        task.updated_at = now
+        groups[tuple(sorted(fields | {"updated_at"}))].append(task)
+    return groups, results
+
+
+def write_updates(groups) -> None:
+    """
+    Write updated tasks with one `executemany` per set of fields.
+
+    Multi-select moves typically change the same fields on many
+    tasks, so each group becomes a single prepared UPDATE statement
+    executed for all of its rows. This avoids the large CASE
+    expressions that `bulk_update` builds for every batch.
+    """
+    opts = Task._meta
+    quote = connection.ops.quote_name
+    fields_by_name = {field.attname: field for field in opts.concrete_fields}
+
+    with connection.cursor() as cursor:
+        for names, tasks in groups.items():
+            fields = [fields_by_name[name] for name in names]
+            assignments = ", ".join(
+                f"{quote(field.column)} = %s" for field in fields
+            )
+            sql = (
+                f"UPDATE {quote(opts.db_table)} SET {assignments} "
+                f"WHERE {quote(opts.pk.column)} = %s"
+            )
+            params = [
+                [
+                    field.get_db_prep_save(
+                        getattr(task, field.attname), connection
+                    )
+                    for field in fields
+                ]
+                + [task.pk]
+                for task in tasks
+            ]
+            cursor.executemany(sql, params)
+
+
+def record_bulk_changes(board, new_tasks, update_groups) -> None:
+    """
+    Record the change log entries that model signals would have
+    recorded for the bulk writes.
+    """
+    record_changes(
+        board.pk,
+        BoardChange.Kind.TASK,
+        [task.pk for task in new_tasks],
+        BoardChange.Operation.INSERT,
+    )
+    record_changes(
+        board.pk,
+        BoardChange.Kind.TASK,
+        [task.pk for tasks in update_groups.values() for task in tasks],
+        BoardChange.Operation.UPDATE,
+    )
+
+
+def apply_bulk_tasks(board, creator, acl: BoardACL, creates, updates):
+    """
+    Create and update many tasks of a board in one transaction.
+
+    Items are validated individually against the preloaded board
+    ACL. Valid items are written with `bulk_create` and grouped
+    UPDATE statements, invalid items are reported with their errors.
+    Returns the per-item results for creates and updates.
+    """
+    new_tasks, created = prepare_creates(board, creator, acl, creates)
+    update_groups, updated = prepare_updates(board, acl, updates)
+
+    with transaction.atomic():
+        Task.objects.bulk_create(new_tasks, batch_size=BATCH_SIZE)
+        write_updates(update_groups)
+        record_bulk_changes(board, new_tasks, update_groups)
+
+    saved = iter(new_tasks)
+    for result in created:
+        if "errors" not in result:
+            result["id"] = next(saved).pk
+
+    return {"created": created, "updated": updated}
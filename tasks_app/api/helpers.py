@@ -1,7 +1,10 @@
 from django.core.exceptions import PermissionDenied
+from django.db.models import Count, Max
 from rest_framework import serializers
 
+from boards_app.access import board_access
 from boards_app.models import Board
+from tasks_app.models import Task
 
 
 def has_board_access(board: Board, profile_id: int) -> bool:
@@ -9,11 +12,10 @@ def has_board_access(board: Board, profile_id: int) -> bool:
     Return True if the given profile has access to the board.
 
     Checks if the profile ID is either a member of the board or
-    the board's owner. Returns a boolean accordingly.
+    the board's owner, using the cached members and owner of the
+    board. Returns a boolean accordingly.
     """
-    is_member: bool = board.members.filter(id=profile_id).exists()
-    is_owner: bool = board.owner_id == profile_id or False
-    return is_member or is_owner
+    return board_access.has_access(board.pk, profile_id)
 
 
 def verify_board_membership(board, creator_id, validated_data):
@@ -44,3 +46,31 @@ def verify_board_membership(board, creator_id, validated_data):
             raise serializers.ValidationError(
                 "Reviewer must be a member of the board."
             )
+
+
+def task_list_state(queryset) -> tuple:
+    """
+    Return the latest `updated_at` and the number of tasks of a
+    queryset.
+
+    Any write changing the rendered list changes one of them: saved
+    and moved-in tasks get a newer `updated_at`, removed tasks lower
+    the count.
+    """
+    state = queryset.order_by().aggregate(
+        latest=Max("updated_at"), count=Count("id")
+    )
+    return state["latest"], state["count"]
+
+
+def comment_list_state(task_id):
+    """
+    Return the latest `updated_at` and the number of comments of a
+    task, or None if the task does not exist.
+    """
+    return (
+        Task.objects.filter(pk=task_id)
+        .annotate(latest=Max("comments__updated_at"), count=Count("comments"))
+        .values_list("latest", "count")
+        .first()
+    )
@@ -1,5 +1,7 @@
 from rest_framework.permissions import BasePermission
 
+from boards_app.access import board_access
+
 
 class IsTaskCreator(BasePermission):
     """
@@ -31,8 +33,8 @@ class IsTaskCreatorOrBoardOwner(BasePermission):
 
         is_creator = hasattr(obj, "creator") and obj.creator_id == user.id
 
-        is_board_owner = (
-            hasattr(obj, "board") and obj.board.owner_id == user.id
+        is_board_owner = hasattr(obj, "board_id") and board_access.is_owner(
+            obj.board_id, user.id
         )
 
         return is_creator or is_board_owner
@@ -1,8 +1,11 @@
 from rest_framework import serializers
 
-from auth_app.api.helpers import CurrentUserProfileDefault
-from auth_app.models import UserProfile
-from boards_app.api.serializers import UserProfileSerializer
+from auth_app.api.helpers import (
+    CurrentUserProfileDefault,
+    getProfileForRequest,
+)
+from auth_app.api.serializers import UserProfileSerializer
+from boards_app.models import Board
 from tasks_app.api.helpers import verify_board_membership
 from tasks_app.models import Comment, Task
 
@@ -60,18 +63,15 @@ class TaskListSerializer(TaskBaseSerializer):
     """
     Serializer used for listing tasks.
 
-    Includes a custom SerializerMethodField to count related comments
-    and also contains the board relationship.
+    Includes the denormalized comment count of each task and also
+    contains the board relationship.
     """
 
-    comments_count = serializers.SerializerMethodField()
+    comments_count = serializers.IntegerField(read_only=True)
 
     class Meta(TaskBaseSerializer.Meta):
         fields = TaskBaseSerializer.Meta.fields + ["comments_count", "board"]
 
-    def get_comments_count(self, obj):
-        return obj.comments.count()
-
 
 class TaskCreateSerializer(TaskListSerializer):
     """
@@ -101,18 +101,14 @@ class BoardTaskListSerializer(TaskBaseSerializer):
     """
     Serializer used for listing tasks.
 
-    Includes a custom SerializerMethodField to count related comments
-    and also contains the board relationship.
+    Includes the denormalized comment count of each task.
     """
 
-    comments_count = serializers.SerializerMethodField()
+    comments_count = serializers.IntegerField(read_only=True)
 
     class Meta(TaskBaseSerializer.Meta):
         fields = TaskBaseSerializer.Meta.fields + ["comments_count"]
 
-    def get_comments_count(self, obj):
-        return obj.comments.count()
-
 
 class CommentDetailSerializer(serializers.ModelSerializer):
     """
@@ -147,7 +143,104 @@ class CommentListAndCreateSerializer(CommentDetailSerializer):
         }
 
     def create(self, validated_data):
-        validated_data["author"] = UserProfile.objects.all().get(
-            id=self.context["request"].user.id
+        validated_data["author"] = getProfileForRequest(
+            self.context["request"]
         )
         return super().create(validated_data)
+
+
+class TaskBulkItemSerializer(serializers.ModelSerializer):
+    """
+    Serializer validating a single task item of a bulk request.
+
+    A single instance is reused for every item of a request via
+    `run_validation`, which avoids building the serializer fields
+    again for each of potentially thousands of items.
+    """
+
+    assignee_id = serializers.IntegerField(required=False, allow_null=True)
+    reviewer_id = serializers.IntegerField(required=False, allow_null=True)
+
+    class Meta:
+        model = Task
+        fields = [
+            "title",
+            "description",
+            "status",
+            "priority",
+            "assignee_id",
+            "reviewer_id",
+            "due_date",
+        ]
+
+
+class TaskBulkUpdateIdSerializer(serializers.Serializer):
+    """
+    Serializer validating the task `id` of a bulk update item.
+
+    Accepts integers and numeric strings like the rest of the API,
+    other keys of the item are ignored.
+    """
+
+    id = serializers.IntegerField()
+
+
+class TaskBulkSerializer(serializers.Serializer):
+    """
+    Serializer for the envelope of a bulk task request.
+
+    Expects the target board and lists of task items to create and
+    to update. Update items must include the task `id`. The items
+    themselves are validated one by one by TaskBulkItemSerializer.
+    """
+
+    board = serializers.PrimaryKeyRelatedField(queryset=Board.objects.all())
+    create = serializers.ListField(
+        child=serializers.DictField(), required=False, default=list
+    )
+    update = serializers.ListField(
+        child=serializers.DictField(), required=False, default=list
+    )
+
+    def validate(self, attrs):
+        max_items = self.context["max_items"]
+        if len(attrs["create"]) + len(attrs["update"]) > max_items:
+            raise serializers.ValidationError(
+                f"A bulk request may contain at most {max_items} tasks."
+            )
+        return attrs
+
+
+class TaskSearchQuerySerializer(serializers.Serializer):
+    """
+    Serializer for validating task search query parameters.
+
+    All filters are optional. `status` and `priority` accept a comma
+    separated list of choices, `due_from` and `due_to` bound the due
+    date inclusively and `q` is a free-text query over title and
+    description.
+    """
+
+    q = serializers.CharField(required=False, allow_blank=True)
+    board = serializers.IntegerField(required=False)
+    status = serializers.CharField(required=False)
+    priority = serializers.CharField(required=False)
+    assignee = serializers.IntegerField(required=False)
+    reviewer = serializers.IntegerField(required=False)
+    due_from = serializers.DateField(required=False)
+    due_to = serializers.DateField(required=False)
+
+    def validate_choices(self, value, choices):
+        values = [item.strip() for item in value.split(",") if item.strip()]
+        invalid = [item for item in values if item not in choices]
+        if invalid:
+            raise serializers.ValidationError(
+                f"Invalid choice(s): {', '.join(invalid)}"
+            )
+        return values
+
+    def validate_status(self, value):
+        return self.validate_choices(value, Task.Status.values)
+
+    def validate_priority(self, value):
+        return self.validate_choices(value, Task.Priority.values)
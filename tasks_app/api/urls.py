@@ -6,12 +6,20 @@ from tasks_app.api.views import (
     CommentDeleteAPI,
     CommentsListCreateAPI,
     ReviewingView,
+    TaskBulkView,
+    TaskSearchView,
     TaskViewSet,
 )
 
 urlpatterns = [
-    path("assigned-to-me/", AssignedToMeView.as_view()),
-    path("reviewing/", ReviewingView.as_view()),
+    path(
+        "assigned-to-me/",
+        AssignedToMeView.as_view(),
+        name="tasks-assigned-to-me",
+    ),
+    path("reviewing/", ReviewingView.as_view(), name="tasks-reviewing"),
+    path("bulk/", TaskBulkView.as_view(), name="tasks-bulk"),
+    path("search/", TaskSearchView.as_view(), name="tasks-search"),
 ]
 
 router = routers.SimpleRouter()
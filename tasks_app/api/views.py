@@ -1,17 +1,34 @@
-from django.db.models import QuerySet
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F, QuerySet
 from django.shortcuts import get_object_or_404
-from rest_framework.exceptions import NotFound
+from django.utils import timezone
+from rest_framework.exceptions import NotFound, PermissionDenied
 from rest_framework.generics import (
     DestroyAPIView,
     ListAPIView,
     ListCreateAPIView,
 )
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet
 
-from auth_app.models import UserProfile
+from auth_app.api.helpers import getProfileForRequest
+from boards_app.access import board_access
+from boards_app.api.helpers import boards_for_profile
 from boards_app.api.permission import IsBoardMemberOrOwner
 from boards_app.models import Board
+from core.conditional import ConditionalListMixin
+from core.pagination import (
+    CommentKeysetPagination,
+    TaskKeysetPagination,
+    TaskSearchPagination,
+)
+from core.write_queue import QueuedWritesMixin, write_queue
+from tasks_app.api.bulk import apply_bulk_tasks
+from tasks_app.api.fast_serializers import FastTaskListMixin
+from tasks_app.api.helpers import comment_list_state, task_list_state
 from tasks_app.api.permissions import (
     IsCommentCreator,
     IsTaskCreatorOrBoardOwner,
@@ -19,32 +36,47 @@ from tasks_app.api.permissions import (
 from tasks_app.api.serializers import (
     CommentListAndCreateSerializer,
     TaskBaseSerializer,
+    TaskBulkSerializer,
     TaskCreateSerializer,
     TaskListSerializer,
+    TaskSearchQuerySerializer,
     TaskUpdateSerializer,
 )
 from tasks_app.models import Comment, Task
+from tasks_app.search import task_text_filter
 
 
-class AssignedToMeView(ListAPIView):
+class AssignedToMeView(ConditionalListMixin, FastTaskListMixin, ListAPIView):
     """
     View listing tasks where the authenticated user is the assignee.
 
     This view is restricted to authenticated users. It derives the
-    authenticated user's profile and returns all tasks assigned to them.
-    ListAPIView provides the `get` method for listing items.
+    authenticated user's profile and returns all tasks assigned to them,
+    ordered by due date. ListAPIView provides the `get` method for listing
+    items, with keyset pagination when a cursor or page size is requested.
+    Responses carry an ETag derived from the tasks' `updated_at`, so
+    unchanged lists are answered with 304.
     """
 
     permission_classes = [IsAuthenticated]
     serializer_class = TaskListSerializer
+    pagination_class = TaskKeysetPagination
 
     def get_queryset(self) -> QuerySet[Task]:
-        user = self.request.user
-        profile = UserProfile.objects.filter(user=user).first()
-        return profile.tasks_assigned.all()
+        profile = getProfileForRequest(self.request)
+        if not profile:
+            return Task.objects.none()
+        return (
+            Task.objects.filter(assignee=profile)
+            .select_related("assignee__user", "reviewer__user")
+            .order_by("due_date", "id")
+        )
+
+    def list_etag_parts(self):
+        return task_list_state(self.get_queryset())
 
 
-class ReviewingView(ListAPIView):
+class ReviewingView(ConditionalListMixin, FastTaskListMixin, ListAPIView):
     """
     View listing tasks where the authenticated user is the reviewer.
 
@@ -53,14 +85,72 @@ class ReviewingView(ListAPIView):
 
     permission_classes = [IsAuthenticated]
     serializer_class = TaskListSerializer
+    pagination_class = TaskKeysetPagination
 
     def get_queryset(self) -> QuerySet[Task]:
-        user = self.request.user
-        profile = UserProfile.objects.filter(user=user).first()
-        return profile.tasks_reviewing.all()
+        profile = getProfileForRequest(self.request)
+        if not profile:
+            return Task.objects.none()
+        return (
+            Task.objects.filter(reviewer=profile)
+            .select_related("assignee__user", "reviewer__user")
+            .order_by("due_date", "id")
+        )
+
+    def list_etag_parts(self):
+        return task_list_state(self.get_queryset())
 
 
-class TaskViewSet(ModelViewSet):
+class TaskSearchView(FastTaskListMixin, ListAPIView):
+    """
+    View searching the tasks of all boards the user has access to.
+
+    Supports filtering by board, status, priority, assignee, reviewer
+    and due date range, and a free-text query over title and
+    description backed by the SQLite FTS5 index. Results are ordered by
+    due date and always paginated with keyset pagination.
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = TaskListSerializer
+    pagination_class = TaskSearchPagination
+
+    def get_queryset(self) -> QuerySet[Task]:
+        query = TaskSearchQuerySerializer(data=self.request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+
+        profile = getProfileForRequest(self.request)
+        if not profile:
+            return Task.objects.none()
+
+        tasks = Task.objects.select_related("assignee__user", "reviewer__user")
+        if "board" in params:
+            if not board_access.has_access(params["board"], profile.pk):
+                raise PermissionDenied("You cannot search this board.")
+            tasks = tasks.filter(board_id=params["board"])
+        else:
+            tasks = tasks.filter(board__in=boards_for_profile(profile))
+
+        if "status" in params:
+            tasks = tasks.filter(status__in=params["status"])
+        if "priority" in params:
+            tasks = tasks.filter(priority__in=params["priority"])
+        if "assignee" in params:
+            tasks = tasks.filter(assignee_id=params["assignee"])
+        if "reviewer" in params:
+            tasks = tasks.filter(reviewer_id=params["reviewer"])
+        if "due_from" in params:
+            tasks = tasks.filter(due_date__gte=params["due_from"])
+        if "due_to" in params:
+            tasks = tasks.filter(due_date__lte=params["due_to"])
+        if params.get("q"):
+            tasks = tasks.filter(task_text_filter(params["q"], connection))
+
+        return tasks.order_by("due_date", "id")
+
+
+class TaskViewSet(QueuedWritesMixin, ModelViewSet):
     """
     ViewSet for handling Task operations.
 
@@ -69,7 +159,7 @@ class TaskViewSet(ModelViewSet):
     with NotFound for REST constraints, and chooses serializer classes
     based on the action. ModelViewSet provides implementations for all
     standard actions (`list`, `retrieve`, `create`, etc.) when not
-    overridden.
+    overridden. Writes go through the write queue when it is enabled.
     """
 
     permission_classes = [IsAuthenticated]
@@ -102,27 +192,89 @@ class TaskViewSet(ModelViewSet):
         return TaskBaseSerializer
 
 
-class CommentsListCreateAPI(ListCreateAPIView):
+class TaskBulkView(APIView):
+    """
+    View for creating and updating many tasks of one board at once.
+
+    Accepts a board ID together with lists of task items to create
+    and to update. Board access of the requesting user is checked
+    once, assignees and reviewers are checked against the preloaded
+    board members. Valid items are written in a single transaction
+    and the response reports the result of every item.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        serializer = TaskBulkSerializer(
+            data=request.data,
+            context={
+                "request": request,
+                "max_items": getattr(settings, "TASK_BULK_MAX_ITEMS", 5_000),
+            },
+        )
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        board = data["board"]  # type: ignore
+        profile = getProfileForRequest(request)
+        acl = board_access.get_board_acl(board.pk)
+        if not profile or not acl or not acl.allows(profile.pk):
+            raise PermissionDenied("You cannot edit tasks of this board.")
+
+        results = apply_bulk_tasks(
+            board,
+            profile,
+            acl,
+            data["create"],  # type: ignore
+            data["update"],  # type: ignore
+        )
+        return Response({"board": board.pk, **results})
+
+
+class CommentsListCreateAPI(ConditionalListMixin, ListCreateAPIView):
     """
     Generic view for listing and creating comments on a task.
 
     Uses ListCreateAPIView to handle `GET` and `POST` for comments.
     Filters queryset by the task ID from URL, verifying task existence
-    with get_object_or_404.
+    with get_object_or_404. Creating a comment increments the task's
+    comment count in the same transaction. Comments are ordered by
+    creation time and keyset pagination is applied when a cursor or page
+    size is requested. Comments are written through the write queue when
+    it is enabled. Lists carry an ETag derived from the comments'
+    `updated_at` and count.
     """
 
     permission_classes = [IsAuthenticated, IsBoardMemberOrOwner]
     serializer_class = CommentListAndCreateSerializer
+    pagination_class = CommentKeysetPagination
 
     def get_queryset(self):
         task_id = self.kwargs["task_id"]
         get_object_or_404(Task.objects.all(), pk=task_id)
-        comments = Comment.objects.filter(task_id=task_id)
+        comments = (
+            Comment.objects.filter(task_id=task_id)
+            .select_related("author")
+            .order_by("created_at", "id")
+        )
         return comments
 
+    def list_etag_parts(self):
+        return comment_list_state(self.kwargs["task_id"])
+
     def perform_create(self, serializer):
-        task_id = self.kwargs["task_id"]
-        serializer.save(task_id=task_id)
+        write_queue.run(
+            self.create_comment, serializer, self.kwargs["task_id"]
+        )
+
+    def create_comment(self, serializer, task_id):
+        with transaction.atomic():
+            serializer.save(task_id=task_id)
+            Task.objects.filter(pk=task_id).update(
+                comments_count=F("comments_count") + 1,
+                updated_at=timezone.now(),
+            )
 
 
 class CommentDeleteAPI(DestroyAPIView):
@@ -131,7 +283,9 @@ class CommentDeleteAPI(DestroyAPIView):
 
     Uses DestroyAPIView to handle `DELETE` requests. It ensures the
     comment belongs to the referenced task, and checks object permissions
-    before deletion.
+    before deletion. The task's comment count is decremented in the same
+    transaction as the deletion, which goes through the write queue when
+    it is enabled.
     """
 
     permission_classes = [IsAuthenticated, IsCommentCreator]
@@ -145,3 +299,16 @@ class CommentDeleteAPI(DestroyAPIView):
         self.check_object_permissions(self.request, comment)
 
         return comment
+
+    def perform_destroy(self, instance):
+        write_queue.run(self.delete_comment, instance)
+
+    def delete_comment(self, instance):
+        with transaction.atomic():
+            instance.delete()
+            Task.objects.filter(
+                pk=instance.task_id, comments_count__gt=0
+            ).update(
+                comments_count=F("comments_count") - 1,
+                updated_at=timezone.now(),
+            )
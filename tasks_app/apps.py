@@ -1,5 +1,11 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class TasksAppConfig(AppConfig):
     name = "tasks_app"
+
+    def ready(self):
+        from tasks_app.signals import repair_task_search_index
+
+        post_migrate.connect(repair_task_search_index, sender=self)
@@ -0,0 +1,87 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from boards_app.changes import bump_board_versions
+from boards_app.models import Board
+from tasks_app.models import Comment, Task
+
+
+def actual_comments_count():
+    """
+    Return an expression counting the comments of the outer task.
+    """
+    counts = (
+        Comment.objects.filter(task_id=OuterRef("pk"))
+        .order_by()
+        .values("task_id")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+class Command(BaseCommand):
+    """
+    Check and repair drift of the denormalized Task.comments_count.
+
+    Tasks are processed in primary key ranges. For each range the
+    drifted tasks are counted and, unless --check is given, fixed
+    with a single UPDATE statement.
+    """
+
+    help = "Check and repair Task.comments_count against the comments."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report drift, do not repair it.",
+        )
+        parser.add_argument("--batch-size", type=int, default=10_000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        check_only = options["check"]
+        drifted = 0
+
+        last_id = 0
+        while True:
+            ids = Task.objects.filter(pk__gt=last_id).order_by("pk")
+            upper = list(
+                ids.values_list("pk", flat=True)[batch_size - 1 : batch_size]
+            )
+            upper_id = upper[0] if upper else None
+
+            batch = Task.objects.filter(pk__gt=last_id)
+            if upper_id is not None:
+                batch = batch.filter(pk__lte=upper_id)
+
+            drifted += self.process_batch(batch, check_only)
+
+            if upper_id is None:
+                break
+            last_id = upper_id
+
+        action = "found" if check_only else "repaired"
+        self.stdout.write(f"{drifted} drifted task(s) {action}.")
+
+    def process_batch(self, batch, check_only: bool) -> int:
+        drift = batch.alias(actual=actual_comments_count()).filter(
+            ~Q(comments_count=F("actual"))
+        )
+        if check_only:
+            return drift.count()
+
+        with transaction.atomic():
+            # Board details render the counts, so their cached
+            # responses must not outlive the repair.
+            bump_board_versions(
+                Board.objects.filter(pk__in=drift.values("board_id"))
+            )
+            return drift.update(
+                comments_count=actual_comments_count(),
+                updated_at=timezone.now(),
+            )
@@ -0,0 +1,27 @@
+# Generated by Django 6.0 on 2026-10-18 20:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth_app', '0001_initial'),
+        ('boards_app', '0003_alter_board_members'),
+        ('tasks_app', '0006_alter_task_board'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['task', 'created_at', 'id'], name='comment_task_created_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['assignee', 'due_date', 'id'], name='task_assignee_due_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['reviewer', 'due_date', 'id'], name='task_reviewer_due_date_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 6.0 on 2026-10-18 20:19
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_comments_count(apps, schema_editor):
+    Task = apps.get_model('tasks_app', 'Task')
+    Comment = apps.get_model('tasks_app', 'Comment')
+
+    counts = (
+        Comment.objects.filter(task_id=OuterRef('pk'))
+        .order_by()
+        .values('task_id')
+        .annotate(total=Count('id'))
+        .values('total')
+    )
+    Task.objects.update(
+        comments_count=Coalesce(
+            Subquery(counts, output_field=IntegerField()), 0
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks_app', '0007_task_comment_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='comments_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(
+            backfill_comments_count, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 6.0 on 2026-10-18 20:21
+
+from django.db import migrations, models
+
+from tasks_app.search import drop_task_search_index, ensure_task_search_index
+
+
+def create_search_index(apps, schema_editor):
+    ensure_task_search_index(schema_editor.connection)
+
+
+def remove_search_index(apps, schema_editor):
+    drop_task_search_index(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth_app', '0001_initial'),
+        ('boards_app', '0003_alter_board_members'),
+        ('tasks_app', '0008_task_comments_count'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['board', 'status', 'due_date', 'id'], name='task_board_status_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['board', 'priority', 'due_date', 'id'], name='task_board_priority_due_idx'),
+        ),
+        migrations.RunPython(create_search_index, remove_search_index),
+    ]
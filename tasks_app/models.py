@@ -11,7 +11,10 @@ class Task(models.Model):
     A Task is linked to a board and a creator profile. It can
     optionally have an assignee and a reviewer. Priority and
     status fields are limited to predefined text choices, and
-    each task has a due date.
+    each task has a due date. The number of comments is kept in
+    `comments_count`, which is maintained by the comment API views.
+    `updated_at` changes with every write to the task or its comment
+    count and is the basis of the task list ETags.
     """
 
     class Priority(models.TextChoices):
@@ -74,6 +77,28 @@ class Task(models.Model):
         default=Status.TODO,
     )
     due_date = models.DateField()
+    comments_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["assignee", "due_date", "id"],
+                name="task_assignee_due_date_idx",
+            ),
+            models.Index(
+                fields=["reviewer", "due_date", "id"],
+                name="task_reviewer_due_date_idx",
+            ),
+            models.Index(
+                fields=["board", "status", "due_date", "id"],
+                name="task_board_status_due_idx",
+            ),
+            models.Index(
+                fields=["board", "priority", "due_date", "id"],
+                name="task_board_priority_due_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Board: {self.board.title} - Task: {self.title}"
@@ -85,7 +110,7 @@ class Comment(models.Model):
 
     Each comment is linked to a specific Task and an author
     UserProfile. The content is optional (empty string allowed),
-    and creation time is automatically recorded.
+    and creation and modification times are automatically recorded.
     """
 
     task = models.ForeignKey(
@@ -96,6 +121,15 @@ class Comment(models.Model):
     author = models.ForeignKey(UserProfile, on_delete=models.CASCADE)
     content = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["task", "created_at", "id"],
+                name="comment_task_created_at_idx",
+            ),
+        ]
 
     def __str__(self):
         return (
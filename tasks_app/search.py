@@ -0,0 +1,121 @@
+import re
+
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+FTS_TABLE = "tasks_app_task_fts"
+TASK_TABLE = "tasks_app_task"
+
+FTS_TRIGGERS = {
+    f"{FTS_TABLE}_ai": f"""
+        CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai
+        AFTER INSERT ON {TASK_TABLE} BEGIN
+            INSERT INTO {FTS_TABLE}(rowid, title, description)
+            VALUES (new.id, new.title, new.description);
+        END
+    """,
+    f"{FTS_TABLE}_ad": f"""
+        CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad
+        AFTER DELETE ON {TASK_TABLE} BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+            VALUES ('delete', old.id, old.title, old.description);
+        END
+    """,
+    f"{FTS_TABLE}_au": f"""
+        CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au
+        AFTER UPDATE OF title, description ON {TASK_TABLE} BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+            VALUES ('delete', old.id, old.title, old.description);
+            INSERT INTO {FTS_TABLE}(rowid, title, description)
+            VALUES (new.id, new.title, new.description);
+        END
+    """,
+}
+
+
+def supports_fts(connection) -> bool:
+    return connection.vendor == "sqlite"
+
+
+def ensure_task_search_index(connection) -> None:
+    """
+    Create the FTS5 index over task titles and descriptions.
+
+    The index is an external-content FTS5 table kept in sync by
+    triggers on the task table. SQLite drops those triggers whenever
+    a migration rebuilds the task table, so this function is also
+    run after every migrate: missing triggers are recreated and the
+    index is rebuilt from the task table. Does nothing on databases
+    other than SQLite.
+    """
+    if not supports_fts(connection):
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+            "title, description, "
+            f"content='{TASK_TABLE}', content_rowid='id', "
+            "tokenize='unicode61 remove_diacritics 2')"
+        )
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' "
+            f"AND tbl_name = '{TASK_TABLE}'"
+        )
+        existing = {row[0] for row in cursor.fetchall()}
+        if existing.issuperset(FTS_TRIGGERS):
+            return
+
+        for sql in FTS_TRIGGERS.values():
+            cursor.execute(sql)
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"
+        )
+
+
+def drop_task_search_index(connection) -> None:
+    if not supports_fts(connection):
+        return
+
+    with connection.cursor() as cursor:
+        for name in FTS_TRIGGERS:
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+        cursor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+def search_terms(text: str) -> list[str]:
+    return re.findall(r"\w+", text)
+
+
+def build_match_query(terms) -> str:
+    """
+    Build an FTS5 MATCH expression requiring every term as a prefix.
+
+    Terms are quoted, so user input cannot inject FTS5 operators.
+    """
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def task_text_filter(text: str, connection) -> Q:
+    """
+    Return a filter matching tasks whose title or description
+    contain every word of text.
+
+    Uses the FTS5 index on SQLite and falls back to case-insensitive
+    substring matching on other databases.
+    """
+    terms = search_terms(text)
+    if not terms:
+        return Q()
+
+    if supports_fts(connection):
+        matches = RawSQL(
+            f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s",
+            (build_match_query(terms),),
+        )
+        return Q(id__in=matches)
+
+    condition = Q()
+    for term in terms:
+        condition &= Q(title__icontains=term) | Q(description__icontains=term)
+    return condition
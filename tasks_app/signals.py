@@ -0,0 +1,13 @@
+from django.db import connections
+
+from tasks_app.search import ensure_task_search_index
+
+
+def repair_task_search_index(sender, using, **kwargs):
+    """
+    Recreate the task search triggers after migrations.
+
+    Migrations that rebuild the task table on SQLite drop its
+    triggers, which would silently stop the FTS index from syncing.
+    """
+    ensure_task_search_index(connections[using])
@@ -1,3 +1,228 @@
-from django.test import TestCase
+import base64
+import datetime
+import json
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from auth_app.models import UserProfile
+from boards_app.access import board_access
+from boards_app.models import Board
+from tasks_app.models import Task
+
+
+def create_profile(email, fullname):
+    user = User.objects.create(username=email, email=email)
+    return UserProfile.objects.create(user=user, fullname=fullname)
+
+
+class TaskBulkTests(TestCase):
+    """
+    Verify the creates, updates and per-item errors of the bulk task
+    endpoint, its board membership check and its item limit.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = create_profile("owner@example.com", "Owner Example")
+        cls.member = create_profile("member@example.com", "Member Example")
+        cls.outsider = create_profile("out@example.com", "Out Sider")
+        cls.board = Board.objects.create(owner=cls.owner, title="Board")
+        cls.board.members.add(cls.owner, cls.member)
+        other = Board.objects.create(owner=cls.outsider, title="Other")
+        cls.tasks = [
+            Task.objects.create(
+                board=board,
+                creator=board.owner,
+                title=f"Task {index}",
+                due_date=datetime.date(2026, 1, 1),
+            )
+            for index, board in enumerate((cls.board, cls.board, other))
+        ]
+
+    def setUp(self):
+        board_access.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.owner.user)
+
+    def bulk(self, create=(), update=()):
+        return self.client.post(
+            "/api/tasks/bulk/",
+            {
+                "board": self.board.pk,
+                "create": list(create),
+                "update": list(update),
+            },
+            format="json",
+        )
+
+    def test_creates_and_updates(self):
+        first, second, _ = self.tasks
+        response = self.bulk(
+            create=[
+                {
+                    "title": "New",
+                    "due_date": "2026-02-01",
+                    "assignee_id": self.member.pk,
+                }
+            ],
+            update=[
+                {"id": first.pk, "priority": "high"},
+                {"id": str(second.pk), "status": "done"},
+            ],
+        )
+
+        self.assertEqual(response.status_code, 200)
+        created = response.json()["created"]
+        self.assertEqual(created[0]["status"], "created")
+        task = Task.objects.get(pk=created[0]["id"])
+        self.assertEqual(
+            (task.board_id, task.creator_id, task.assignee_id),
+            (self.board.pk, self.owner.pk, self.member.pk),
+        )
+        self.assertEqual(
+            [result["status"] for result in response.json()["updated"]],
+            ["updated", "updated"],
+        )
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual((first.priority, second.status), ("high", "done"))
+
+    def test_invalid_items_are_reported_and_valid_ones_written(self):
+        first, _, foreign = self.tasks
+        response = self.bulk(
+            create=[
+                {"due_date": "2026-02-01"},
+                {
+                    "title": "Outsider",
+                    "due_date": "2026-02-01",
+                    "reviewer_id": self.outsider.pk,
+                },
+                {"title": "Valid", "due_date": "2026-02-01"},
+            ],
+            update=[
+                {"id": [first.pk], "title": "List"},
+                {"id": {"pk": first.pk}, "title": "Dict"},
+                {"title": "Missing"},
+                {"id": foreign.pk, "title": "Foreign"},
+                {"id": first.pk, "status": "unknown"},
+                {"id": first.pk, "title": "Renamed"},
+            ],
+        )
+
+        self.assertEqual(response.status_code, 200)
+        created, updated = (
+            response.json()["created"],
+            response.json()["updated"],
+        )
+        self.assertEqual(
+            [sorted(result.get("errors", {})) for result in created],
+            [["title"], ["reviewer_id"], []],
+        )
+        self.assertEqual(
+            [sorted(result.get("errors", {})) for result in updated],
+            [["id"], ["id"], ["id"], ["id"], ["status"], []],
+        )
+        self.assertTrue(Task.objects.filter(title="Valid").exists())
+        first.refresh_from_db()
+        self.assertEqual(first.title, "Renamed")
+        self.assertEqual(Task.objects.get(pk=foreign.pk).title, "Task 2")
+
+    def test_requires_board_membership(self):
+        self.client.force_authenticate(user=self.outsider.user)
+        response = self.bulk(update=[{"id": self.tasks[0].pk, "title": "X"}])
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(Task.objects.get(pk=self.tasks[0].pk).title, "Task 0")
+
+    @override_settings(TASK_BULK_MAX_ITEMS=2)
+    def test_rejects_requests_over_the_item_limit(self):
+        response = self.bulk(
+            create=[{"title": "New", "due_date": "2026-02-01"}] * 2,
+            update=[{"id": self.tasks[0].pk, "title": "X"}],
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Task.objects.filter(title="New").exists())
+
+
+class TaskPaginationTests(TestCase):
+    """
+    Verify that keyset pages of a task list can be followed in both
+    directions and that malformed cursors are rejected with 404.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = create_profile("owner@example.com", "Owner Example")
+        board = Board.objects.create(owner=cls.owner, title="Board")
+        board.members.add(cls.owner)
+        cls.task_ids = [
+            Task.objects.create(
+                board=board,
+                creator=cls.owner,
+                assignee=cls.owner,
+                title=f"Task {index}",
+                due_date=datetime.date(2026, 1, 1 + index // 2),
+            ).pk
+            for index in range(5)
+        ]
+        cls.token = Token.objects.create(user=cls.owner.user)
+
+    def setUp(self):
+        board_access.clear()
+        # The async views authenticate requests themselves.
+        self.client = APIClient(
+            headers={"Authorization": f"Token {self.token.key}"}
+        )
+
+    def get_page(self, path):
+        response = self.client.get(path)
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        return body, [task["id"] for task in body["results"]]
+
+    def test_traverses_pages_in_both_directions(self):
+        for path in (
+            "/api/tasks/assigned-to-me/?page_size=2",
+            "/api/async/tasks/assigned-to-me/?page_size=2",
+        ):
+            with self.subTest(path=path):
+                pages = []
+                body = {"next": path}
+                while body["next"]:
+                    body, ids = self.get_page(body["next"])
+                    pages.append(ids)
+                self.assertEqual(
+                    pages,
+                    [self.task_ids[:2], self.task_ids[2:4], self.task_ids[4:]],
+                )
+
+                backwards = [pages[-1]]
+                while body["previous"]:
+                    body, ids = self.get_page(body["previous"])
+                    backwards.append(ids)
+                self.assertEqual(backwards, pages[::-1])
+
+    def test_rejects_invalid_cursors(self):
+        def encode(payload):
+            return base64.urlsafe_b64encode(
+                json.dumps(payload).encode()
+            ).decode()
+
+        for cursor in (
+            encode({"v": ["2026-01-01", None]}),
+            encode({"v": [None, 1]}),
+            encode({"v": [["2026-01-01"], 1]}),
+            encode({"v": ["2026-01-01", {"id": 1}]}),
+            encode({"v": "2026-01-01"}),
+            encode({"v": ["2026-01-01"]}),
+            encode({"v": ["", 1]}),
+            encode(["2026-01-01", 1]),
+            "not-a-cursor",
+        ):
+            with self.subTest(cursor=cursor):
+                response = self.client.get(
+                    "/api/tasks/assigned-to-me/", {"cursor": cursor}
+                )
+                self.assertEqual(response.status_code, 404)